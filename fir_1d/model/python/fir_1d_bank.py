@@ -0,0 +1,93 @@
+# File: fir_1d_bank.py
+# Role: 여러 계수 세트를 한 번의 입력 순회로 평가하는 filter-bank 엔진을 제공한다.
+from collections.abc import Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_ref import _prepare_x_2d, get_ideal_plan
+from .fir_1d_fixed_ref import _fixed_postprocess, get_fixed_plan
+
+
+# 모든 커널이 참조하는 shift(= center - k) 집합
+# 3탭(center=1)과 5탭(center=2) 커널 8개는 shift {-2, -1, 0, 1, 2} 5개로 모두 표현된다.
+def _bank_shifts(tap_counts: Sequence[int]) -> list[int]:
+    shifts: set[int] = set()
+    for L in tap_counts:
+        center = L // 2
+        shifts.update(center - k for k in range(L))
+    return sorted(shifts)
+
+
+# zero-padding 행렬을 1회 만들고 shift별 입력 뷰(복사 없음)를 돌려준다
+# view[s][:, n] = x[:, n + s] (범위 밖은 0)
+def _shifted_views(x: np.ndarray, shifts: Sequence[int], dtype) -> dict[int, np.ndarray]:
+    height, width = x.shape
+    pad = max(abs(s) for s in shifts)
+    x_pad = np.zeros((height, width + 2 * pad), dtype=dtype)
+    x_pad[:, pad : pad + width] = x
+    return {s: x_pad[:, pad + s : pad + s + width] for s in shifts}
+
+
+# 공유 뷰 위에서 커널 1개의 MAC을 탭 순서대로 acc(0 초기화 상태)에 누산
+# padding 위치는 0을 더하므로 정수는 물론 float에서도 루프 모델과 같은 값이 된다
+# (acc는 +0.0에서 시작하므로 ±0.0 가산이 결과를 바꾸지 않는다).
+def _bank_mac(views: dict[int, np.ndarray], taps: np.ndarray, acc: np.ndarray, tmp: np.ndarray) -> np.ndarray:
+    center = len(taps) // 2
+    for k in range(len(taps)):
+        np.multiply(taps[k], views[center - k], out=tmp)
+        acc += tmp
+    return acc
+
+
+def fir_1d_ideal_bank(x_u8, h_list: Sequence[Sequence[float]]) -> npt.NDArray[np.float64]:
+    """
+    여러 계수 세트를 하나의 H x W 입력에 대해 한 번에 평가한다.
+
+    Args:
+        x_u8: H x W 입력 행렬
+        h_list: 계수 세트 F개 (탭 수가 달라도 됨)
+
+    Returns:
+        y: H x W x F float64 배열. y[:, :, f] == fir_1d_ideal_2d(x_u8, h_list[f])
+    """
+    plans = [get_ideal_plan(h) for h in h_list]
+    x = _prepare_x_2d(x_u8)
+    views = _shifted_views(x, _bank_shifts([len(p.taps) for p in plans]), np.float64)
+
+    # 필터 축을 앞에 두고 계산해 필터별 평면이 연속 메모리가 되도록 한 뒤 H x W x F 뷰로 반환
+    y = np.zeros((len(plans),) + x.shape, dtype=np.float64)
+    tmp = np.empty(x.shape, dtype=np.float64)
+    for f, plan in enumerate(plans):
+        _bank_mac(views, plan.taps, y[f], tmp)
+    return np.moveaxis(y, 0, -1)
+
+
+def fir_1d_fixed_bank(
+    x_u8,
+    h_list: Sequence[Sequence[float]],
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+) -> npt.NDArray[np.uint8]:
+    """
+    여러 계수 세트를 하나의 H x W 입력에 대해 한 번에 고정소수점 평가한다.
+
+    Returns:
+        y: H x W x F uint8 배열. y[:, :, f] == fir_1d_fixed_golden_2d(x_u8, h_list[f], ...)
+    """
+    plans = [get_fixed_plan(h, frac_bits, acc_bits, coeff_bits) for h in h_list]
+    x = _prepare_x_2d(x_u8).astype(np.uint8, copy=False)
+    views = _shifted_views(x, _bank_shifts([len(p.h_fixed) for p in plans]), np.int64)
+
+    y = np.empty((len(plans),) + x.shape, dtype=np.uint8)
+    acc = np.empty(x.shape, dtype=np.int64)
+    tmp = np.empty(x.shape, dtype=np.int64)
+    for f, plan in enumerate(plans):
+        if not plan._int64_safe:
+            y[f] = plan._apply_u8(x)  # 참조 루프 fallback
+            continue
+        acc.fill(0)
+        _bank_mac(views, plan._taps_i64, acc, tmp)
+        y[f] = _fixed_postprocess(acc, frac_bits, acc_bits)
+    return np.moveaxis(y, 0, -1)
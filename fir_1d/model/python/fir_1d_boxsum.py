@@ -0,0 +1,32 @@
+# File: fir_1d_boxsum.py
+# Role: 동일 계수(box) 커널을 행 방향 누적합(prefix sum)으로 탭 수와 무관하게 평가한다.
+from collections.abc import Sequence
+
+import numpy as np
+
+# auto 모드에서 direct 대신 누적합을 쓰기 시작하는 탭 수 (그 이하는 direct가 비슷하거나 빠름)
+BOXSUM_MIN_TAPS = 5
+
+
+# 모든 계수가 같은 2탭 이상 커널인지 판정 (ideal은 실수 h, fixed는 양자화된 h_fixed 기준)
+def is_box_kernel(taps: Sequence[float]) -> bool:
+    return len(taps) >= 2 and all(c == taps[0] for c in taps)
+
+
+def _box_window_sum(x: np.ndarray, num_taps: int) -> np.ndarray:
+    """
+    same-mode 창 합: win[n] = sum_{k=0}^{L-1} x[n - k + center] (범위 밖은 0, 마지막 축 = 샘플 축)
+
+    x는 0~255 정수값 배열. int64 누적합으로 계산하므로 값은 정확하며,
+    샘플당 비용은 탭 수와 무관하다 (누적합 1회 + 차분 1회).
+    """
+    width = x.shape[-1]
+    center = num_taps // 2
+    left = num_taps - 1 - center  # 창 시작 = n - (L-1-center)
+
+    # prefix[i] = sum(x_pad[:i]), x_pad = [0]*left + x + [0]*center
+    prefix = np.zeros(x.shape[:-1] + (width + num_taps,), dtype=np.int64)
+    np.cumsum(x, axis=-1, dtype=np.int64, out=prefix[..., left + 1 : left + 1 + width])
+    if center > 0:
+        prefix[..., left + 1 + width :] = prefix[..., left + width : left + width + 1]
+    return prefix[..., num_taps : num_taps + width] - prefix[..., :width]
@@ -0,0 +1,185 @@
+# File: fir_1d_cascade.py
+# Role: 연속 적용되는 커널(예: simple_lp -> sharpen)의 ideal 커널 합성과 fixed 다단 에뮬레이션을 제공한다.
+from collections.abc import Sequence
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_fft import _fft_same_mode, select_ideal_method
+from .fir_1d_ref import (
+    _prepare_x_2d,
+    _preprocess_x_fast,
+    _preprocess_x_u8,
+    _same_mode_mac,
+    fir_1d_ideal_2d,
+    get_ideal_plan,
+)
+from .fir_1d_fixed_ref import fir_1d_fixed_golden_2d, get_fixed_plan
+
+# fixed 다단 에뮬레이션에서 한 번에 처리하는 행 수 (단계 간 중간값은 이 블록 크기만 유지)
+CASCADE_BLOCK_ROWS = 64
+
+
+def _validate_h_list(h_list: Sequence[Sequence[float]]) -> None:
+    if len(h_list) == 0:
+        raise ValueError("Invalid h_list: cascade must contain at least one tap set.")
+
+
+def fuse_kernels(h_list: Sequence[Sequence[float]]) -> list[float]:
+    """
+    same-mode 커널 열을 하나의 same-mode 커널로 합성한다.
+
+    y_i[n] = sum_k h_i[k] y_{i-1}[n - k + c_i] 를 경계 절단 없이 합성하면
+    g = h_1 * h_2 * ... (선형 컨볼루션), 중심 오프셋 C = sum(c_i) 가 된다.
+    짝수 탭이 섞이면 C != len(g)//2 일 수 있으므로 양끝에 0 계수를 붙여 중심을 맞춘다.
+    """
+    _validate_h_list(h_list)
+    fused = np.array([1.0])
+    offset = 0
+    for h in h_list:
+        fused = np.convolve(fused, np.asarray(h, dtype=np.float64))
+        offset += len(h) // 2
+
+    # same-mode 중심(len//2)이 offset과 일치하도록 최소 길이의 0 padding 탐색
+    L = len(fused)
+    for total in range(L, 2 * L + 2):
+        for left in range(total - L + 1):
+            if total // 2 == left + offset:
+                right = total - L - left
+                return [0.0] * left + fused.tolist() + [0.0] * right
+    raise AssertionError("unreachable: zero padding always aligns the center")
+
+
+def fir_1d_ideal_cascade(x, h_list: Sequence[Sequence[float]]) -> npt.NDArray[np.float64]:
+    """
+    ideal 모델 cascade: 합성 커널 1회 적용 (중간 이미지 없음)
+
+    결과는 각 단계를 중간값 반올림/clamp/경계 절단 없이 연속 적용한 선형 합성과 같다.
+    fir_1d_ideal_2d를 단계별로 연결하면 중간 출력이 다시 입력 전처리(round-half-up,
+    0~255 clamp)되고 행 경계에서 잘리므로, 그 방식과는 경계 부근/포화 구간에서 다르다.
+
+    단계별 계수는 ideal 규칙으로 검증하지만, 합성 커널은 |h| 상한(MAX_ABS_H_COEFF)을
+    넘을 수 있으므로(예: sharpen 2회) 검증 없이 탭 수/폭 기준 direct/fft로 실행한다.
+
+    Args:
+        x: 1D 행 또는 H x W 행렬
+        h_list: 적용 순서대로의 계수 세트 목록
+    """
+    _validate_h_list(h_list)
+    for h in h_list:
+        get_ideal_plan(h)  # 단계별 계수 검증 (plan 캐시 재사용)
+    taps = np.asarray(fuse_kernels(h_list), dtype=np.float64)
+
+    x_arr = np.asarray(x)
+    if x_arr.ndim == 1:
+        x_f64 = _preprocess_x_fast(x_arr).astype(np.float64, copy=False)
+    else:
+        x_f64 = _prepare_x_2d(x_arr).astype(np.float64, copy=False)
+    if select_ideal_method(len(taps), x_f64.shape[-1]) == "fft":
+        return _fft_same_mode(x_f64, taps)
+    return _same_mode_mac(x_f64, taps, np.float64)
+
+
+def fir_1d_fixed_cascade(
+    x_u8,
+    h_list: Sequence[Sequence[float]],
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    *,
+    block_rows: int = CASCADE_BLOCK_ROWS,
+) -> npt.NDArray[np.uint8]:
+    """
+    fixed golden 모델 cascade: 단계별 양자화/누산 wrap/0~255 포화를 그대로 에뮬레이션
+
+    결과는 fir_1d_fixed_golden_2d를 단계마다 연결한 것과 bit-exact 하다.
+    행 블록(block_rows) 단위로 모든 단계를 끝까지 수행하므로 단계 간 중간값은
+    블록 크기(block_rows x W uint8)만 유지되고 전체 중간 이미지는 만들지 않는다.
+
+    Returns:
+        y_out: 입력과 같은 shape의 uint8 배열 (0 ~ 255)
+    """
+    _validate_h_list(h_list)
+    if block_rows < 1:
+        raise ValueError(f"Invalid block_rows={block_rows}. block_rows must be >= 1.")
+    plans = [get_fixed_plan(h, frac_bits, acc_bits, coeff_bits) for h in h_list]
+
+    if np.ndim(x_u8) == 1:
+        x = _preprocess_x_u8(x_u8)[np.newaxis, :]
+    else:
+        x = _prepare_x_2d(x_u8).astype(np.uint8, copy=False)
+
+    y = np.empty(x.shape, dtype=np.uint8)
+    for r0 in range(0, x.shape[0], block_rows):
+        block = x[r0 : r0 + block_rows]
+        for plan in plans:
+            block = plan._apply_u8(block)
+        y[r0 : r0 + block_rows] = block
+    return y[0] if np.ndim(x_u8) == 1 else y
+
+
+def measure_cascade_speedup(
+    x_u8,
+    h_list: Sequence[Sequence[float]],
+    *,
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    repeat: int = 3,
+) -> dict[str, Any]:
+    """
+    단계별 연결 실행 대비 cascade API의 처리량 향상을 측정한다.
+
+    Returns:
+        {"stages", "fused_taps", "pixels",
+         "ideal": {"sequential_s", "cascade_s", "speedup", "mpix_per_s"},
+         "fixed": {"sequential_s", "cascade_s", "speedup", "mpix_per_s"}}
+        mpix_per_s는 cascade 경로의 초당 처리 픽셀 수(백만)
+    """
+    x = _prepare_x_2d(x_u8)
+
+    def _best(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = perf_counter()
+            fn()
+            best = min(best, perf_counter() - t0)
+        return best
+
+    def _seq_ideal():
+        y = x
+        for h in h_list:
+            y = fir_1d_ideal_2d(y, h)
+        return y
+
+    def _seq_fixed():
+        y = x
+        for h in h_list:
+            y = fir_1d_fixed_golden_2d(y, h, frac_bits, acc_bits, coeff_bits)
+        return y
+
+    pixels = int(x.size)
+    report: dict[str, Any] = {
+        "stages": len(h_list),
+        "fused_taps": len(fuse_kernels(h_list)),
+        "pixels": pixels,
+    }
+    for name, seq_fn, cascade_fn in (
+        ("ideal", _seq_ideal, lambda: fir_1d_ideal_cascade(x, h_list)),
+        (
+            "fixed",
+            _seq_fixed,
+            lambda: fir_1d_fixed_cascade(x, h_list, frac_bits, acc_bits, coeff_bits),
+        ),
+    ):
+        sequential_s = _best(seq_fn)
+        cascade_s = _best(cascade_fn)
+        report[name] = {
+            "sequential_s": sequential_s,
+            "cascade_s": cascade_s,
+            "speedup": sequential_s / cascade_s,
+            "mpix_per_s": pixels / cascade_s / 1e6,
+        }
+    return report
@@ -0,0 +1,96 @@
+# File: fir_1d_csd.py
+# Role: 양자화 계수의 CSD(canonical signed digit) 분해와 곱셈기 없는 shift-add 평가를 제공한다.
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+# (shift, sign): 계수 = sum(sign * 2^shift)
+CsdTerm = tuple[int, int]
+
+
+# 정수 계수 1개를 CSD(NAF)로 분해: 인접한 0이 아닌 자리가 없는 최소 부호 자리 표현
+def csd_digits(value: int) -> list[CsdTerm]:
+    digits: list[CsdTerm] = []
+    v = int(value)
+    shift = 0
+    while v != 0:
+        if v & 1:
+            sign = 2 - (v & 3)  # v % 4 == 1 -> +1, v % 4 == 3 -> -1
+            v -= sign
+            digits.append((shift, sign))
+        v >>= 1
+        shift += 1
+    return digits
+
+
+def csd_decompose(h_fixed: Sequence[int]) -> list[list[CsdTerm]]:
+    return [csd_digits(int(c)) for c in h_fixed]
+
+
+# 필터 1개의 shift-add 하드웨어/소프트웨어 비용
+# adders: 모든 부분곱 항을 하나로 합치는 가산(감산 포함) 수, shifts: 0이 아닌 시프트 수
+def csd_cost(h_fixed: Sequence[int]) -> dict[str, Any]:
+    terms = csd_decompose(h_fixed)
+    num_digits = sum(len(t) for t in terms)
+    return {
+        "taps": len(terms),
+        "zero_taps": sum(1 for t in terms if not t),
+        "nonzero_digits": num_digits,
+        "adders": max(num_digits - 1, 0),
+        "shifts": sum(1 for t in terms for shift, _ in t if shift > 0),
+        "multipliers_replaced": sum(1 for t in terms if t),
+    }
+
+
+def csd_cost_table(
+    coeff_maps: Mapping[str, Mapping[str, Sequence[float]]],
+    *,
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+) -> dict[str, dict[str, dict[str, Any]]]:
+    """
+    탭 맵별/계수 세트별 CSD 비용 표 (예: {"3tap": h_coeff_3tap_map, "5tap": h_coeff_5tap_map})
+    """
+    from .fir_1d_fixed_ref import get_fixed_plan
+
+    table: dict[str, dict[str, dict[str, Any]]] = {}
+    for tap_label, coeff_map in coeff_maps.items():
+        table[tap_label] = {
+            coeff_name: csd_cost(get_fixed_plan(h, frac_bits, acc_bits, coeff_bits).h_fixed)
+            for coeff_name, h in coeff_map.items()
+        }
+    return table
+
+
+def _csd_mac(x: np.ndarray, csd_terms: Sequence[Sequence[CsdTerm]]) -> np.ndarray:
+    """
+    CSD 항으로 same-mode MAC을 곱셈 없이 계산 (마지막 축 = 샘플 축, int64)
+
+    0 계수 탭은 건너뛰고, 나머지는 (x << shift)의 가감산만 사용한다.
+    정수 연산이므로 곱셈 기반 MAC과 누산 결과가 정확히 같다.
+    """
+    width = x.shape[-1]
+    L = len(csd_terms)
+    center = L // 2
+    acc = np.zeros(x.shape, dtype=np.int64)
+    x_i64 = x.astype(np.int64)
+
+    for k, terms in enumerate(csd_terms):
+        shift = center - k  # input_idx = n + shift
+        if not terms or abs(shift) >= width:
+            continue
+        if shift >= 0:
+            dst = acc[..., : width - shift]
+            src = x_i64[..., shift:]
+        else:
+            dst = acc[..., -shift:]
+            src = x_i64[..., : width + shift]
+        for bit, sign in terms:
+            partial = src << bit if bit else src
+            if sign > 0:
+                dst += partial
+            else:
+                dst -= partial
+    return acc
@@ -0,0 +1,194 @@
+# File: fir_1d_da.py
+# Role: 곱셈 대신 테이블 조회로 누산하는 LUT / 분산 산술(DA, bit-serial) fixed 엔진과 FPGA 구조 모델을 제공한다.
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+# 입력 픽셀 비트 수 (unsigned 8-bit, 부호 비트 평면 없음)
+INPUT_BITS = 8
+
+# DA 테이블 1개가 담당하는 탭 수 (주소 비트, 1~8). FPGA LUT6 기준으로 6탭씩 분할한다.
+DA_ADDR_BITS = 6
+
+
+# 탭별 곱 테이블: lut[k, p] = p * h_fixed[k] (p = 0..255, 0 padding은 lut[k, 0] = 0)
+def product_luts(h_fixed: np.ndarray, dtype=np.int64) -> np.ndarray:
+    pixels = np.arange(1 << INPUT_BITS, dtype=dtype)
+    luts = np.asarray(h_fixed, dtype=dtype)[:, np.newaxis] * pixels[np.newaxis, :]
+    luts.setflags(write=False)
+    return luts
+
+
+# 탭을 addr_bits개씩 묶은 파티션 목록: [(start, stop), ...]
+def _da_partitions(num_taps: int, addr_bits: int) -> list[tuple[int, int]]:
+    return [(s, min(s + addr_bits, num_taps)) for s in range(0, num_taps, addr_bits)]
+
+
+def da_tables(h_fixed: np.ndarray, addr_bits: int = DA_ADDR_BITS, dtype=np.int64) -> list[np.ndarray]:
+    """
+    파티션별 DA 테이블: table[addr] = sum_j h_fixed[start + j] * bit_j(addr)
+
+    한 비트 평면에서 파티션 탭들의 입력 비트를 주소로 모으면, 그 평면의 부분합은
+    테이블 1회 조회가 된다. 테이블 크기는 2^(파티션 탭 수).
+    """
+    if not 1 <= addr_bits <= 8:
+        raise ValueError(f"Invalid addr_bits={addr_bits}. addr_bits must be in [1, 8].")
+    taps = [int(c) for c in h_fixed]
+    tables = []
+    for start, stop in _da_partitions(len(taps), addr_bits):
+        n = stop - start
+        addr = np.arange(1 << n)
+        table = np.zeros(1 << n, dtype=dtype)
+        for j in range(n):
+            table += ((addr >> j) & 1).astype(dtype) * taps[start + j]
+        table.setflags(write=False)
+        tables.append(table)
+    return tables
+
+
+# zero-padding 된 uint8 입력과 탭 k의 입력 뷰: view_k[..., n] = x[..., n - k + center]
+def _tap_views(x: np.ndarray, num_taps: int) -> list[np.ndarray]:
+    width = x.shape[-1]
+    center = num_taps // 2
+    pad = max(center, num_taps - 1 - center)
+    x_pad = np.zeros(x.shape[:-1] + (width + 2 * pad,), dtype=np.uint8)
+    x_pad[..., pad : pad + width] = x
+    return [x_pad[..., pad + center - k : pad + center - k + width] for k in range(num_taps)]
+
+
+def _lut_mac(x: np.ndarray, luts: np.ndarray) -> np.ndarray:
+    """
+    곱셈 없는 same-mode MAC: acc[n] = sum_k lut[k][x[n - k + center]] (마지막 축 = 샘플 축)
+
+    정수 테이블 값은 곱셈 결과와 같으므로 누산값이 direct 엔진과 정확히 같다.
+    """
+    acc = np.zeros(x.shape, dtype=luts.dtype)
+    for k, view in enumerate(_tap_views(x, luts.shape[0])):
+        acc += luts[k][view]
+    return acc
+
+
+def _da_mac(
+    x: np.ndarray,
+    tables: list[np.ndarray],
+    num_taps: int,
+    addr_bits: int = DA_ADDR_BITS,
+) -> np.ndarray:
+    """
+    bit-serial 분산 산술 MAC (마지막 축 = 샘플 축)
+
+    acc[n] = sum_b 2^b * sum_p table_p[addr_{p,b}[n]]
+    addr_{p,b}[n] = sum_j bit_b(x[n - k_j + center]) << j  (k_j: 파티션 p의 j번째 탭)
+    입력은 unsigned이므로 MSB 평면도 가산한다 (부호 입력이면 MSB 평면을 감산).
+    비트 평면 축(8)을 앞에 두어 평면별 계산을 한 번에 벡터화한다.
+    """
+    dtype = tables[0].dtype
+    views = _tap_views(x, num_taps)
+    shifts = np.arange(INPUT_BITS, dtype=np.uint8).reshape((INPUT_BITS,) + (1,) * x.ndim)
+
+    acc_planes = np.zeros((INPUT_BITS,) + x.shape, dtype=dtype)
+    for p, (start, stop) in enumerate(_da_partitions(num_taps, addr_bits)):
+        addr = np.zeros((INPUT_BITS,) + x.shape, dtype=np.uint8)  # 주소 <= addr_bits(<= 8) 비트
+        for j, k in enumerate(range(start, stop)):
+            addr |= ((views[k] >> shifts) & 1) << j
+        acc_planes += tables[p][addr]
+
+    # shift-accumulator: 평면 b의 부분합을 2^b 가중으로 합산
+    acc = acc_planes[0].copy()
+    for b in range(1, INPUT_BITS):
+        acc += acc_planes[b] << b
+    return acc
+
+
+def da_structure(
+    h_fixed: np.ndarray,
+    *,
+    addr_bits: int = DA_ADDR_BITS,
+    acc_bits: int = 32,
+) -> dict[str, Any]:
+    """
+    FPGA bit-serial DA 구현의 구조 모델 (필터 1개, 출력 1개당)
+
+    - 파티션마다 2^n x word_bits ROM/LUT 1개, 입력 비트 평면마다 1회 조회
+    - 파티션 출력은 가산 트리(partitions - 1 adders)로 합치고
+      shift-accumulator(adder 1개)가 INPUT_BITS 사이클 동안 2^b 가중 누산
+    - 곱셈기 0개, 출력 1개당 INPUT_BITS 사이클 (비트 병렬화 시 사이클/면적 교환)
+
+    Returns:
+        {"taps", "addr_bits", "partitions": [{"taps", "entries", "word_bits"}...],
+         "lut_entries", "lut_bits", "adders", "multipliers", "cycles_per_output",
+         "acc_bits"}
+    """
+    from .fir_1d_range import required_acc_bits
+
+    tables = da_tables(h_fixed, addr_bits)
+    partitions = []
+    for table in tables:
+        lo, hi = int(table.min()), int(table.max())
+        partitions.append(
+            {
+                "taps": int(table.size).bit_length() - 1,
+                "entries": int(table.size),
+                "word_bits": required_acc_bits(lo, hi),
+            }
+        )
+    return {
+        "taps": len(h_fixed),
+        "addr_bits": addr_bits,
+        "partitions": partitions,
+        "lut_entries": sum(p["entries"] for p in partitions),
+        "lut_bits": sum(p["entries"] * p["word_bits"] for p in partitions),
+        "adders": max(len(partitions) - 1, 0) + 1,
+        "multipliers": 0,
+        "cycles_per_output": INPUT_BITS,
+        "acc_bits": acc_bits,
+    }
+
+
+def measure_da_speedup(
+    *,
+    width: int = 1024,
+    rows: int = 256,
+    h_list: tuple[tuple[float, ...], ...] = (
+        (0.25, 0.5, 0.25),
+        (-1 / 16, -4 / 16, 26 / 16, -4 / 16, -1 / 16),
+    ),
+    repeat: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    vectorized multiply(direct) 엔진 대비 LUT / DA 엔진 실행 시간을 측정한다.
+
+    Returns:
+        {"width", "rows", "timings": [{"num_taps", "direct_s", "lut_s", "da_s",
+         "lut_speedup", "da_speedup"}...]}
+    """
+    from .fir_1d_fixed_ref import get_fixed_plan
+
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 256, size=(rows, width), dtype=np.uint8)
+
+    def _best(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = perf_counter()
+            fn()
+            best = min(best, perf_counter() - t0)
+        return best
+
+    timings = []
+    for h in h_list:
+        plan = get_fixed_plan(list(h))
+        times = {m: _best(lambda: plan.apply_batch(x, method=m)) for m in ("direct", "lut", "da")}
+        timings.append(
+            {
+                "num_taps": len(h),
+                "direct_s": times["direct"],
+                "lut_s": times["lut"],
+                "da_s": times["da"],
+                "lut_speedup": times["direct"] / times["lut"],
+                "da_speedup": times["direct"] / times["da"],
+            }
+        )
+    return {"width": width, "rows": rows, "timings": timings}
@@ -0,0 +1,48 @@
+# File: fir_1d_dyadic.py
+# Role: 계수가 dyadic 유리수(m / 2^e)일 때 ideal 출력을 정수 누산 + 1회 스케일로 정확히 계산한다.
+from collections.abc import Sequence
+
+import numpy as np
+
+# 분모 2^e의 허용 상한. 1/3 같은 계수는 double로 2^-54 단위가 되어 여기서 걸러진다.
+DYADIC_MAX_FRAC_BITS = 32
+
+# 최종 float 변환이 정확하려면 |acc| < 2^53 이어야 한다.
+_FLOAT_EXACT_LIMIT = 1 << 53
+_INT32_LIMIT = 1 << 31
+_MAX_PIXEL = 255
+
+
+def dyadic_decompose(h: Sequence[float]) -> tuple[np.ndarray, int] | None:
+    """
+    h를 공통 분모 2^frac_bits의 정수 계수로 분해한다.
+
+    Returns:
+        (m, frac_bits): h[k] == m[k] / 2^frac_bits (정확히) 인 int64 배열과 지수.
+        분모가 DYADIC_MAX_FRAC_BITS를 넘거나 0~255 입력에서 결과가 float로 정확히
+        표현되지 않으면 None (float 경로로 fallback).
+    """
+    ratios = [float(c).as_integer_ratio() for c in h]
+    frac_bits = max(den.bit_length() - 1 for _, den in ratios)
+    if frac_bits > DYADIC_MAX_FRAC_BITS:
+        return None
+
+    m = [num << (frac_bits - (den.bit_length() - 1)) for num, den in ratios]
+    if _MAX_PIXEL * sum(abs(v) for v in m) >= _FLOAT_EXACT_LIMIT:
+        return None
+    return np.array(m, dtype=np.int64), frac_bits
+
+
+def _dyadic_mac(x: np.ndarray, m: np.ndarray, frac_bits: int) -> np.ndarray:
+    """
+    정수 same-mode MAC 후 2^-frac_bits 스케일 1회 (마지막 축 = 샘플 축)
+
+    x는 전처리된 0~255 정수값 배열. 누산 범위가 허용하면 int32로 계산해 대역폭을 줄인다.
+    결과는 실수 연산의 정확한 값이며 float64로 반올림 없이 표현된다.
+    """
+    from .fir_1d_ref import _same_mode_mac
+
+    worst = _MAX_PIXEL * int(np.abs(m).sum())
+    acc_dtype = np.int32 if worst < _INT32_LIMIT else np.int64
+    acc = _same_mode_mac(x.astype(acc_dtype), m.astype(acc_dtype), acc_dtype)
+    return acc.astype(np.float64) * (1.0 / (1 << frac_bits))
@@ -0,0 +1,136 @@
+# File: fir_1d_fft.py
+# Role: 긴 커널용 overlap-add FFT ideal 엔진과 direct/FFT 자동 선택 규칙을 제공한다.
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+# direct(탭 단위 벡터화) 대비 FFT가 빨라지는 탭 수 / 행 폭 하한
+# measure_fft_crossover()로 측정한 값 (64~4096 폭, 64행 배치에서 15~23탭 부근)
+FFT_CROSSOVER_TAPS = 23
+FFT_MIN_WIDTH = 64
+
+# 생성기에서 허용하는 direct 대비 최대 절대 편차 (0~255 입력 기준)
+FFT_MAX_ABS_DEV_TOL = 1e-6
+
+
+def _next_pow2(n: int) -> int:
+    return 1 << max(n - 1, 0).bit_length()
+
+
+# FFT 길이: 블록 효율을 위해 커널의 4배 이상, 행 전체 선형 컨볼루션 길이 이하
+# overlap-add 꼬리(L-1)가 다음 블록 하나에만 겹치도록 nfft >= 2L-1을 보장한다.
+def _ola_nfft(num_taps: int, width: int) -> int:
+    nfft = min(_next_pow2(max(4 * num_taps, 64)), _next_pow2(width + num_taps - 1))
+    return max(nfft, _next_pow2(2 * num_taps - 1))
+
+
+# same-mode(center = L//2, zero-padding) FIR을 overlap-add FFT로 계산 (마지막 축 = 샘플 축)
+# full 컨볼루션 y_full[m] = sum_k h[k] x[m-k] 에서 y[n] = y_full[n + center]
+def _fft_same_mode(x: np.ndarray, taps: np.ndarray) -> np.ndarray:
+    lead = x.shape[:-1]
+    width = x.shape[-1]
+    L = len(taps)
+    center = L // 2
+    if width == 0:
+        return np.zeros(x.shape, dtype=np.float64)
+
+    nfft = _ola_nfft(L, width)
+    block = nfft - L + 1
+    nblocks = -(-width // block)
+
+    x_pad = np.zeros(lead + (nblocks * block,), dtype=np.float64)
+    x_pad[..., :width] = x
+    segs = x_pad.reshape(lead + (nblocks, block))
+
+    h_f = np.fft.rfft(taps, nfft)
+    seg_out = np.fft.irfft(np.fft.rfft(segs, nfft, axis=-1) * h_f, nfft, axis=-1)
+
+    # 블록 j 출력은 y_full[j*block : j*block + block + L - 1]에 더해진다 (꼬리는 다음 블록과 겹침)
+    y_full = np.zeros(lead + (nblocks + 1, block), dtype=np.float64)
+    y_full[..., :nblocks, :] += seg_out[..., :block]
+    if L > 1:
+        y_full[..., 1:, : L - 1] += seg_out[..., block : block + L - 1]
+    y_full = y_full.reshape(lead + ((nblocks + 1) * block,))
+    return y_full[..., center : center + width].copy()
+
+
+# 탭 수/행 폭으로 ideal 엔진을 선택한다 (auto 모드)
+def select_ideal_method(num_taps: int, width: int) -> str:
+    if num_taps >= FFT_CROSSOVER_TAPS and width >= FFT_MIN_WIDTH:
+        return "fft"
+    return "direct"
+
+
+def fft_deviation_report(
+    x: np.ndarray,
+    taps: np.ndarray,
+    y_fft: np.ndarray,
+    *,
+    max_rows: int = 8,
+) -> dict[str, Any]:
+    """
+    FFT 결과를 direct 경로와 비교한 편차 리포트 (행 샘플링)
+
+    x/y_fft의 마지막 축을 샘플 축으로 보고, 처음/중간/끝을 포함해 최대 max_rows개 행만
+    direct로 재계산해 비교한다 (전체 재계산 비용 회피).
+    """
+    from .fir_1d_ref import _same_mode_mac
+
+    x_rows = np.asarray(x, dtype=np.float64).reshape(-1, x.shape[-1])
+    y_rows = np.asarray(y_fft, dtype=np.float64).reshape(-1, x.shape[-1])
+    num_rows = x_rows.shape[0]
+    row_idx = np.unique(np.linspace(0, num_rows - 1, num=min(max_rows, num_rows)).astype(int))
+
+    y_direct = _same_mode_mac(x_rows[row_idx], taps, np.float64)
+    abs_dev = np.abs(y_rows[row_idx] - y_direct)
+    max_abs_dev = float(abs_dev.max()) if abs_dev.size else 0.0
+    return {
+        "method": "fft",
+        "num_taps": int(len(taps)),
+        "nfft": _ola_nfft(len(taps), x.shape[-1]),
+        "checked_rows": int(len(row_idx)),
+        "max_abs_dev": max_abs_dev,
+        "within_tol": max_abs_dev <= FFT_MAX_ABS_DEV_TOL,
+    }
+
+
+def measure_fft_crossover(
+    *,
+    width: int = 1024,
+    rows: int = 64,
+    taps_grid: tuple[int, ...] = (3, 5, 9, 15, 23, 31, 47, 63, 95, 127),
+    repeat: int = 3,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    direct vs FFT 실행 시간을 탭 수별로 측정해 crossover 탭 수를 찾는다.
+
+    Returns:
+        {"width", "rows", "timings": [{"num_taps", "direct_s", "fft_s"}...],
+         "crossover_taps": FFT가 처음으로 빨라진 탭 수 (없으면 None)}
+    """
+    from .fir_1d_ref import _same_mode_mac
+
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 256, size=(rows, width)).astype(np.float64)
+
+    def _best(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = perf_counter()
+            fn()
+            best = min(best, perf_counter() - t0)
+        return best
+
+    timings = []
+    crossover = None
+    for L in taps_grid:
+        taps = rng.uniform(-1.0, 1.0, size=L)
+        direct_s = _best(lambda: _same_mode_mac(x, taps, np.float64))
+        fft_s = _best(lambda: _fft_same_mode(x, taps))
+        timings.append({"num_taps": int(L), "direct_s": direct_s, "fft_s": fft_s})
+        if crossover is None and fft_s < direct_s:
+            crossover = int(L)
+
+    return {"width": width, "rows": rows, "timings": timings, "crossover_taps": crossover}
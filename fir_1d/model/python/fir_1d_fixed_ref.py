@@ -3,39 +3,34 @@
 import numpy as np
 import numpy.typing as npt
 import math
-from .fir_1d_ref import _validate_h_coefficients, _validate_x, _round_half_up_x, _clamp_x
+from functools import lru_cache
+from .fir_1d_ref import (
+    _validate_h_coefficients,
+    _same_mode_mac,
+    _prepare_x_2d,
+    _preprocess_x_u8,
+    PLAN_CACHE_SIZE,
+)
+from .fir_1d_fold import _folded_mac, analyze_symmetry
+from .fir_1d_csd import _csd_mac, csd_decompose
+from .fir_1d_boxsum import _box_window_sum, is_box_kernel
+from .fir_1d_range import analyze_acc_range
+from .fir_1d_da import _da_mac, _lut_mac, da_tables, product_luts
 MAX_ABS_H_COEFF = 8.0
 
+# direct: NumPy int64 벡터화 엔진 / loop: 샘플·탭 이중 루프 참조 구현
+# folded: 대칭/반대칭 h_fixed에 pre-adder 적용 (비대칭이면 direct와 동일 경로)
+# csd: 0 탭 생략 + CSD shift-add (곱셈기 없음)
+# boxsum: 동일 h_fixed 커널의 int64 누적합 창 합 x 계수 (box가 아니면 direct와 동일 경로)
+# lut: 탭별 256 엔트리 곱 테이블 조회 / da: 비트 평면 주소 DA 테이블 조회 (둘 다 곱셈 없음)
+FIXED_METHODS = ("direct", "loop", "folded", "csd", "boxsum", "lut", "da")
 
+MAX_PIXEL = 255
+MIN_PIXEL = 0
 
 
-def fir_1d_fixed_golden(
-    x ,           
-    h ,
-    frac_bits: int = 12,
-    acc_bits: int = 32,
-    coeff_bits: int = 16
-) -> npt.NDArray[np.uint8]:
-    """
-    범용 1D FIR 필터 하드웨어 동작 시뮬레이션 모델
-    
-    Args:
-        x: Grayscale 이미지 입력 픽셀 리스트 (0 ~ 255) 범위의 int|float
-        h: 실수형 필터 계수 값 
-        frac_bits: 계수 양자화를 위한 소수점 비트 (기본 12)
-        acc_bits: 누산기 비트 폭 (기본 32)
-        coeff_bits: 계수 비트 폭 (기본 16)
-    
-    Returns:
-        y_out: 하드웨어 출력 값 numpy unit8 배열  (0 ~ 255)
-    """
-    # 입력 값 유효성 검증
-    _validate_h_coefficients(h) # 필터 계수 
-    x_1= _validate_x(x)
-    x_2= _round_half_up_x(x_1)
-    x_sat = _clamp_x(x_2) # 입력 
-
-    # 입력 비트 유효성 검증
+# 비트 파라미터 유효성 검증
+def _validate_bits(frac_bits: int, acc_bits: int, coeff_bits: int) -> None:
     if frac_bits <= 0:
         raise ValueError(f"Invalid frac_bits={frac_bits}. frac_bits must be > 0.")
     if acc_bits <= 0:
@@ -45,12 +40,11 @@ def fir_1d_fixed_golden(
         raise ValueError(
             f"Invalid coeff_bits={coeff_bits}. coeff_bits must be one of {valid_coeff_bits}."
         )
-    
 
-    
+
+# 실수 계수 h -> Q-format 정수 계수 h_fixed (범위 검사 포함)
+def _quantize_h(h, frac_bits: int, coeff_bits: int) -> np.ndarray:
     # 1. Parameter Calculation (하드웨어 제약사항)
-    MAX_PIXEL = 255
-    MIN_PIXEL = 0
     MIN_COEFF = -(1 << (coeff_bits - 1))
     MAX_COEFF = (1 << (coeff_bits - 1)) - 1
     SCALE = (1 << frac_bits)
@@ -71,17 +65,29 @@ def fir_1d_fixed_golden(
                 f"[{MIN_COEFF_REAL}, {MAX_COEFF_REAL}]."
             )
 
-    # 2. 입력/계수를 내부 연산용 배열로 변환
-    x = np.array(x_sat, dtype=np.uint8)
     h = np.array(h, dtype=np.float64)
 
     # 3. h 실수 원소 -> 고정소수점 정수 변환(계수 먼저 양자화)
     h_fixed = np.rint(h * SCALE)                      # 원소별 반올림
     h_fixed = np.clip(h_fixed, MIN_COEFF, MAX_COEFF)  # 범위 제한
     h_fixed = h_fixed.astype(dtype)                   # 정수형으로 타입 변환
-    
+    return h_fixed
+
+
+# int64 누산으로 오버플로 없이 계산 가능한지 판정 (|acc| 최악값 기준)
+def _fits_int64_acc(h_fixed: np.ndarray) -> bool:
+    worst_abs_acc = MAX_PIXEL * sum(abs(int(c)) for c in h_fixed)
+    return worst_abs_acc < (1 << 63)
+
+
+def _fixed_golden_loop(
+    x: np.ndarray,
+    h_fixed: np.ndarray,
+    frac_bits: int,
+    acc_bits: int,
+) -> npt.NDArray[np.uint8]:
     N = len(x)
-    L = len(h_fixed) # 탭 수 
+    L = len(h_fixed) # 탭 수
     offset = L // 2
     y_out = []
 
@@ -94,7 +100,7 @@ def fir_1d_fixed_golden(
     mask = (1 << acc_bits) - 1
     for n in range(N):
         acc = 0 # Acc Reset
-        
+
         for k in range(L):
             # Zero Padding Check (이미지 경계 처리)
             idx = n - k + offset
@@ -102,29 +108,338 @@ def fir_1d_fixed_golden(
                 pixel = int(x[idx])
             else:
                 pixel = 0
-            
+
             term = pixel * int(h_fixed[k])  # MAC
             acc += term # 누산
-        
+
 
         acc = acc & mask # 비트 마스크로 절삭
 
         # (acc_bits - 1) -> 1000 0000 0000 0000 즉 최상위 부호 비트 판단
         # 결과가 1이면 음수, 0이면 양수인 것
-        if acc & (1 << (acc_bits - 1)): 
+        if acc & (1 << (acc_bits - 1)):
             acc -= (1 << acc_bits)      # 음수 값으로 복원
 
         # 5. Re-scaling & Saturation
         acc += (1 << (frac_bits - 1))
         # 정수 * 고정소수점 계수 -> frac_bits만큼 쉬프트해 복원
-        final_val = acc >> frac_bits 
-        
+        final_val = acc >> frac_bits
+
         # Saturation (0 ~ 255 Clipping)
         if final_val > MAX_PIXEL:
             final_val = MAX_PIXEL
         elif final_val < MIN_PIXEL:
             final_val = MIN_PIXEL
-            
+
         y_out.append(final_val)
 
     return np.array(y_out, dtype=np.uint8)
+
+
+# acc & mask + 부호 복원을 한 번에 수행 (하위 acc_bits 비트 부호 확장)
+# 같은 폭의 부호 없는 정수로 좌측 시프트 후 산술 우측 시프트 -> 2의 보수 재해석과 동일
+# acc는 int16/int32/int64 작업 버퍼 (값이 dtype 범위 안이면 결과는 int64 계산과 같다)
+def _wrap_acc(acc: np.ndarray, acc_bits: int) -> np.ndarray:
+    width = acc.dtype.itemsize * 8
+    if acc_bits >= width:
+        return acc  # dtype 범위의 acc는 마스크/부호 복원 결과가 자기 자신
+    s = width - acc_bits
+    unsigned = np.dtype(f"uint{width}")
+    return (acc.view(unsigned) << s).view(acc.dtype) >> s
+
+
+# (acc + (1 << (frac_bits - 1))) >> frac_bits 를 가산 없이 계산
+# floor((a + 2^(f-1)) / 2^f) = (a >> f) + bit[f-1](a) 이므로 overflow가 없다.
+# dtype 폭 이상의 시프트는 부호 비트만 남으므로 (폭 - 1)로 제한해도 결과가 같다.
+def _round_shift(acc: np.ndarray, frac_bits: int) -> np.ndarray:
+    max_sh = acc.dtype.itemsize * 8 - 1
+    sh = min(frac_bits, max_sh)
+    bsh = min(frac_bits - 1, max_sh)
+    return (acc >> sh) + ((acc >> bsh) & 1)
+
+
+# 행별 계측 카운터 (마지막 축을 행 안의 샘플 축으로 집계)
+# wrap: acc & mask + 부호 복원으로 값이 바뀐 샘플 수
+# sat_low / sat_high: shift 후 0 미만 / 255 초과로 포화된 샘플 수
+# max_abs_acc: wrap 이전 누산값의 최대 |acc|
+ROW_STATS_DTYPE = np.dtype(
+    [
+        ("wrap", np.int32),
+        ("sat_low", np.int32),
+        ("sat_high", np.int32),
+        ("max_abs_acc", np.int64),
+    ]
+)
+
+
+# wrap -> 부호 복원 -> bias -> shift -> 0~255 saturation 후처리 (배열 단위)
+# wrap=False는 정적 범위 분석으로 wrap이 항등임이 증명된 경우에만 사용한다.
+def _fixed_postprocess(
+    acc: np.ndarray,
+    frac_bits: int,
+    acc_bits: int,
+    *,
+    wrap: bool = True,
+) -> np.ndarray:
+    if wrap:
+        acc = _wrap_acc(acc, acc_bits)
+    final_val = _round_shift(acc, frac_bits)
+    return np.clip(final_val, MIN_PIXEL, MAX_PIXEL).astype(np.uint8)
+
+
+# _fixed_postprocess와 같은 결과 + 같은 중간값에서 행별 카운터를 집계
+# wrap이 항등으로 증명된 경우 wrap 카운트는 비교 없이 0
+def _fixed_postprocess_stats(
+    acc: np.ndarray,
+    frac_bits: int,
+    acc_bits: int,
+    *,
+    wrap: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    stats = np.zeros(acc.shape[:-1], dtype=ROW_STATS_DTYPE)
+    wrapped = _wrap_acc(acc, acc_bits) if wrap else acc
+    if wrap:
+        stats["wrap"] = np.count_nonzero(wrapped != acc, axis=-1)
+    if acc.shape[-1] > 0:
+        # |acc| <= 255 * sum(|h_fixed|) < 2^63 이므로 부호 반전에 overflow가 없다
+        stats["max_abs_acc"] = np.maximum(
+            acc.max(axis=-1).astype(np.int64), -acc.min(axis=-1).astype(np.int64)
+        )
+
+    final_val = _round_shift(wrapped, frac_bits)
+    stats["sat_low"] = np.count_nonzero(final_val < MIN_PIXEL, axis=-1)
+    stats["sat_high"] = np.count_nonzero(final_val > MAX_PIXEL, axis=-1)
+    return np.clip(final_val, MIN_PIXEL, MAX_PIXEL).astype(np.uint8), stats
+
+
+class FixedFirPlan:
+    """
+    계수 검증/Q-format 양자화를 1회만 수행하고 재사용하는 fixed 모델 실행 계획
+
+    apply(row): 1D 행 필터링 (fir_1d_fixed_golden과 bit-exact)
+    apply_batch(matrix): H x W 행렬의 모든 행 필터링
+    """
+
+    __slots__ = (
+        "h",
+        "frac_bits",
+        "acc_bits",
+        "coeff_bits",
+        "h_fixed",
+        "fold_info",
+        "csd_terms",
+        "is_box",
+        "range_info",
+        "_work_dtype",
+        "_luts",
+        "_da_tables",
+        "_taps_i64",
+        "_int64_safe",
+    )
+
+    def __init__(
+        self,
+        h,
+        frac_bits: int = 12,
+        acc_bits: int = 32,
+        coeff_bits: int = 16,
+    ) -> None:
+        _validate_h_coefficients(h)
+        _validate_bits(frac_bits, acc_bits, coeff_bits)
+        self.h = tuple(h)
+        self.frac_bits = frac_bits
+        self.acc_bits = acc_bits
+        self.coeff_bits = coeff_bits
+        self.h_fixed = _quantize_h(h, frac_bits, coeff_bits)
+        self.h_fixed.setflags(write=False)  # 캐시로 공유되므로 읽기 전용
+        self.fold_info = analyze_symmetry(self.h_fixed)  # 대칭성/곱셈기 절감 수
+        self.csd_terms = csd_decompose(self.h_fixed)     # 탭별 (shift, sign) 항
+        self.is_box = is_box_kernel(self.h_fixed.tolist())  # 동일 양자화 계수 커널 여부
+        self.range_info = analyze_acc_range(self.h_fixed, acc_bits)  # 누산 범위/wrap 증명
+        self._taps_i64 = self.h_fixed.astype(np.int64)
+        self._int64_safe = _fits_int64_acc(self.h_fixed)
+        # direct 경로 작업 버퍼: 최악 누산 범위를 담는 가장 좁은 dtype
+        self._work_dtype = np.dtype(self.range_info["work_dtype"]) if self._int64_safe else None
+        self._luts = None        # lut/da 테이블은 처음 사용할 때 만들어 plan과 함께 캐시
+        self._da_tables = None
+
+    # 전처리가 끝난 uint8 입력(마지막 축 = 샘플 축)에 대한 실행
+    # wrap 이전 누산값 (int64 누산이 안전한 plan 전용, 마지막 축 = 샘플 축)
+    def _accumulate(self, x: np.ndarray, method: str) -> np.ndarray:
+        symmetry = self.fold_info["symmetry"]
+        if method == "folded" and symmetry != "none":
+            return _folded_mac(x, self._taps_i64, symmetry)
+        if method == "csd":
+            return _csd_mac(x, self.csd_terms)
+        if method == "boxsum" and self.is_box:
+            # wrap 이전 누산값 = h_fixed[0] * 창 합 (정확한 정수), 후처리는 동일
+            return _box_window_sum(x, len(self._taps_i64)) * self._taps_i64[0]
+        if method == "lut":
+            if self._luts is None:
+                self._luts = product_luts(self.h_fixed, self._work_dtype)
+            return _lut_mac(x, self._luts)
+        if method == "da":
+            if self._da_tables is None:
+                self._da_tables = da_tables(self.h_fixed, dtype=self._work_dtype)
+            return _da_mac(x, self._da_tables, len(self.h_fixed))
+        # 부분합도 최악 범위 안이므로 좁은 작업 dtype에서 overflow가 없다
+        work = self._work_dtype
+        return _same_mode_mac(x.astype(work), self._taps_i64.astype(work), work)
+
+    # 전처리가 끝난 uint8 입력(마지막 축 = 샘플 축)에 대한 실행
+    # row_stats=True면 (y, 행별 카운터)를 반환 (ROW_STATS_DTYPE 참고)
+    def _apply_u8(self, x: np.ndarray, method: str = "direct", *, row_stats: bool = False):
+        if method not in FIXED_METHODS:
+            raise ValueError(f"Invalid method={method}. method must be one of {FIXED_METHODS}.")
+        wrap = self.range_info["wrap_possible"]
+
+        # int64 누산 범위를 넘는 극단적 탭 구성은 참조 루프(Python int)로 처리
+        if method == "loop" or not self._int64_safe:
+            y = np.empty(x.shape, dtype=np.uint8)
+            for idx in np.ndindex(x.shape[:-1]):
+                y[idx] = _fixed_golden_loop(x[idx], self.h_fixed, self.frac_bits, self.acc_bits)
+            if not row_stats:
+                return y
+            if not self._int64_safe:
+                raise ValueError(
+                    "Row stats require an int64-safe accumulator: "
+                    f"255 * sum(|h_fixed|) must be < 2^63 (h={self.h})."
+                )
+            # 카운터는 엔진과 무관하게 누산값만의 함수이므로 direct 누산으로 계산한다
+            acc = self._accumulate(x, "direct")
+            _, stats = _fixed_postprocess_stats(acc, self.frac_bits, self.acc_bits, wrap=wrap)
+            return y, stats
+
+        acc = self._accumulate(x, method)
+        if row_stats:
+            return _fixed_postprocess_stats(acc, self.frac_bits, self.acc_bits, wrap=wrap)
+        return _fixed_postprocess(acc, self.frac_bits, self.acc_bits, wrap=wrap)
+
+    # 실행 메타데이터: 실제 경로, 작업 dtype, wrap 생략 여부와 그 근거(range_info)
+    def run_info(self, method: str = "direct") -> dict:
+        if method not in FIXED_METHODS:
+            raise ValueError(f"Invalid method={method}. method must be one of {FIXED_METHODS}.")
+        loop = method == "loop" or not self._int64_safe
+        special = (
+            (method == "folded" and self.fold_info["symmetry"] != "none")
+            or method in ("csd", "lut", "da")
+            or (method == "boxsum" and self.is_box)
+        )
+        engine = "loop" if loop else (method if special else "direct")
+        narrow = engine in ("direct", "lut", "da")  # 좁은 작업 dtype을 쓰는 엔진
+        return {
+            "method": method,
+            "engine": engine,
+            "work_dtype": "object" if loop else (self._work_dtype.name if narrow else "int64"),
+            "wrap_emulated": loop or self.range_info["wrap_possible"],
+            "range": dict(self.range_info),
+        }
+
+    def apply(self, row, *, method: str = "direct") -> npt.NDArray[np.uint8]:
+        x = _preprocess_x_u8(row)
+        return self._apply_u8(x, method)
+
+    # 반환: y, 또는 요청 순서와 무관하게 (y, [info], [row_stats]) 튜플
+    def apply_batch(
+        self,
+        matrix,
+        *,
+        method: str = "direct",
+        return_info: bool = False,
+        return_stats: bool = False,
+    ):
+        x = _prepare_x_2d(matrix).astype(np.uint8, copy=False)
+        if not return_stats:
+            y = self._apply_u8(x, method)
+            return (y, self.run_info(method)) if return_info else y
+        y, stats = self._apply_u8(x, method, row_stats=True)
+        return (y, self.run_info(method), stats) if return_info else (y, stats)
+
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_fixed_plan(
+    h_key: tuple[float, ...],
+    frac_bits: int,
+    acc_bits: int,
+    coeff_bits: int,
+) -> FixedFirPlan:
+    return FixedFirPlan(h_key, frac_bits, acc_bits, coeff_bits)
+
+
+# (tuple(h), frac_bits, acc_bits, coeff_bits) 키로 최근 사용 plan을 재사용한다
+def get_fixed_plan(
+    h,
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+) -> FixedFirPlan:
+    return _cached_fixed_plan(tuple(h), frac_bits, acc_bits, coeff_bits)
+
+
+def fir_1d_fixed_golden(
+    x ,
+    h ,
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    *,
+    method: str = "direct",
+) -> npt.NDArray[np.uint8]:
+    """
+    범용 1D FIR 필터 하드웨어 동작 시뮬레이션 모델
+
+    Args:
+        x: Grayscale 이미지 입력 픽셀 리스트 (0 ~ 255) 범위의 int|float
+        h: 실수형 필터 계수 값
+        frac_bits: 계수 양자화를 위한 소수점 비트 (기본 12)
+        acc_bits: 누산기 비트 폭 (기본 32)
+        coeff_bits: 계수 비트 폭 (기본 16)
+        method: "direct"(NumPy int64 벡터화, 기본), "loop"(참조 루프),
+            "folded"(대칭/반대칭 계수 pre-adder), "csd"(0 탭 생략 + shift-add),
+            "boxsum"(동일 계수 커널 누적합), "lut"(탭별 곱 테이블 조회),
+            "da"(bit-serial 분산 산술 테이블 조회).
+            모든 방식은 유효 비트 설정에서 bit-exact 하다.
+
+    Returns:
+        y_out: 하드웨어 출력 값 numpy unit8 배열  (0 ~ 255)
+    """
+    # 입력 값 유효성 검증
+    _validate_h_coefficients(h) # 필터 계수
+    x_u8 = _preprocess_x_u8(x)  # 입력 (uint8 배열은 검증/반올림/clamp 생략)
+
+    # 비트 검증 + 계수 양자화는 plan 캐시에서 재사용
+    plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+    return plan._apply_u8(x_u8, method)
+
+
+def fir_1d_fixed_golden_2d(
+    x_u8,
+    h,
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    *,
+    return_info: bool = False,
+    return_stats: bool = False,
+):
+    """
+    H x W 행렬의 모든 행에 fir_1d_fixed_golden을 한 번에 적용한다.
+
+    계수 검증/양자화는 plan 캐시로 1회만 수행하고, MAC과 후처리는 행렬 전체에 대해
+    벡터화된다. 각 행의 결과는 fir_1d_fixed_golden(x_u8[r], h, ...)와 bit-exact 하다.
+    정적 범위 분석으로 누산기가 acc_bits를 넘을 수 없음이 증명되면 wrap 단계를 생략하고,
+    최악 범위를 담는 가장 좁은 정수 dtype(int16/int32/int64)으로 누산한다.
+
+    Args:
+        return_info: True면 (y_out, info)를 반환. info는 FixedFirPlan.run_info() 참고
+            (engine, work_dtype, wrap_emulated, range: 범위 증명)
+        return_stats: True면 행별 카운터(길이 H, ROW_STATS_DTYPE 구조 배열)를 함께 반환.
+            wrap/sat_low/sat_high 발생 수와 max_abs_acc를 같은 벡터화 패스에서 집계한다.
+
+    Returns:
+        y_out: H x W uint8 행렬 (0 ~ 255)
+        플래그를 켜면 (y_out, [info], [row_stats]) 순서의 튜플
+    """
+    plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+    return plan.apply_batch(x_u8, return_info=return_info, return_stats=return_stats)
@@ -0,0 +1,63 @@
+# File: fir_1d_fold.py
+# Role: 대칭/반대칭 양자화 계수의 pre-adder(folding) 평가와 곱셈기 절감 정보를 제공한다.
+from typing import Any
+
+import numpy as np
+
+
+# 양자화된 h_fixed 기준으로 대칭성을 판정한다 (실수 h가 아니라 하드웨어 계수 기준)
+# symmetric: h[k] == h[L-1-k], antisymmetric: h[k] == -h[L-1-k] (홀수 탭이면 중심 0)
+def analyze_symmetry(h_fixed: np.ndarray) -> dict[str, Any]:
+    taps = [int(c) for c in h_fixed]
+    L = len(taps)
+    mirrored = taps[::-1]
+
+    if taps == mirrored:
+        symmetry = "symmetric"
+        multipliers = (L + 1) // 2
+    elif taps == [-c for c in mirrored]:
+        symmetry = "antisymmetric"
+        multipliers = L // 2  # 홀수 탭의 중심 계수는 0이므로 곱셈 불필요
+    else:
+        symmetry = "none"
+        multipliers = L
+
+    return {
+        "symmetry": symmetry,
+        "multipliers_unfolded": L,
+        "multipliers": multipliers,
+        "multipliers_saved": L - multipliers,
+    }
+
+
+# 마지막 축을 zero-padding 하고 shift별 입력 뷰를 돌려준다: view(s)[..., n] = x[..., n + s]
+def _padded_shift_view(x_pad: np.ndarray, pad: int, width: int, shift: int) -> np.ndarray:
+    return x_pad[..., pad + shift : pad + shift + width]
+
+
+def _folded_mac(x: np.ndarray, taps: np.ndarray, symmetry: str) -> np.ndarray:
+    """
+    pre-adder 구조의 same-mode MAC (마지막 축 = 샘플 축, int64 정수 연산)
+
+    y[n] = sum_{k < L/2} h[k] * (x[n-k+c] ± x[n-(L-1-k)+c]) + h[mid] * x[n-mid+c] (홀수 탭)
+    정수 누산이므로 비폴딩 MAC과 누산 결과가 정확히 같다.
+    """
+    width = x.shape[-1]
+    L = len(taps)
+    center = L // 2
+    pad = max(center, L - 1 - center)
+
+    x_pad = np.zeros(x.shape[:-1] + (width + 2 * pad,), dtype=np.int64)
+    x_pad[..., pad : pad + width] = x
+    acc = np.zeros(x.shape, dtype=np.int64)
+
+    for k in range(L // 2):
+        near = _padded_shift_view(x_pad, pad, width, center - k)
+        far = _padded_shift_view(x_pad, pad, width, center - (L - 1 - k))
+        pre = near + far if symmetry == "symmetric" else near - far  # pre-adder
+        acc += taps[k] * pre
+
+    if L % 2 == 1 and symmetry == "symmetric":
+        mid = L // 2
+        acc += taps[mid] * _padded_shift_view(x_pad, pad, width, center - mid)
+    return acc
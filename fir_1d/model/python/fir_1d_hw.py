@@ -0,0 +1,273 @@
+# File: fir_1d_hw.py
+# Role: shift register + 곱셈 + 가산 트리 파이프라인의 사이클 단위 하드웨어 모델(픽셀 + 타이밍)을 제공한다.
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_fixed_ref import MAX_PIXEL, MIN_PIXEL, _round_shift, _wrap_acc, get_fixed_plan
+from .fir_1d_ref import _prepare_x_2d
+
+
+# 양의 정수 파라미터 검증 (bool 제외)
+def _validate_positive(name: str, value: int, minimum: int = 1) -> None:
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value < minimum:
+        raise ValueError(f"Invalid {name}={value}. {name} must be an integer >= {minimum}.")
+
+
+# 가산 트리 단계 수: 2-입력 adder로 L개 곱을 합치는 깊이
+def adder_tree_levels(num_taps: int) -> int:
+    return (num_taps - 1).bit_length()
+
+
+class HwPipelineModel:
+    """
+    FIR 가속기 datapath의 사이클 단위 모델
+
+    datapath (lane마다 동일, lanes개 픽셀/beat):
+        입력 레지스터 -> shift register (L-1+lanes 샘플 창, 행 경계는 0 mux)
+        -> 곱셈 (mult_stages 레지스터) -> 2-입력 가산 트리 (adder_levels_per_stage 단계마다 레지스터)
+        -> wrap/반올림/포화 (post_stages 레지스터) -> 출력
+    곱셈기를 num_multipliers개로 줄이면 1 beat를 ii = ceil(L * lanes / num_multipliers)
+    사이클에 걸쳐 시분할 처리한다 (initiation interval).
+
+    타이밍 규칙:
+    - 입력 beat g는 cycle g * ii (+ 행 사이 row_gap 공백)에 들어온다. 행은 ceil(W / lanes)
+      beat이며 마지막 beat의 남는 lane은 유휴다.
+    - 출력 beat j는 x[(j + 1) * lanes - 1 + center]가 들어온 뒤 계산되므로
+      delay_beats = (lanes - 1 + center) // lanes beat 늦게 나온다. 다음 행 입력이 이어지면
+      shift 를 위한 추가 beat가 필요 없고, 프레임 끝에서만 delay_beats 개의 flush beat를 넣는다.
+    - 출력 cycle = 해당 입력 beat cycle + (ii - 1) + pipeline_depth
+
+    픽셀 값은 가산 트리의 각 adder 출력을 acc_bits로 wrap 하며 계산한다.
+    2의 보수 덧셈은 mod 2^acc_bits 에서 결합법칙이 성립하므로 최종 1회 wrap 하는
+    fir_1d_fixed_golden 과 bit-exact 하다.
+    """
+
+    __slots__ = (
+        "plan",
+        "lanes",
+        "mult_stages",
+        "adder_levels_per_stage",
+        "post_stages",
+        "num_multipliers",
+        "row_gap",
+        "ii",
+    )
+
+    def __init__(
+        self,
+        h: Sequence[float],
+        frac_bits: int = 12,
+        acc_bits: int = 32,
+        coeff_bits: int = 16,
+        *,
+        lanes: int = 1,
+        mult_stages: int = 1,
+        adder_levels_per_stage: int = 1,
+        post_stages: int = 1,
+        num_multipliers: int | None = None,
+        row_gap: int = 0,
+    ) -> None:
+        _validate_positive("lanes", lanes)
+        _validate_positive("mult_stages", mult_stages, 0)
+        _validate_positive("adder_levels_per_stage", adder_levels_per_stage)
+        _validate_positive("post_stages", post_stages, 0)
+        _validate_positive("row_gap", row_gap, 0)
+        if num_multipliers is not None:
+            _validate_positive("num_multipliers", num_multipliers)
+
+        self.plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+        if acc_bits > 64 and not self.plan._int64_safe:
+            raise ValueError(
+                "HW pipeline model requires acc_bits <= 64 or an int64-safe accumulator "
+                f"(acc_bits={acc_bits}, h={self.plan.h})."
+            )
+        self.lanes = int(lanes)
+        self.mult_stages = int(mult_stages)
+        self.adder_levels_per_stage = int(adder_levels_per_stage)
+        self.post_stages = int(post_stages)
+        self.num_multipliers = num_multipliers
+        self.row_gap = int(row_gap)
+
+        full = len(self.plan.h_fixed) * self.lanes  # 완전 병렬 곱셈기 수
+        self.ii = 1 if num_multipliers is None else -(-full // min(int(num_multipliers), full))
+
+    @property
+    def num_taps(self) -> int:
+        return len(self.plan.h_fixed)
+
+    @property
+    def delay_beats(self) -> int:
+        return (self.lanes - 1 + self.num_taps // 2) // self.lanes
+
+    @property
+    def pipeline_depth(self) -> int:
+        tree_stages = -(-adder_tree_levels(self.num_taps) // self.adder_levels_per_stage)
+        return 1 + self.mult_stages + tree_stages + self.post_stages
+
+    def structure(self) -> dict[str, Any]:
+        """
+        Returns:
+            {"taps", "lanes", "ii", "pipeline_depth", "delay_beats", "adder_tree_levels",
+             "multipliers", "adders", "shift_register_samples"}
+        """
+        L = self.num_taps
+        full = L * self.lanes
+        return {
+            "taps": L,
+            "lanes": self.lanes,
+            "ii": self.ii,
+            "pipeline_depth": self.pipeline_depth,
+            "delay_beats": self.delay_beats,
+            "adder_tree_levels": adder_tree_levels(L),
+            "multipliers": full if self.num_multipliers is None else min(self.num_multipliers, full),
+            "adders": (L - 1) * self.lanes,
+            "shift_register_samples": L - 1 + self.lanes,
+        }
+
+    # 곱 -> acc_bits 폭 2-입력 가산 트리 (마지막 축 = 샘플 축)
+    def _datapath(self, x: np.ndarray) -> npt.NDArray[np.uint8]:
+        plan = self.plan
+        L = self.num_taps
+        acc_bits = plan.acc_bits
+        width = x.shape[-1]
+        center = L // 2
+        pad = max(center, L - 1 - center)
+        x_pad = np.zeros(x.shape[:-1] + (width + 2 * pad,), dtype=np.int64)
+        x_pad[..., pad : pad + width] = x
+
+        # 곱셈 단계: 곱도 acc_bits 폭 adder 입력으로 들어가므로 같은 폭으로 wrap
+        nodes = [
+            _wrap_acc(int(c) * x_pad[..., pad + center - k : pad + center - k + width], acc_bits)
+            for k, c in enumerate(plan._taps_i64)
+        ]
+        # 가산 트리: 단계마다 인접 쌍을 더하고, 홀수 개면 마지막 노드는 레지스터로 통과
+        while len(nodes) > 1:
+            paired = [_wrap_acc(a + b, acc_bits) for a, b in zip(nodes[0::2], nodes[1::2])]
+            if len(nodes) % 2:
+                paired.append(nodes[-1])
+            nodes = paired
+        acc = nodes[0]
+        return np.clip(_round_shift(acc, plan.frac_bits), MIN_PIXEL, MAX_PIXEL).astype(np.uint8)
+
+    # 입력 beat 번호 -> 입력 cycle (행 사이 row_gap 공백 포함, flush beat는 마지막 행 뒤)
+    def _in_cycle(self, beat: np.ndarray, beats_per_row: int, rows: int) -> np.ndarray:
+        row = np.minimum(beat // beats_per_row, rows - 1)
+        return beat * self.ii + row * self.row_gap
+
+    def schedule(self, rows: int, width: int, clock_mhz: float | None = None) -> dict[str, Any]:
+        """
+        rows x width 이미지의 사이클 통계 (픽셀 값과 무관하므로 shape만으로 계산)
+
+        Returns:
+            {"rows", "width", "beats_per_row", "input_beats", "flush_beats", "ii",
+             "pipeline_depth", "first_output_cycle", "total_cycles",
+             "pixels_per_cycle", "peak_pixels_per_cycle", "lane_utilization",
+             "row_latency": 행별 (첫 입력 beat ~ 마지막 출력 beat) cycle 수 int64 배열,
+             "row_latency_min", "row_latency_max",
+             ["frame_time_us", "mpix_per_s"] (clock_mhz 지정 시)}
+        """
+        beats_per_row = -(-width // self.lanes)
+        pixels = rows * width
+        report: dict[str, Any] = {
+            "rows": rows,
+            "width": width,
+            "beats_per_row": beats_per_row,
+            "input_beats": rows * beats_per_row,
+            "flush_beats": self.delay_beats if pixels else 0,
+            "ii": self.ii,
+            "pipeline_depth": self.pipeline_depth,
+            "peak_pixels_per_cycle": self.lanes / self.ii,
+        }
+        if pixels == 0:
+            report.update(
+                first_output_cycle=None,
+                total_cycles=0,
+                pixels_per_cycle=0.0,
+                lane_utilization=0.0,
+                row_latency=np.zeros(rows, dtype=np.int64),
+                row_latency_min=0,
+                row_latency_max=0,
+            )
+            return report
+
+        r = np.arange(rows, dtype=np.int64)
+        first_in = self._in_cycle(r * beats_per_row, beats_per_row, rows)
+        last_out_beat = r * beats_per_row + (beats_per_row - 1) + self.delay_beats
+        out_offset = (self.ii - 1) + self.pipeline_depth
+        last_out = self._in_cycle(last_out_beat, beats_per_row, rows) + out_offset
+        row_latency = last_out - first_in + 1
+
+        total_cycles = int(last_out[-1]) + 1
+        report.update(
+            first_output_cycle=int(self._in_cycle(np.int64(self.delay_beats), beats_per_row, rows))
+            + out_offset,
+            total_cycles=total_cycles,
+            pixels_per_cycle=pixels / total_cycles,
+            lane_utilization=pixels / (rows * beats_per_row * self.lanes),
+            row_latency=row_latency,
+            row_latency_min=int(row_latency.min()),
+            row_latency_max=int(row_latency.max()),
+        )
+        if clock_mhz is not None:
+            report["frame_time_us"] = total_cycles / clock_mhz
+            report["mpix_per_s"] = pixels / total_cycles * clock_mhz
+        return report
+
+    def run(self, x_u8, *, clock_mhz: float | None = None) -> tuple[npt.NDArray[np.uint8], dict[str, Any]]:
+        """
+        Returns:
+            (y, report): y는 fir_1d_fixed_golden_2d(x_u8, h, ...)와 bit-exact 한 H x W uint8,
+            report는 schedule() 결과에 structure()를 "structure" 키로 포함한 dict
+        """
+        x = _prepare_x_2d(x_u8).astype(np.uint8, copy=False)
+        y = self._datapath(x)
+        report = self.schedule(x.shape[0], x.shape[1], clock_mhz)
+        report["structure"] = self.structure()
+        return y, report
+
+
+def fir_1d_hw_pipeline(
+    x_u8,
+    h: Sequence[float],
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    *,
+    lanes: int = 1,
+    mult_stages: int = 1,
+    adder_levels_per_stage: int = 1,
+    post_stages: int = 1,
+    num_multipliers: int | None = None,
+    row_gap: int = 0,
+    clock_mhz: float | None = None,
+) -> tuple[npt.NDArray[np.uint8], dict[str, Any]]:
+    """
+    H x W 이미지를 HW 파이프라인 모델로 처리한다 (HwPipelineModel 참고).
+
+    Args:
+        lanes: 클럭당 처리 픽셀 수
+        mult_stages / post_stages: 곱셈 / 후처리 단계 레지스터 수
+        adder_levels_per_stage: 레지스터 1개당 묶는 가산 트리 단계 수
+        num_multipliers: 곱셈기 수 (None이면 L * lanes 완전 병렬, ii = 1)
+        row_gap: 행 사이 입력 공백 cycle (예: 수평 blanking)
+        clock_mhz: 지정 시 frame_time_us / mpix_per_s 포함
+
+    Returns:
+        (y, report)
+    """
+    model = HwPipelineModel(
+        h,
+        frac_bits,
+        acc_bits,
+        coeff_bits,
+        lanes=lanes,
+        mult_stages=mult_stages,
+        adder_levels_per_stage=adder_levels_per_stage,
+        post_stages=post_stages,
+        num_multipliers=num_multipliers,
+        row_gap=row_gap,
+    )
+    return model.run(x_u8, clock_mhz=clock_mhz)
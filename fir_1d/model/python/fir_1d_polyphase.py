@@ -0,0 +1,149 @@
+# File: fir_1d_polyphase.py
+# Role: 보간(interpolate) / 데시메이션(decimate) 시 남는 출력 위상만 계산하는 polyphase FIR을 제공한다.
+from collections.abc import Sequence
+from math import gcd
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_ref import _preprocess_x_fast, get_ideal_plan
+from .fir_1d_fixed_ref import _fixed_golden_loop, _fixed_postprocess, get_fixed_plan
+
+
+# 변환 비율 검증: 1 이상의 정수 (bool 제외)
+def _validate_rate(name: str, value: int) -> None:
+    if isinstance(value, bool) or not isinstance(value, (int, np.integer)) or value < 1:
+        raise ValueError(f"Invalid {name}={value}. {name} must be an integer >= 1.")
+
+
+# 출력 길이: 입력 W를 interpolate배 zero-stuffing 후 decimate 간격으로 샘플링 (0번 샘플부터)
+def polyphase_output_length(width: int, decimate: int = 1, interpolate: int = 1) -> int:
+    return -(-(width * interpolate) // decimate)
+
+
+# 배열 입력 준비: uint8은 그대로, 그 외는 ideal/fixed 공통 전처리 (마지막 축 = 샘플 축)
+def _prepare_x(x) -> np.ndarray:
+    x_arr = np.asarray(x)
+    if x_arr.ndim == 0:
+        raise ValueError(f"Invalid x: expected 1D or 2D array, got shape={x_arr.shape}.")
+    return _preprocess_x_fast(x_arr)
+
+
+def _polyphase_mac(
+    x: np.ndarray,
+    taps: np.ndarray,
+    acc_dtype,
+    decimate: int,
+    interpolate: int,
+) -> np.ndarray:
+    """
+    u = zero-stuff(x, interpolate), y = same-mode FIR(u), out[j] = y[j * decimate] 를
+    남는 출력과 0이 아닌 입력 항만으로 계산한다 (마지막 축 = 샘플 축).
+
+    out[j]에서 탭 k는 (j*M - k + c) % L == 0 일 때만 기여하며, 그 입력은
+    x[(j*M - k + c) / L] 이다. j를 P = L / gcd(M, L) 주기로 묶으면 그룹마다 기여 탭이
+    고정되고 입력 인덱스가 M / gcd(M, L) 간격으로 증가하므로 strided 뷰로 누산한다.
+    탭 순서대로 누산하고 제외되는 항은 모두 0이므로 전체 출력 계산 후 버리는 방식과
+    누산 결과가 같다 (float에서도 bit-identical).
+    """
+    M, Li = decimate, interpolate
+    width = x.shape[-1]
+    L = len(taps)
+    center = L // 2
+    num_out = polyphase_output_length(width, M, Li)
+    out = np.zeros(x.shape[:-1] + (num_out,), dtype=acc_dtype)
+    if num_out == 0:
+        return out
+
+    g = gcd(M, Li)
+    period = Li // g   # 기여 탭 패턴의 출력 주기
+    step = M // g      # 그룹 안에서 입력 인덱스 증가량
+
+    pad_l = max(0, -((center - (L - 1)) // Li))
+    pad_r = max(0, ((num_out - 1) * M + center) // Li - (width - 1))
+    x_pad = np.zeros(x.shape[:-1] + (pad_l + width + pad_r,), dtype=acc_dtype)
+    x_pad[..., pad_l : pad_l + width] = x
+
+    for r in range(min(period, num_out)):
+        dst = out[..., r::period]
+        count = dst.shape[-1]
+        for k in range(L):
+            num = r * M - k + center
+            if num % Li:
+                continue  # zero-stuffing 샘플만 만나는 탭
+            start = pad_l + num // Li
+            dst += taps[k] * x_pad[..., start : start + step * (count - 1) + 1 : step]
+    return out
+
+
+# zero-stuffing 업샘플 (참조/폴백용): u[n*L] = x[n], 나머지 0
+def _zero_stuff(x: np.ndarray, interpolate: int) -> np.ndarray:
+    u = np.zeros(x.shape[:-1] + (x.shape[-1] * interpolate,), dtype=x.dtype)
+    u[..., ::interpolate] = x
+    return u
+
+
+def fir_1d_ideal_polyphase(
+    x,
+    h: Sequence[float],
+    *,
+    decimate: int = 1,
+    interpolate: int = 1,
+) -> npt.NDArray[np.float64]:
+    """
+    ideal 모델의 polyphase 보간/데시메이션
+
+    결과는 fir_1d_ideal_np(zero-stuff(x, interpolate), h)[..., ::decimate]와 같으며,
+    남는 출력 위상과 0이 아닌 입력 항만 계산하므로 연산량/출력 크기가 비율만큼 줄어든다.
+    보간 이득(interpolate배)은 h에 포함시켜야 한다.
+
+    Args:
+        x: 1D 행 또는 H x W 행렬 (마지막 축 = 샘플 축)
+        h: 실수 필터 계수
+        decimate: 출력 간격 M (1이면 데시메이션 없음)
+        interpolate: zero-stuffing 배율 L (1이면 보간 없음)
+
+    Returns:
+        y: (..., ceil(W * interpolate / decimate)) float64 배열
+    """
+    _validate_rate("decimate", decimate)
+    _validate_rate("interpolate", interpolate)
+    plan = get_ideal_plan(h)
+    x_arr = _prepare_x(x).astype(np.float64, copy=False)
+    return _polyphase_mac(x_arr, plan.taps, np.float64, decimate, interpolate)
+
+
+def fir_1d_fixed_polyphase(
+    x,
+    h: Sequence[float],
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    *,
+    decimate: int = 1,
+    interpolate: int = 1,
+) -> npt.NDArray[np.uint8]:
+    """
+    fixed golden 모델의 polyphase 보간/데시메이션
+
+    결과는 fir_1d_fixed_golden(zero-stuff(x, interpolate), h, ...)[::decimate]와 bit-exact 하다.
+    (zero-stuffing 샘플은 누산에 0을 더하므로 건너뛰어도 wrap/반올림/포화 결과가 같다)
+
+    Returns:
+        y_out: (..., ceil(W * interpolate / decimate)) uint8 배열 (0 ~ 255)
+    """
+    _validate_rate("decimate", decimate)
+    _validate_rate("interpolate", interpolate)
+    plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+    x_u8 = _prepare_x(x).astype(np.uint8, copy=False)
+
+    # int64 누산 범위를 넘는 극단적 탭 구성은 참조 루프로 전체 계산 후 샘플링
+    if not plan._int64_safe:
+        u = _zero_stuff(x_u8, interpolate)
+        y = np.empty(u.shape, dtype=np.uint8)
+        for idx in np.ndindex(u.shape[:-1]):
+            y[idx] = _fixed_golden_loop(u[idx], plan.h_fixed, frac_bits, acc_bits)
+        return np.ascontiguousarray(y[..., ::decimate])
+
+    acc = _polyphase_mac(x_u8, plan._taps_i64, np.int64, decimate, interpolate)
+    return _fixed_postprocess(acc, frac_bits, acc_bits)
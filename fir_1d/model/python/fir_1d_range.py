@@ -0,0 +1,65 @@
+# File: fir_1d_range.py
+# Role: 0~255 입력과 양자화 계수로 누산기 범위를 정적으로 분석해 wrap 필요 여부와 작업 dtype을 결정한다.
+from typing import Any
+
+import numpy as np
+
+_MAX_PIXEL = 255
+
+# 누산 최악 범위가 들어가는 가장 좁은 작업 버퍼 dtype (비트 폭 오름차순)
+ACC_WORK_DTYPES = ((16, np.int16), (32, np.int32), (64, np.int64))
+
+
+# 정확한 누산 범위: 양수 계수는 255, 음수 계수는 0일 때 최대 (최소는 반대)
+def acc_range(h_fixed) -> tuple[int, int]:
+    pos = sum(int(c) for c in h_fixed if c > 0)
+    neg = sum(-int(c) for c in h_fixed if c < 0)
+    return -_MAX_PIXEL * neg, _MAX_PIXEL * pos
+
+
+# [acc_min, acc_max]를 담는 최소 2의 보수 비트 폭
+def required_acc_bits(acc_min: int, acc_max: int) -> int:
+    return max(acc_max.bit_length(), (-acc_min - 1).bit_length() if acc_min < 0 else 0) + 1
+
+
+def analyze_acc_range(h_fixed, acc_bits: int) -> dict[str, Any]:
+    """
+    양자화 계수 h_fixed와 acc_bits로 누산기 overflow(wrap) 가능 여부를 증명한다.
+
+    누산값은 계수별 항의 합이며 각 항은 [min(0, 255*h), max(0, 255*h)] 범위이므로
+    acc in [-255 * sum(|h_neg|), 255 * sum(h_pos)] 가 정확한 최악 범위다 (모든 경계값은
+    실제 입력으로 도달 가능). 이 범위가 acc_bits 부호 범위에 들어가면 acc & mask와 부호
+    복원은 항등이므로 생략할 수 있다.
+
+    Returns:
+        {"acc_min", "acc_max", "required_bits", "acc_bits", "wrap_possible",
+         "work_bits", "work_dtype", "proof"}
+        work_dtype은 최악 범위를 담는 가장 좁은 정수 dtype 이름
+        (int64로도 부족하면 "object" = Python int 참조 루프)
+    """
+    acc_min, acc_max = acc_range(h_fixed)
+    required_bits = required_acc_bits(acc_min, acc_max)
+    wrap_possible = required_bits > acc_bits
+
+    work_bits, work_dtype = 0, "object"
+    for bits, dtype in ACC_WORK_DTYPES:
+        if required_bits <= bits:
+            work_bits, work_dtype = bits, np.dtype(dtype).name
+            break
+
+    relation = ">" if wrap_possible else "<="
+    proof = (
+        f"acc in [{acc_min}, {acc_max}] for x in [0, 255]; "
+        f"needs {required_bits} signed bits {relation} acc_bits={acc_bits}; "
+        + ("wrap emulated" if wrap_possible else "wrap is identity, mask skipped")
+    )
+    return {
+        "acc_min": acc_min,
+        "acc_max": acc_max,
+        "required_bits": required_bits,
+        "acc_bits": acc_bits,
+        "wrap_possible": wrap_possible,
+        "work_bits": work_bits,
+        "work_dtype": work_dtype,
+        "proof": proof,
+    }
@@ -2,9 +2,25 @@
 # Role: 1D FIR 이상(부동소수점) 참조 모델과 입력/계수 검증 로직을 제공한다.
 import math
 from collections.abc import Sequence
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_fft import _fft_same_mode, select_ideal_method
+from .fir_1d_dyadic import _dyadic_mac, dyadic_decompose
+from .fir_1d_boxsum import BOXSUM_MIN_TAPS, _box_window_sum, is_box_kernel
+from .fir_1d_winograd import _winograd_same_mode, winograd_supported
 
 MAX_ABS_H_COEFF = 8.0
 
+# direct: 탭 단위 벡터화(루프와 bit-identical) / fft: overlap-add FFT
+# dyadic: m/2^e 계수의 정수 누산 + 1회 스케일(정확값, 아니면 direct로 fallback)
+# boxsum: 동일 계수 커널의 누적합 창 합 x 계수 (box가 아니면 direct로 fallback)
+# winograd: 짧은 커널의 Winograd F(4, L) 타일 변환 (지원 범위 밖이면 direct로 fallback)
+# auto: dyadic > boxsum(BOXSUM_MIN_TAPS 이상) > 탭 수·폭 기준 direct/fft 순으로 선택
+IDEAL_METHODS = ("direct", "fft", "dyadic", "boxsum", "winograd", "auto")
+
 # 필터 계수 입력 예외 처리
 def _validate_h_coefficients(h: Sequence[float]) -> None:
     # 빈 필터 계수
@@ -24,27 +40,59 @@ def _validate_h_coefficients(h: Sequence[float]) -> None:
             )
 
 
-def _validate_x(x: Sequence[int | float]) -> list[int | float]:
+# 배열 입력용 전처리: 유한성 검사 -> round-half-up -> [0, 255] clamp
+# 오류 메시지는 첫 번째 비유한 샘플의 (flat) 인덱스를 보고한다.
+# 정수 dtype은 유한/정수값이 보장되므로 clamp만 수행한다.
+def _preprocess_x_np(x) -> np.ndarray:
+    x_arr = np.asarray(x)
+    if x_arr.dtype.kind in "biu":
+        return np.clip(x_arr.astype(np.float64), 0, 255)
+    x_arr = x_arr.astype(np.float64, copy=False)
+    finite = np.isfinite(x_arr)
+    if not finite.all():
+        index = int(np.argmin(finite.reshape(-1)))  # 첫 번째 비유한 샘플 위치
+        raise ValueError(f"Invalid x[{index}]={x_arr.flat[index]}: x must be finite.")
+    y = x_arr + 0.5
+    np.floor(y, out=y)
+    return np.clip(y, 0, 255, out=y)
 
-    for index, sample in enumerate(x):
-        if not math.isfinite(sample):
-            raise ValueError(f"Invalid x[{index}]={sample}: x must be finite.")
-        
-    return list(x)
 
-def _round_half_up_x(x: Sequence[int | float]) -> list[int]:
+# 전처리 fast path: uint8 입력은 이미 규칙(유한, 정수, 0~255)을 만족하므로
+# 검증/반올림/clamp 없이 그대로 반환한다 (복사 없음). 그 외는 float64 전처리 결과.
+def _preprocess_x_fast(x) -> np.ndarray:
+    x_arr = np.asarray(x)
+    if x_arr.dtype == np.uint8:
+        return x_arr
+    return _preprocess_x_np(x_arr)
 
-    new_x = [math.floor(sample + 0.5) for sample in x ]
-    return new_x
 
-def _clamp_x(x: Sequence[int]) -> list[int]:
-    return [max(0, min(255, s)) for s in x]
+# fixed 경로용: 전처리 결과를 uint8로 (uint8 입력은 복사 없음)
+def _preprocess_x_u8(x) -> npt.NDArray[np.uint8]:
+    return _preprocess_x_fast(x).astype(np.uint8, copy=False)
+
+# Same-mode(center = L//2, zero-padding) MAC를 탭 단위로 벡터화한다.
+# 마지막 축을 샘플 축으로 보고, 탭 k 순서대로 누산하므로
+# 루프 모델(acc += h[k] * x[n - k + center])과 누산 순서가 동일하다.
+def _same_mode_mac(x: np.ndarray, taps: np.ndarray, acc_dtype) -> np.ndarray:
+    N = x.shape[-1]
+    L = len(taps)
+    center = L // 2
+    acc = np.zeros(x.shape, dtype=acc_dtype)
+
+    for k in range(L):
+        shift = center - k  # input_idx = n + shift
+        if abs(shift) >= N:
+            continue  # 전 구간이 zero-padding 영역
+        if shift >= 0:
+            acc[..., : N - shift] += taps[k] * x[..., shift:]
+        else:
+            acc[..., -shift:] += taps[k] * x[..., : N + shift]
+    return acc
+
 
 def fir_1d_ideal(x: Sequence[int | float], h: Sequence[float]) -> list[float]:
     _validate_h_coefficients(h)
-    x_1= _validate_x(x)
-    x_2= _round_half_up_x(x_1)
-    x_sat = _clamp_x(x_2)
+    x_sat = _preprocess_x_fast(x).tolist()
 
     N = len(x_sat)
     L = len(h)  # 필터 h의 길이
@@ -63,3 +111,140 @@ def fir_1d_ideal(x: Sequence[int | float], h: Sequence[float]) -> list[float]:
         y[n] = acc
 
     return y
+
+
+# 2D 입력 행렬 준비: uint8은 이미 전처리 규칙(정수, 0~255)을 만족하므로 그대로 사용
+def _prepare_x_2d(x_u8) -> np.ndarray:
+    x = np.asarray(x_u8)
+    if x.ndim != 2:
+        raise ValueError(f"Invalid x: expected 2D (H x W) array, got shape={x.shape}.")
+    return _preprocess_x_fast(x)
+
+
+class IdealFirPlan:
+    """
+    계수 검증을 1회만 수행하고 재사용하는 ideal 모델 실행 계획
+
+    apply(row): 1D 행(또는 마지막 축 기준 배열) 필터링
+    apply_batch(matrix): H x W 행렬의 모든 행 필터링
+    """
+
+    __slots__ = ("h", "taps", "dyadic", "is_box")
+
+    def __init__(self, h: Sequence[float]) -> None:
+        _validate_h_coefficients(h)
+        self.h = tuple(h)
+        self.taps = np.asarray(h, dtype=np.float64)
+        self.taps.setflags(write=False)  # 캐시로 공유되므로 읽기 전용
+        self.dyadic = dyadic_decompose(self.h)  # (정수 계수, 지수) 또는 None
+        self.is_box = is_box_kernel(self.h)     # 동일 계수(moving average) 커널 여부
+
+    # method를 실제 실행 경로(direct/fft/dyadic)로 확정한다
+    def resolve_method(self, width: int, method: str = "direct") -> str:
+        if method not in IDEAL_METHODS:
+            raise ValueError(f"Invalid method={method}. method must be one of {IDEAL_METHODS}.")
+        if method in ("dyadic", "auto") and self.dyadic is not None:
+            return "dyadic"
+        if self.is_box and (
+            method == "boxsum" or (method == "auto" and len(self.taps) >= BOXSUM_MIN_TAPS)
+        ):
+            return "boxsum"
+        if method == "auto":
+            return select_ideal_method(len(self.taps), width)
+        if method == "winograd" and winograd_supported(len(self.taps)):
+            return "winograd"
+        if method in ("dyadic", "boxsum", "winograd"):
+            return "direct"  # 조건을 만족하지 않는 계수는 float direct 경로로 fallback
+        return method
+
+    # x: 전처리가 끝난 0~255 정수값 배열 (uint8 또는 float64)
+    def _run(self, x: np.ndarray, method: str) -> npt.NDArray[np.float64]:
+        resolved = self.resolve_method(x.shape[-1], method)
+        if resolved == "dyadic":
+            m, frac_bits = self.dyadic
+            return _dyadic_mac(x, m, frac_bits)
+        if resolved == "boxsum":
+            window = _box_window_sum(x.astype(np.int64, copy=False), len(self.taps))
+            return window * self.taps[0]
+        x_f64 = x.astype(np.float64, copy=False)
+        if resolved == "fft":
+            return _fft_same_mode(x_f64, self.taps)
+        if resolved == "winograd":
+            return _winograd_same_mode(x_f64, self.taps)
+        return _same_mode_mac(x_f64, self.taps, np.float64)
+
+    def apply(self, row, *, method: str = "direct") -> npt.NDArray[np.float64]:
+        x_sat = _preprocess_x_fast(row)
+        return self._run(x_sat, method)
+
+    def apply_batch(self, matrix, *, method: str = "direct") -> npt.NDArray[np.float64]:
+        x = _prepare_x_2d(matrix)
+        return self._run(x, method)
+
+
+PLAN_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _cached_ideal_plan(h_key: tuple[float, ...]) -> IdealFirPlan:
+    return IdealFirPlan(h_key)
+
+
+# tuple(h) 키로 최근 사용 plan을 재사용한다 (검증 실패 시 캐시되지 않음)
+def get_ideal_plan(h: Sequence[float]) -> IdealFirPlan:
+    return _cached_ideal_plan(tuple(h))
+
+
+def fir_1d_ideal_np(
+    x,
+    h: Sequence[float],
+    *,
+    method: str = "direct",
+) -> npt.NDArray[np.float64]:
+    """
+    fir_1d_ideal의 NumPy same-mode 구현 (center = L//2, zero-padding)
+
+    Args:
+        x: 입력 샘플 (list 또는 ndarray). 마지막 축을 샘플 축으로 처리한다.
+        h: 실수형 필터 계수
+        method: "direct"(기본), "fft"(overlap-add), "dyadic"(정수 누산, 정확값),
+            "boxsum"(동일 계수 커널 누적합), "winograd"(짧은 커널 F(4, L) 타일 변환),
+            "auto"(dyadic > boxsum > direct/fft 자동 선택)
+
+    Returns:
+        y: x와 같은 shape의 float64 배열 (clamp 없음)
+
+    누산 정밀도:
+        direct는 탭 k = 0..L-1 순서로 acc += h[k] * x[n - k + center]를 수행하고
+        zero-padding 위치는 루프 모델과 동일하게 가산을 생략한다.
+        따라서 연산 순서가 루프 모델과 같아 오차 한계는 0 ULP(bit-identical)이다.
+        fft는 반올림 순서가 달라 direct와 미세한 편차가 생긴다
+        (fir_1d_fft.fft_deviation_report로 측정, 127탭에서도 1e-11 미만).
+        dyadic은 실수 연산의 정확값이다. 분해 조건(|acc| < 2^53)에서는 direct의 부분합도
+        모두 2^-e 배수로 정확히 표현되므로 두 결과는 bit-identical 하다.
+        boxsum은 정확한 정수 창 합에 계수를 1회 곱하므로 반올림이 1회뿐이며,
+        direct와의 차이는 |y_box - y_direct| <= L * 2^-52 * |h[0]| * sum(창 내 x) 이내다.
+        winograd는 변환 행렬의 반올림으로 direct와 최대 WINOGRAD_MAX_ABS_DEV_TOL(1e-6)
+        이내에서 달라질 수 있다 (3/5탭, 0~255 입력에서 실측 1e-11 수준).
+    """
+    return get_ideal_plan(h).apply(x, method=method)
+
+
+def fir_1d_ideal_2d(
+    x_u8,
+    h: Sequence[float],
+    *,
+    method: str = "direct",
+) -> npt.NDArray[np.float64]:
+    """
+    H x W 행렬의 모든 행에 fir_1d_ideal을 한 번에 적용한다.
+
+    Args:
+        x_u8: H x W 입력 행렬 (uint8 권장, 그 외 dtype은 전처리 규칙 적용)
+        h: 실수형 필터 계수
+        method: "direct"(기본), "fft", "dyadic", "boxsum", "winograd", "auto" (fir_1d_ideal_np 참고)
+
+    Returns:
+        y: H x W float64 행렬. direct의 각 행은 fir_1d_ideal(x_u8[r].tolist(), h)와 동일하다.
+    """
+    return get_ideal_plan(h).apply_batch(x_u8, method=method)
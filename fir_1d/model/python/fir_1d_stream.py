@@ -0,0 +1,140 @@
+# File: fir_1d_stream.py
+# Role: 긴 1D 신호를 임의 크기 청크로 나눠 상수 메모리로 필터링하는 상태 유지(streaming) FIR을 제공한다.
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .fir_1d_ref import _preprocess_x_fast, get_ideal_plan
+from .fir_1d_fixed_ref import _fixed_postprocess, get_fixed_plan
+
+
+# valid-mode MAC: out[j] = sum_k taps[k] * buf[j + L - 1 - k] (j = 0..len(buf)-L)
+# 탭 k 순서대로 누산하므로 _same_mode_mac과 누산 순서가 같다 (zero-padding 항은 0 가산).
+def _valid_mac(buf: np.ndarray, taps: np.ndarray, acc_dtype) -> np.ndarray:
+    L = len(taps)
+    count = len(buf) - (L - 1)
+    acc = np.zeros(count, dtype=acc_dtype)
+    for k in range(L):
+        start = L - 1 - k
+        acc += taps[k] * buf[start : start + count]
+    return acc
+
+
+# 청크 전처리: 배치 경로와 같은 _preprocess_x_fast 규칙 (uint8은 그대로)
+# 오류 메시지의 인덱스는 스트림 전체 기준 샘플 위치로 바꿔 다시 발생시킨다.
+def _preprocess_chunk(chunk, offset: int) -> np.ndarray:
+    x_arr = np.asarray(chunk)
+    if x_arr.ndim != 1:
+        raise ValueError(f"Invalid chunk: expected 1D array, got shape={x_arr.shape}.")
+    try:
+        return _preprocess_x_fast(x_arr)
+    except ValueError:
+        index = int(np.argmin(np.isfinite(x_arr)))
+        raise ValueError(f"Invalid x[{offset + index}]={x_arr[index]}: x must be finite.") from None
+
+
+class StreamingFir:
+    """
+    same-mode FIR(center = L//2, zero-padding)의 청크 단위 상태 유지 실행기 (공통 로직)
+
+    y[n] = sum_k h[k] * x[n - k + center] 는 x[n + center]까지 받아야 확정되므로
+    출력은 입력보다 center(= delay) 샘플 늦게 나온다. 청크 사이에는 최근 L-1개 입력만
+    이력으로 유지하고, flush()에서 오른쪽 zero-padding(center개)을 넣어 나머지 출력을 낸다.
+    process()/flush() 출력을 이어 붙이면 전체 신호를 한 번에 필터링한 결과와 같다.
+
+    process(chunk): 이번 청크로 확정된 출력 반환 (길이 0일 수 있음)
+    flush(): 남은 출력 반환 후 reset (스트림 종료)
+    run(chunks): 청크 이터러블을 받아 출력 청크를 순서대로 생성 (마지막에 flush)
+    """
+
+    __slots__ = ("taps", "delay", "_work_dtype", "_out_dtype", "_history", "_consumed")
+
+    def __init__(self, taps: np.ndarray, work_dtype, out_dtype) -> None:
+        self.taps = taps
+        self.delay = len(taps) // 2  # same-mode 중심 지연 (샘플)
+        self._work_dtype = np.dtype(work_dtype)
+        self._out_dtype = np.dtype(out_dtype)
+        self.reset()
+
+    def reset(self) -> None:
+        # 왼쪽 zero-padding: x[0]의 이력 위치가 L-1-center 가 되도록 0을 채운다
+        L = len(self.taps)
+        self._history = np.zeros(L - 1 - self.delay, dtype=self._work_dtype)
+        self._consumed = 0
+
+    # 누산값 -> 출력 (ideal: 그대로, fixed: wrap/반올림/포화)
+    def _finish(self, acc: np.ndarray) -> np.ndarray:
+        return acc
+
+    def _push(self, x: np.ndarray) -> np.ndarray:
+        L = len(self.taps)
+        buf = np.concatenate((self._history, x.astype(self._work_dtype, copy=False)))
+        if len(buf) < L:
+            self._history = buf
+            return np.empty(0, dtype=self._out_dtype)
+        self._history = buf[len(buf) - (L - 1) :].copy()
+        return self._finish(_valid_mac(buf, self.taps, self._work_dtype))
+
+    def process(self, chunk) -> np.ndarray:
+        x = _preprocess_chunk(chunk, self._consumed)
+        self._consumed += len(x)
+        return self._push(x)
+
+    def flush(self) -> np.ndarray:
+        y = self._push(np.zeros(self.delay, dtype=self._work_dtype))
+        self.reset()
+        return y
+
+    def run(self, chunks: Iterable) -> Iterator[np.ndarray]:
+        for chunk in chunks:
+            yield self.process(chunk)
+        yield self.flush()
+
+
+class StreamingIdealFir(StreamingFir):
+    """
+    fir_1d_ideal_np(x, h)의 streaming 버전 (direct 경로와 bit-identical, float64 출력)
+
+    탭 순서 누산과 0 가산 생략/가산의 결과가 같으므로 청크 경계와 무관하게
+    전체 신호의 direct 결과와 모든 출력이 bit-identical 하다.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, h: Sequence[float]) -> None:
+        plan = get_ideal_plan(h)  # 계수 검증 (plan 캐시 재사용)
+        super().__init__(plan.taps, np.float64, np.float64)
+
+
+class StreamingFixedFir(StreamingFir):
+    """
+    fir_1d_fixed_golden(x, h, ...)의 streaming 버전 (bit-exact, uint8 출력)
+
+    누산은 plan의 정적 범위 분석이 고른 작업 dtype에서 수행하고, wrap이 항등으로
+    증명된 설정은 wrap을 생략한다. 이력은 작업 dtype으로 L-1개만 유지한다.
+    """
+
+    __slots__ = ("frac_bits", "acc_bits", "_wrap")
+
+    def __init__(
+        self,
+        h: Sequence[float],
+        frac_bits: int = 12,
+        acc_bits: int = 32,
+        coeff_bits: int = 16,
+    ) -> None:
+        plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+        if not plan._int64_safe:
+            raise ValueError(
+                "Streaming requires an int64-safe accumulator: "
+                f"255 * sum(|h_fixed|) must be < 2^63 (h={plan.h})."
+            )
+        self.frac_bits = frac_bits
+        self.acc_bits = acc_bits
+        self._wrap = plan.range_info["wrap_possible"]
+        work = plan._work_dtype
+        super().__init__(plan._taps_i64.astype(work), work, np.uint8)
+
+    def _finish(self, acc: np.ndarray) -> npt.NDArray[np.uint8]:
+        return _fixed_postprocess(acc, self.frac_bits, self.acc_bits, wrap=self._wrap)
@@ -0,0 +1,168 @@
+# File: fir_1d_sweep.py
+# Role: 여러 (frac_bits, acc_bits, coeff_bits) 설정의 fixed 출력을 입력 1회 준비로 평가하는 sweep 엔진을 제공한다.
+from collections.abc import Iterable, Sequence
+from itertools import product
+from typing import Any
+
+import numpy as np
+
+from .fir_1d_bank import _bank_mac, _bank_shifts, _shifted_views
+from .fir_1d_fixed_ref import MAX_PIXEL, _fixed_postprocess, get_fixed_plan
+from .fir_1d_ref import _prepare_x_2d, fir_1d_ideal_2d
+
+# (frac_bits, acc_bits, coeff_bits)
+BitConfig = tuple[int, int, int]
+
+
+def bit_width_grid(
+    frac_bits: Iterable[int],
+    acc_bits: Iterable[int],
+    coeff_bits: Iterable[int],
+) -> list[BitConfig]:
+    return [tuple(cfg) for cfg in product(frac_bits, acc_bits, coeff_bits)]
+
+
+# 리포트 생성기(_compute_metrics)와 같은 정의의 오차/포화 지표
+# diff/abs_buf는 설정마다 재사용하는 float64 작업 버퍼 (y_ideal과 같은 shape)
+def _sweep_metrics(
+    y_ideal: np.ndarray,
+    y_fixed: np.ndarray,
+    diff: np.ndarray,
+    abs_buf: np.ndarray,
+) -> dict[str, float | int]:
+    size = y_fixed.size
+    if size == 0:
+        return {
+            "num_samples": 0,
+            "max_abs_err": 0.0,
+            "mae": 0.0,
+            "rmse": 0.0,
+            "mean_err": 0.0,
+            "sat_low_ratio": 0.0,
+            "sat_high_ratio": 0.0,
+            "sat_ratio": 0.0,
+        }
+    np.subtract(y_fixed, y_ideal, out=diff)
+    np.abs(diff, out=abs_buf)
+    flat = diff.reshape(-1)
+    sat_low_ratio = np.count_nonzero(y_fixed == 0) / size
+    sat_high_ratio = np.count_nonzero(y_fixed == MAX_PIXEL) / size
+    return {
+        "num_samples": int(size),
+        "max_abs_err": float(abs_buf.max()),
+        "mae": float(abs_buf.sum() / size),
+        "rmse": float(np.sqrt(np.dot(flat, flat) / size)),
+        "mean_err": float(flat.sum() / size),
+        "sat_low_ratio": sat_low_ratio,
+        "sat_high_ratio": sat_high_ratio,
+        "sat_ratio": sat_low_ratio + sat_high_ratio,
+    }
+
+
+def fir_1d_fixed_sweep(
+    x_u8,
+    h: Sequence[float],
+    configs: Sequence[BitConfig],
+    *,
+    reference: np.ndarray | None = None,
+    keep_outputs: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    하나의 입력/계수에 대해 여러 비트 설정의 fixed golden 출력을 평가한다.
+
+    공유되는 작업:
+    - 입력 검증/전처리와 zero-padding shift 뷰 (1회)
+    - ideal 기준 출력 (reference 미지정 시 1회 계산)
+    - wrap 이전 누산값: 같은 h_fixed(= 같은 frac_bits/coeff_bits 양자화 결과)끼리 1회
+    - 후처리 결과와 지표: wrap이 항등인 acc_bits 설정끼리 1회
+    누산/후처리는 plan의 정적 범위 분석(range_info)이 고른 작업 dtype으로 수행한다.
+    누산값은 그 h_fixed를 쓰는 마지막 설정이 끝나면 해제하고, 출력은 keep_outputs일 때만
+    보관하므로 keep_outputs=False면 메모리는 설정 수와 무관하다 (지표 행만 누적).
+    각 설정의 출력은 fir_1d_fixed_golden_2d(x_u8, h, *config)와 bit-exact 하다.
+
+    Args:
+        x_u8: H x W 입력 행렬
+        h: 실수 필터 계수
+        configs: (frac_bits, acc_bits, coeff_bits) 목록 (bit_width_grid 참고)
+        reference: 지표 계산용 기준 출력 (기본: fir_1d_ideal_2d(x_u8, h))
+        keep_outputs: True면 결과에 "output"(H x W uint8)을 포함
+
+    Returns:
+        설정 순서대로의 dict 목록.
+        {"frac_bits", "acc_bits", "coeff_bits", "status": "ok" | "invalid", "error",
+         "wraps": wrap 발생 가능 여부, 지표(max_abs_err, mae, rmse, mean_err, sat_*_ratio),
+         ["output"]}
+        계수가 해당 Q-format 범위를 벗어나는 등 잘못된 설정은 status="invalid"와
+        error 메시지만 기록하고 나머지 설정은 계속 평가한다.
+    """
+    x = _prepare_x_2d(x_u8).astype(np.uint8, copy=False)
+    y_ideal = fir_1d_ideal_2d(x, h) if reference is None else np.asarray(reference, dtype=np.float64)
+    if y_ideal.shape != x.shape:
+        raise ValueError(f"Shape mismatch: reference={y_ideal.shape}, x={x.shape}")
+
+    # 설정별 plan (잘못된 설정은 예외) + 누산값 key별 마지막 사용 위치 (이후 누산값 해제)
+    plans: list[Any] = []
+    last_use: dict[tuple[bytes, int], int] = {}
+    for i, (frac_bits, acc_bits, coeff_bits) in enumerate(configs):
+        try:
+            plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+        except ValueError as e:
+            plans.append(e)
+            continue
+        plans.append(plan)
+        last_use[(plan._taps_i64.tobytes(), frac_bits)] = i
+
+    shifts = _bank_shifts([len(h)])
+    views: dict[type, dict[int, np.ndarray]] = {}  # 누산 dtype별 shift 뷰 (필요할 때 1회 생성)
+    tmps: dict[type, np.ndarray] = {}
+    diff = np.empty(x.shape, dtype=np.float64)
+    abs_buf = np.empty(x.shape, dtype=np.float64)
+    acc_cache: dict[tuple[bytes, int], np.ndarray] = {}
+    # 출력은 keep_outputs일 때만 보관한다 (아니면 지표만: 메모리는 설정 수와 무관)
+    out_cache: dict[tuple[bytes, int, int | None], tuple[np.ndarray | None, dict[str, Any]]] = {}
+
+    results: list[dict[str, Any]] = []
+    for i, ((frac_bits, acc_bits, coeff_bits), plan) in enumerate(zip(configs, plans)):
+        entry: dict[str, Any] = {
+            "frac_bits": frac_bits,
+            "acc_bits": acc_bits,
+            "coeff_bits": coeff_bits,
+            "status": "ok",
+            "error": None,
+        }
+        if isinstance(plan, ValueError):
+            entry.update(status="invalid", error=str(plan))
+            results.append(entry)
+            continue
+
+        h_key = plan._taps_i64.tobytes()
+        acc_key = (h_key, frac_bits)
+        wraps = plan.range_info["wrap_possible"]
+        out_key = (h_key, frac_bits, acc_bits if wraps else None)
+        cached = out_cache.get(out_key)
+        if cached is None:
+            if not plan._int64_safe:
+                y = plan._apply_u8(x)  # 참조 루프 fallback
+            else:
+                acc_dtype = plan._work_dtype.type
+                acc = acc_cache.get(acc_key)
+                if acc is None:
+                    if acc_dtype not in views:
+                        views[acc_dtype] = _shifted_views(x, shifts, acc_dtype)
+                        tmps[acc_dtype] = np.empty(x.shape, dtype=acc_dtype)
+                    acc = np.zeros(x.shape, dtype=acc_dtype)
+                    _bank_mac(views[acc_dtype], plan._taps_i64.astype(acc_dtype), acc, tmps[acc_dtype])
+                    acc_cache[acc_key] = acc
+                y = _fixed_postprocess(acc, frac_bits, acc_bits, wrap=wraps)
+            cached = (y if keep_outputs else None, _sweep_metrics(y_ideal, y, diff, abs_buf))
+            out_cache[out_key] = cached
+        if last_use[acc_key] == i:
+            acc_cache.pop(acc_key, None)
+        y, metrics = cached
+
+        entry["wraps"] = wraps
+        entry.update(metrics)
+        if keep_outputs:
+            entry["output"] = y
+        results.append(entry)
+    return results
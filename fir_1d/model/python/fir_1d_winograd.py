@@ -0,0 +1,161 @@
+# File: fir_1d_winograd.py
+# Role: 짧은 커널용 Winograd F(m, r) minimal-filtering ideal 엔진과 벤치마크를 제공한다.
+from fractions import Fraction
+from functools import lru_cache
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+# 타일당 출력 수 m. 3탭은 F(4,3)(6곱/4출력), 5탭은 F(4,5)(8곱/4출력)
+WINOGRAD_TILE_OUTPUTS = 4
+
+# Toom-Cook 보간점 (무한대 점 1개는 별도). 크기가 작은 점부터 써서 변환 계수 증폭을 줄인다.
+_WINOGRAD_POINTS = tuple(
+    Fraction(p) for p in ("0", "1", "-1", "2", "-2", "1/2", "-1/2", "3", "-3")
+)
+
+# 타일 길이 n = m + r - 1 의 상한 (유한 점 수 + 무한대 점). 이를 넘는 커널은 direct로 fallback
+WINOGRAD_MAX_TILE = len(_WINOGRAD_POINTS) + 1
+
+# direct 대비 허용 최대 절대 편차: 계수 검증 범위(|h| <= MAX_ABS_H_COEFF = 8.0)와 0~255 입력,
+# 지원 탭 수(winograd_supported) 기준 변환 반올림 오차 상한 (측정 최댓값 ~1e-10, |y| <= 255 * sum|h|)
+WINOGRAD_MAX_ABS_DEV_TOL = 1e-6
+
+
+def winograd_supported(num_taps: int, m: int = WINOGRAD_TILE_OUTPUTS) -> bool:
+    return num_taps >= 2 and m + num_taps - 1 <= WINOGRAD_MAX_TILE
+
+
+# Fraction 정방행렬의 역행렬 (Gauss-Jordan, 정확 연산)
+def _fraction_inverse(mat: list[list[Fraction]]) -> list[list[Fraction]]:
+    n = len(mat)
+    aug = [row[:] + [Fraction(int(i == j)) for j in range(n)] for i, row in enumerate(mat)]
+    for col in range(n):
+        pivot = next(r for r in range(col, n) if aug[r][col] != 0)
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        inv_p = 1 / aug[col][col]
+        aug[col] = [v * inv_p for v in aug[col]]
+        for r in range(n):
+            if r != col and aug[r][col] != 0:
+                f = aug[r][col]
+                aug[r] = [a - f * b for a, b in zip(aug[r], aug[col])]
+    return [row[n:] for row in aug]
+
+
+# n개 점(마지막은 무한대)에서의 다항식 평가 행렬 (n x cols)
+def _eval_matrix(points: tuple[Fraction, ...], cols: int) -> list[list[Fraction]]:
+    rows = [[p**j for j in range(cols)] for p in points]
+    rows.append([Fraction(int(j == cols - 1)) for j in range(cols)])
+    return rows
+
+
+@lru_cache(maxsize=None)
+def winograd_matrices(m: int, r: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    상관(correlation) 형태 F(m, r) 변환 행렬 (A^T, G, B^T)
+
+    y[i] = sum_{k<r} g[k] * d[i + k] (i < m, 타일 입력 d 길이 n = m + r - 1) 일 때
+    y = A^T [(G g) * (B^T d)] 이며 원소곱 n개로 m개 출력을 만든다.
+    Toom-Cook 선형 컨볼루션 C = V_n^-1 diag(V_r g) V_m 의 전치로 구성하고,
+    Fraction으로 정확히 계산한 뒤 float64로 변환한다.
+    """
+    n = m + r - 1
+    if m < 1 or r < 1 or n > WINOGRAD_MAX_TILE:
+        raise ValueError(f"Unsupported Winograd tile F({m},{r}): m + r - 1 must be <= {WINOGRAD_MAX_TILE}.")
+
+    points = _WINOGRAD_POINTS[: n - 1]
+    v_n = _eval_matrix(points, n)
+    v_n_inv = _fraction_inverse(v_n)
+
+    a_t = np.array(_eval_matrix(points, m), dtype=np.float64).T            # m x n
+    g = np.array(_eval_matrix(points, r), dtype=np.float64)                # n x r
+    b_t = np.array(v_n_inv, dtype=np.float64).T                            # n x n
+    for arr in (a_t, g, b_t):
+        arr.setflags(write=False)
+    return a_t, g, b_t
+
+
+def _winograd_same_mode(x: np.ndarray, taps: np.ndarray, m: int = WINOGRAD_TILE_OUTPUTS) -> np.ndarray:
+    """
+    same-mode(center = L//2, zero-padding) FIR을 Winograd F(m, L)로 계산 (마지막 축 = 샘플 축)
+
+    y[n] = sum_k h[k] x[n-k+c] = sum_j g[j] x_pad[n+j] (g = h 역순, 왼쪽 L-1-c 제로 패딩)
+    행을 m출력 타일로 나누고, 마지막 타일의 남는 출력은 잘라낸다.
+    """
+    lead = x.shape[:-1]
+    width = x.shape[-1]
+    L = len(taps)
+    center = L // 2
+    if width == 0:
+        return np.zeros(x.shape, dtype=np.float64)
+
+    a_t, g_mat, b_t = winograd_matrices(m, L)
+    n = m + L - 1
+    num_tiles = -(-width // m)
+    left = L - 1 - center
+
+    x_pad = np.zeros(lead + (num_tiles * m + L - 1,), dtype=np.float64)
+    x_pad[..., left : left + width] = x
+    tiles = np.lib.stride_tricks.sliding_window_view(x_pad, n, axis=-1)[..., ::m, :]
+
+    u = g_mat @ taps[::-1]                 # 필터 변환 (n,), plan마다 상수
+    v = tiles @ b_t.T                      # 입력 변환 (..., tiles, n)
+    v *= u                                 # 원소곱 n개 / 타일
+    y = v @ a_t.T                          # 출력 변환 (..., tiles, m)
+    return y.reshape(lead + (num_tiles * m,))[..., :width]
+
+
+def measure_winograd_speedup(
+    *,
+    width: int = 1024,
+    rows: int = 64,
+    taps_grid: tuple[int, ...] = (3, 5, 7),
+    tile_grid: tuple[int, ...] = (2, 4),
+    repeat: int = 5,
+    seed: int = 0,
+) -> dict[str, Any]:
+    """
+    direct(탭 단위 벡터화) vs Winograd F(m, r) 실행 시간과 편차를 측정한다.
+
+    Returns:
+        {"width", "rows", "timings": [{"num_taps", "tile_outputs", "mults_per_output",
+         "direct_s", "winograd_s", "speedup", "max_abs_dev"}...]}
+        mults_per_output은 Winograd 원소곱 수 / m (direct는 num_taps)
+    """
+    from .fir_1d_ref import _same_mode_mac
+
+    rng = np.random.default_rng(seed)
+    x = rng.integers(0, 256, size=(rows, width)).astype(np.float64)
+
+    def _best(fn) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = perf_counter()
+            fn()
+            best = min(best, perf_counter() - t0)
+        return best
+
+    timings = []
+    for L in taps_grid:
+        taps = rng.uniform(-1.0, 1.0, size=L)
+        y_direct = _same_mode_mac(x, taps, np.float64)
+        direct_s = _best(lambda: _same_mode_mac(x, taps, np.float64))
+        for m in tile_grid:
+            if not winograd_supported(L, m):
+                continue
+            y_wino = _winograd_same_mode(x, taps, m)
+            winograd_s = _best(lambda: _winograd_same_mode(x, taps, m))
+            timings.append(
+                {
+                    "num_taps": int(L),
+                    "tile_outputs": int(m),
+                    "mults_per_output": (m + L - 1) / m,
+                    "direct_s": direct_s,
+                    "winograd_s": winograd_s,
+                    "speedup": direct_s / winograd_s,
+                    "max_abs_dev": float(np.abs(y_wino - y_direct).max()),
+                }
+            )
+
+    return {"width": width, "rows": rows, "timings": timings}
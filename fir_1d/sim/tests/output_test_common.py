@@ -88,3 +88,42 @@ def assert_shape_dtype_and_range(
     assert y.dtype == expected_dtype
     if value_min is not None and value_max is not None:
         assert np.all((y >= value_min) & (y <= value_max))
+
+
+# 파이프라인 테스트용 작은 회색조 이미지 2장 (img_0: 6x9, img_1: 5x7)
+def make_pipeline_images(image_dir: Path, seed: int = 3) -> None:
+    from PIL import Image
+
+    image_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    for i, shape in enumerate([(6, 9), (5, 7)]):
+        img = rng.integers(0, 256, size=shape, dtype=np.uint8)
+        Image.fromarray(img, mode="L").save(image_dir / f"img_{i}.bmp")
+
+
+# root 아래 img/input/output/output_img 디렉터리로 3탭 파이프라인 실행
+def run_pipeline_in(root: Path, **overrides: Any) -> dict[str, Any]:
+    from pipeline_fir_1d import run_pipeline
+
+    options: dict[str, Any] = dict(
+        tap="3",
+        overwrite_vectors=False,
+        skip_input=False,
+        skip_ideal=False,
+        skip_fixed=False,
+        skip_report=False,
+        skip_restore=False,
+        restore_kind="all",
+        ideal_policy="clip",
+        overwrite_images=False,
+        strict_report=True,
+        strict_restore=False,
+        top_k=3,
+        workers=1,
+        image_dir=root / "img",
+        input_dir=root / "input",
+        vector_output_dir=root / "output",
+        output_img_dir=root / "output_img",
+    )
+    options.update(overrides)
+    return run_pipeline(**options)
@@ -0,0 +1,46 @@
+# File: test_1d_bank.py
+# Role: filter-bank 엔진이 계수 세트별 단일 실행 결과와 일치하는지 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_bank import _bank_shifts, fir_1d_fixed_bank, fir_1d_ideal_bank
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_ref import fir_1d_ideal_2d
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+
+ALL_KERNELS = list(h_coeff_3tap_map.values()) + list(h_coeff_5tap_map.values())
+
+
+def _sample_image() -> np.ndarray:
+    rng = np.random.default_rng(11)
+    return rng.integers(0, 256, size=(7, 33), dtype=np.uint8)
+
+
+def test_both_tap_maps_share_five_shifts():
+    assert _bank_shifts([len(h) for h in ALL_KERNELS]) == [-2, -1, 0, 1, 2]
+
+
+def test_ideal_bank_is_bit_identical_to_single_filter_runs():
+    x = _sample_image()
+    y = fir_1d_ideal_bank(x, ALL_KERNELS)
+
+    assert y.shape == x.shape + (len(ALL_KERNELS),)
+    assert y.dtype == np.float64
+    for f, h in enumerate(ALL_KERNELS):
+        assert np.array_equal(y[:, :, f], fir_1d_ideal_2d(x, h))
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (6, 10, 8)])
+def test_fixed_bank_is_bit_exact_with_single_filter_runs(frac_bits, acc_bits, coeff_bits):
+    x = _sample_image()
+    y = fir_1d_fixed_bank(
+        x, ALL_KERNELS, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits
+    )
+
+    assert y.shape == x.shape + (len(ALL_KERNELS),)
+    assert y.dtype == np.uint8
+    for f, h in enumerate(ALL_KERNELS):
+        expected = fir_1d_fixed_golden_2d(
+            x, h, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits
+        )
+        assert np.array_equal(y[:, :, f], expected)
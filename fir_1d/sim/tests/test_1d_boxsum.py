@@ -0,0 +1,69 @@
+# File: test_1d_boxsum.py
+# Role: box(동일 계수) 커널의 누적합 엔진을 loop 기준 모델과 비교 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_boxsum import _box_window_sum, is_box_kernel
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden_2d, get_fixed_plan
+from fir_1d.model.python.fir_1d_ref import _same_mode_mac, fir_1d_ideal_2d, get_ideal_plan
+
+
+def test_is_box_kernel():
+    assert is_box_kernel([0.2] * 5)
+    assert not is_box_kernel([0.2])
+    assert not is_box_kernel([0.25, 0.5, 0.25])
+
+
+@pytest.mark.parametrize("num_taps", [2, 3, 4, 5, 8, 31, 64])
+@pytest.mark.parametrize("width", [1, 3, 17, 100])
+def test_box_window_sum_matches_same_mode_mac(num_taps, width):
+    rng = np.random.default_rng(num_taps * 1000 + width)
+    x = rng.integers(0, 256, size=(3, width)).astype(np.int64)
+
+    expected = _same_mode_mac(x, np.ones(num_taps, dtype=np.int64), np.int64)
+    np.testing.assert_array_equal(_box_window_sum(x, num_taps), expected)
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (12, 14, 16), (7, 12, 8)])
+@pytest.mark.parametrize("num_taps", [3, 5, 64])
+def test_fixed_boxsum_is_bit_exact_including_wrap(num_taps, frac_bits, acc_bits, coeff_bits):
+    # acc_bits=14/12 조합은 누산 wrap이 실제로 발생하는 설정
+    rng = np.random.default_rng(num_taps)
+    x = rng.integers(0, 256, size=(4, 200), dtype=np.uint8)
+    h = [1.0 / num_taps] * num_taps
+
+    plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+    assert plan.is_box
+    np.testing.assert_array_equal(plan.apply_batch(x, method="boxsum"), plan.apply_batch(x, method="loop"))
+
+
+def test_fixed_boxsum_falls_back_for_non_box_kernel():
+    x = np.arange(60, dtype=np.uint8).reshape(3, 20)
+    h = [0.25, 0.5, 0.25]
+
+    plan = get_fixed_plan(h)
+    assert not plan.is_box
+    np.testing.assert_array_equal(plan.apply_batch(x, method="boxsum"), fir_1d_fixed_golden_2d(x, h))
+
+
+@pytest.mark.parametrize("num_taps", [5, 9, 63, 255])
+def test_ideal_boxsum_within_documented_bound(num_taps):
+    rng = np.random.default_rng(num_taps)
+    x = rng.integers(0, 256, size=(4, 300), dtype=np.uint8)
+    h = [1.0 / num_taps] * num_taps
+
+    plan = get_ideal_plan(h)
+    assert plan.resolve_method(x.shape[1], "auto") == "boxsum"
+
+    y_box = fir_1d_ideal_2d(x, h, method="boxsum")
+    y_direct = fir_1d_ideal_2d(x, h, method="direct")
+    window = _box_window_sum(x.astype(np.int64), num_taps)
+    bound = num_taps * 2.0**-52 * abs(h[0]) * window
+    assert np.all(np.abs(y_box - y_direct) <= bound)
+
+
+def test_ideal_auto_prefers_dyadic_for_dyadic_box():
+    # 0.125 x 8 은 dyadic 이므로 bit-identical 경로가 우선
+    plan = get_ideal_plan([0.125] * 8)
+    assert plan.resolve_method(100, "auto") == "dyadic"
+    assert plan.resolve_method(100, "boxsum") == "boxsum"
@@ -0,0 +1,87 @@
+# File: test_1d_cascade.py
+# Role: cascade 커널 합성(ideal)과 다단 에뮬레이션(fixed)의 정합성을 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_cascade import (
+    fir_1d_fixed_cascade,
+    fir_1d_ideal_cascade,
+    fuse_kernels,
+    measure_cascade_speedup,
+)
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden, fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_ref import _same_mode_mac
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+
+
+def test_fuse_kernels_for_odd_taps_is_plain_convolution():
+    assert fuse_kernels([[0.25, 0.5, 0.25], [-1.0, 0.0, 1.0]]) == [-0.25, -0.5, 0.0, 0.5, 0.25]
+
+
+@pytest.mark.parametrize(
+    "h_list",
+    [
+        [h_coeff_3tap_map["simple_lp"], h_coeff_3tap_map["sharpen"]],
+        [h_coeff_5tap_map["moving_avg"], h_coeff_3tap_map["edge"]],
+        [h_coeff_3tap_map["sharpen"], h_coeff_3tap_map["sharpen"]],
+        [[0.5, 0.5], [0.5, 0.5]],
+        [[0.1, 0.2, 0.3, 0.4], [1.0, -1.0], [0.2, 0.6, 0.2]],
+        [[0.05] * 20, [0.1] * 11],
+    ],
+)
+def test_ideal_cascade_matches_unclipped_linear_chain(h_list):
+    rng = np.random.default_rng(len(h_list))
+    x = rng.integers(0, 256, size=(3, 100)).astype(np.float64)
+
+    # 경계 절단이 없도록 충분히 zero-padding 한 뒤 단계별 same-mode 적용
+    pad = 32
+    y = np.pad(x, ((0, 0), (pad, pad)))
+    for h in h_list:
+        y = _same_mode_mac(y, np.asarray(h, dtype=np.float64), np.float64)
+    expected = y[:, pad:-pad]
+
+    np.testing.assert_allclose(fir_1d_ideal_cascade(x, h_list), expected, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(fir_1d_ideal_cascade(x[0], h_list), expected[0], rtol=0, atol=1e-9)
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (6, 12, 8)])
+@pytest.mark.parametrize("block_rows", [1, 3, 64])
+def test_fixed_cascade_is_bit_exact_to_sequential(frac_bits, acc_bits, coeff_bits, block_rows):
+    rng = np.random.default_rng(block_rows)
+    x = rng.integers(0, 256, size=(10, 37), dtype=np.uint8)
+    h_list = [
+        h_coeff_3tap_map["simple_lp"],
+        h_coeff_3tap_map["sharpen"],
+        h_coeff_5tap_map["edge"],
+    ]
+
+    expected = x
+    for h in h_list:
+        expected = fir_1d_fixed_golden_2d(expected, h, frac_bits, acc_bits, coeff_bits)
+    y = fir_1d_fixed_cascade(x, h_list, frac_bits, acc_bits, coeff_bits, block_rows=block_rows)
+
+    assert np.array_equal(y, expected)
+
+
+def test_fixed_cascade_accepts_1d_row():
+    x = [0, 10.4, 300, 128, 64, -5, 200]
+    h_list = [h_coeff_3tap_map["simple_lp"], h_coeff_3tap_map["sharpen"]]
+    expected = fir_1d_fixed_golden(fir_1d_fixed_golden(x, h_list[0]), h_list[1])
+
+    assert np.array_equal(fir_1d_fixed_cascade(x, h_list), expected)
+
+
+def test_cascade_rejects_empty_h_list():
+    with pytest.raises(ValueError, match="h_list"):
+        fir_1d_ideal_cascade([1, 2, 3], [])
+    with pytest.raises(ValueError, match="h_list"):
+        fir_1d_fixed_cascade(np.zeros((2, 3), dtype=np.uint8), [])
+
+
+def test_measure_cascade_speedup_report_keys():
+    x = np.zeros((8, 32), dtype=np.uint8)
+    report = measure_cascade_speedup(x, [[0.25, 0.5, 0.25], [-1.0, 0.0, 1.0]], repeat=1)
+
+    assert report["stages"] == 2
+    assert report["fused_taps"] == 5
+    assert set(report["fixed"]) == {"sequential_s", "cascade_s", "speedup", "mpix_per_s"}
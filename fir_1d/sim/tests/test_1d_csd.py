@@ -0,0 +1,49 @@
+# File: test_1d_csd.py
+# Role: CSD 분해, shift-add 엔진의 bit-exact 여부, 비용 표를 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_csd import csd_cost, csd_cost_table, csd_digits
+from fir_1d.model.python.fir_1d_fixed_ref import get_fixed_plan
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+
+
+@pytest.mark.parametrize("value", [0, 1, -1, 3, 7, -7, 1024, -1024, 1365, 5120, -32768, 32767])
+def test_csd_digits_reconstruct_value_without_adjacent_digits(value):
+    digits = csd_digits(value)
+
+    assert sum(sign * (1 << shift) for shift, sign in digits) == value
+    shifts = [shift for shift, _ in digits]
+    assert all(b - a >= 2 for a, b in zip(shifts, shifts[1:]))
+
+
+def test_csd_cost_for_edge_and_simple_lp():
+    # edge: [-1024, 0, 1024] -> 0 탭 1개 생략, 항 2개
+    edge = csd_cost(get_fixed_plan(h_coeff_3tap_map["edge"]).h_fixed)
+    assert edge["zero_taps"] == 1
+    assert edge["nonzero_digits"] == 2
+    assert edge["adders"] == 1
+
+    # simple_lp: [1024, 2048, 1024] -> 모두 2의 거듭제곱
+    lp = csd_cost(get_fixed_plan(h_coeff_3tap_map["simple_lp"]).h_fixed)
+    assert lp["nonzero_digits"] == 3
+    assert lp["multipliers_replaced"] == 3
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (7, 12, 8), (20, 40, 32)])
+def test_csd_method_is_bit_exact_for_all_tap_maps(frac_bits, acc_bits, coeff_bits):
+    rng = np.random.default_rng(frac_bits)
+    x = rng.integers(0, 256, size=(3, 21), dtype=np.uint8)
+    limit = ((1 << (coeff_bits - 1)) - 1) / (1 << frac_bits)
+
+    for h in list(h_coeff_3tap_map.values()) + list(h_coeff_5tap_map.values()):
+        h = [min(max(c, -limit), limit) for c in h]
+        plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+        assert np.array_equal(plan.apply_batch(x, method="csd"), plan.apply_batch(x, method="loop"))
+
+
+def test_csd_cost_table_covers_both_tap_maps():
+    table = csd_cost_table({"3tap": h_coeff_3tap_map, "5tap": h_coeff_5tap_map})
+
+    assert set(table) == {"3tap", "5tap"}
+    assert set(table["5tap"]) == set(h_coeff_5tap_map)
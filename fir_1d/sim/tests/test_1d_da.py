@@ -0,0 +1,65 @@
+# File: test_1d_da.py
+# Role: LUT / 분산 산술(DA) fixed 엔진을 loop 기준 모델과 비교하고 DA 구조 모델 값을 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_da import _da_mac, da_structure, da_tables
+from fir_1d.model.python.fir_1d_fixed_ref import get_fixed_plan
+from fir_1d.model.python.fir_1d_ref import _same_mode_mac
+
+SHARPEN = [-1 / 16, -4 / 16, 26 / 16, -4 / 16, -1 / 16]
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (12, 14, 16), (6, 12, 8)])
+@pytest.mark.parametrize("num_taps", [1, 2, 3, 5, 6, 7, 13])
+@pytest.mark.parametrize("method", ["lut", "da"])
+def test_lut_and_da_are_bit_exact_including_wrap(method, num_taps, frac_bits, acc_bits, coeff_bits):
+    # 7/13탭은 DA 파티션이 2~3개로 나뉘는 구성, acc_bits=14/12는 wrap이 실제로 발생하는 설정
+    rng = np.random.default_rng(num_taps)
+    x = rng.integers(0, 256, size=(4, 150), dtype=np.uint8)
+    h = (rng.uniform(-1.0, 1.0, size=num_taps) / num_taps).tolist()
+
+    plan = get_fixed_plan(h, frac_bits, acc_bits, coeff_bits)
+    np.testing.assert_array_equal(plan.apply_batch(x, method=method), plan.apply_batch(x, method="loop"))
+
+
+@pytest.mark.parametrize("addr_bits", [1, 2, 4, 8])
+def test_da_mac_matches_same_mode_mac_for_any_partitioning(addr_bits):
+    rng = np.random.default_rng(addr_bits)
+    x = rng.integers(0, 256, size=(2, 40), dtype=np.uint8)
+    h_fixed = rng.integers(-300, 300, size=9)
+
+    expected = _same_mode_mac(x.astype(np.int64), h_fixed.astype(np.int64), np.int64)
+    tables = da_tables(h_fixed, addr_bits)
+    np.testing.assert_array_equal(_da_mac(x, tables, len(h_fixed), addr_bits), expected)
+
+
+def test_da_tables_reject_invalid_addr_bits():
+    with pytest.raises(ValueError, match="addr_bits"):
+        da_tables(np.array([1, 2, 3]), 0)
+
+
+def test_da_structure_for_sharpen():
+    plan = get_fixed_plan(SHARPEN, 6, 32, 8)
+    info = da_structure(plan.h_fixed)
+
+    # h_fixed = [-4, -16, 104, -16, -4]: 5탭 1개 파티션, 테이블 값 범위 [-40, 104] -> 8비트
+    assert info["partitions"] == [{"taps": 5, "entries": 32, "word_bits": 8}]
+    assert info["lut_bits"] == 32 * 8
+    assert info["multipliers"] == 0
+    assert info["cycles_per_output"] == 8
+
+
+def test_da_structure_splits_long_kernels():
+    info = da_structure(np.arange(1, 14), addr_bits=6)
+    assert [p["taps"] for p in info["partitions"]] == [6, 6, 1]
+    assert info["lut_entries"] == 64 + 64 + 2
+    assert info["adders"] == 3
+
+
+def test_run_info_reports_table_engines_on_narrow_dtype():
+    plan = get_fixed_plan([0.25, 0.5, 0.25], 12, 32, 16)
+    for method in ("lut", "da"):
+        info = plan.run_info(method)
+        assert info["engine"] == method
+        assert info["work_dtype"] == "int32"
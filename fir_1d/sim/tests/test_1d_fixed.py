@@ -3,7 +3,12 @@
 import numpy as np
 import pytest
 
-from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden
+from fir_1d.model.python.fir_1d_fixed_ref import (
+    FixedFirPlan,
+    fir_1d_fixed_golden,
+    fir_1d_fixed_golden_2d,
+    get_fixed_plan,
+)
 
 
 def test_same_mode_center_aligned_q412_exact_case():
@@ -102,3 +107,206 @@ def test_output_contract_dtype_length_and_range():
     assert result.dtype == np.uint8
     assert len(result) == len(x)
     assert np.all((result >= 0) & (result <= 255))
+
+
+@pytest.mark.parametrize(
+    ("frac_bits", "acc_bits", "coeff_bits"),
+    [
+        (12, 32, 16),
+        (7, 16, 8),
+        (4, 8, 8),
+        (12, 12, 16),
+        (1, 1, 8),
+        (20, 24, 32),
+        (30, 63, 32),
+        (12, 64, 16),
+        (12, 80, 16),
+    ],
+)
+def test_direct_method_is_bit_exact_with_loop_reference(frac_bits, acc_bits, coeff_bits):
+    rng = np.random.default_rng(frac_bits * 1000 + acc_bits)
+    x = rng.integers(0, 256, size=37)
+    scale = 1 << frac_bits
+    max_real = ((1 << (coeff_bits - 1)) - 1) / scale
+    min_real = -(1 << (coeff_bits - 1)) / scale
+    lo = max(min_real, -8.0)
+    hi = min(max_real, 8.0)
+
+    for taps in (1, 2, 3, 5, 8):
+        h = rng.uniform(lo, hi, size=taps).tolist()
+        expected = fir_1d_fixed_golden(
+            x, h, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits, method="loop"
+        )
+        result = fir_1d_fixed_golden(
+            x, h, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits
+        )
+        assert np.array_equal(result, expected)
+
+
+def test_direct_method_handles_taps_longer_than_input():
+    x = [200, 10, 90]
+    h = [0.1, -0.3, 0.5, 0.7, -0.2, 0.05, 0.4]
+
+    expected = fir_1d_fixed_golden(x, h, method="loop")
+    assert np.array_equal(fir_1d_fixed_golden(x, h), expected)
+
+
+def test_invalid_method_raises_value_error():
+    with pytest.raises(ValueError, match="Invalid method=fast"):
+        fir_1d_fixed_golden([10, 20], [0.5], method="fast")
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (7, 12, 8)])
+def test_2d_api_matches_rowwise_golden(frac_bits, acc_bits, coeff_bits):
+    rng = np.random.default_rng(7)
+    x = rng.integers(0, 256, size=(6, 19), dtype=np.uint8)
+    h = [-0.125, 0.75, -0.5]
+
+    result = fir_1d_fixed_golden_2d(
+        x, h, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits
+    )
+
+    assert result.shape == x.shape
+    assert result.dtype == np.uint8
+    for r in range(x.shape[0]):
+        expected = fir_1d_fixed_golden(
+            x[r, :].tolist(),
+            h,
+            frac_bits=frac_bits,
+            acc_bits=acc_bits,
+            coeff_bits=coeff_bits,
+            method="loop",
+        )
+        assert np.array_equal(result[r, :], expected)
+
+
+def test_2d_api_rejects_non_2d_input():
+    with pytest.raises(ValueError, match="expected 2D"):
+        fir_1d_fixed_golden_2d(np.zeros(8, dtype=np.uint8), [0.5])
+
+
+def test_plan_quantizes_once_and_matches_golden():
+    h = [0.25, 0.5, 0.25]
+    plan = FixedFirPlan(h)
+
+    assert plan.h_fixed.tolist() == [1024, 2048, 1024]
+    assert plan.apply([10, 20, 30, 40]).tolist() == [10, 20, 30, 28]
+
+    x = np.arange(24, dtype=np.uint8).reshape(3, 8) * 10
+    assert np.array_equal(plan.apply_batch(x), fir_1d_fixed_golden_2d(x, h))
+
+
+def test_plan_cache_returns_same_object_per_config():
+    h = [-0.125, 1.25, -0.125]
+
+    assert get_fixed_plan(h) is get_fixed_plan(tuple(h))
+    assert get_fixed_plan(h, frac_bits=10) is not get_fixed_plan(h)
+
+
+def test_plan_rejects_invalid_config():
+    with pytest.raises(ValueError, match="Invalid coeff_bits=12"):
+        get_fixed_plan([0.5], coeff_bits=12)
+    with pytest.raises(ValueError, match="out of Q-format real range"):
+        FixedFirPlan([8.0])
+
+
+@pytest.mark.parametrize(
+    ("h", "symmetry", "saved"),
+    [
+        ([0.25, 0.5, 0.25], "symmetric", 1),
+        ([-1.0, 0, 1.0], "antisymmetric", 2),
+        ([1 / 16, 4 / 16, 6 / 16, 4 / 16, 1 / 16], "symmetric", 2),
+        ([-1 / 8, -2 / 8, 0, 2 / 8, 1 / 8], "antisymmetric", 3),
+        ([0.5, 0.5], "symmetric", 1),
+        ([0.5, -0.5, 0.25, -0.25], "none", 0),
+    ],
+)
+def test_folded_method_detects_symmetry_and_is_bit_exact(h, symmetry, saved):
+    rng = np.random.default_rng(len(h))
+    x = rng.integers(0, 256, size=(4, 29), dtype=np.uint8)
+    plan = get_fixed_plan(h)
+
+    assert plan.fold_info["symmetry"] == symmetry
+    assert plan.fold_info["multipliers_saved"] == saved
+    assert np.array_equal(
+        plan.apply_batch(x, method="folded"), plan.apply_batch(x, method="loop")
+    )
+
+
+def test_folded_method_matches_golden_with_accumulator_wrap():
+    x = [255, 255, 255, 0, 255, 255]
+    h = [-7.5, 7.0, -7.5]
+
+    expected = fir_1d_fixed_golden(x, h, acc_bits=16, method="loop")
+    assert np.array_equal(fir_1d_fixed_golden(x, h, acc_bits=16, method="folded"), expected)
+
+
+def test_range_analysis_proves_wrap_and_picks_work_dtype():
+    # [1024, 2048, 1024] -> acc in [0, 255 * 4096] = 21 signed bits
+    plan = get_fixed_plan([0.25, 0.5, 0.25])
+    info = plan.range_info
+    assert (info["acc_min"], info["acc_max"]) == (0, 255 * 4096)
+    assert info["required_bits"] == 21
+    assert not info["wrap_possible"]
+    assert info["work_dtype"] == "int32"
+
+    # Q2.4 계수는 int16 작업 버퍼로 충분
+    assert get_fixed_plan([0.25, 0.5, 0.25], frac_bits=4).range_info["work_dtype"] == "int16"
+
+    # acc_bits가 필요 비트보다 작으면 wrap 에뮬레이션 유지
+    narrow = get_fixed_plan([0.25, 0.5, 0.25], acc_bits=16).range_info
+    assert narrow["wrap_possible"]
+    assert "wrap emulated" in narrow["proof"]
+
+
+@pytest.mark.parametrize("frac_bits", [2, 4, 7, 12])
+@pytest.mark.parametrize("acc_bits", [6, 10, 14, 16, 20, 32])
+def test_narrow_work_dtype_is_bit_exact_with_loop(frac_bits, acc_bits):
+    rng = np.random.default_rng(frac_bits * 100 + acc_bits)
+    x = rng.integers(0, 256, size=(3, 29), dtype=np.uint8)
+
+    for h in ([0.25, 0.5, 0.25], [-0.0625, -0.25, 1.625, -0.25, -0.0625], [-1.0, 0.0, 1.0]):
+        plan = get_fixed_plan(h, frac_bits=frac_bits, acc_bits=acc_bits)
+        y, info = fir_1d_fixed_golden_2d(x, h, frac_bits, acc_bits, return_info=True)
+
+        assert np.array_equal(y, plan.apply_batch(x, method="loop"))
+        assert info["engine"] == "direct"
+        assert info["work_dtype"] == plan.range_info["work_dtype"]
+        assert info["wrap_emulated"] == plan.range_info["wrap_possible"]
+
+
+def test_row_stats_count_wrap_saturation_and_max_acc():
+    # simple_lp Q4.12: 255 입력 -> acc = 255 * 4096 = 1044480 (21비트)
+    x = np.array([[255, 255, 255, 255], [0, 0, 0, 0], [255, 0, 0, 0]], dtype=np.uint8)
+    h = [0.25, 0.5, 0.25]
+
+    y, stats = fir_1d_fixed_golden_2d(x, h, acc_bits=20, return_stats=True)
+
+    assert np.array_equal(y, fir_1d_fixed_golden_2d(x, h, acc_bits=20))
+    assert stats.dtype.names == ("wrap", "sat_low", "sat_high", "max_abs_acc")
+    assert stats["max_abs_acc"].tolist() == [255 * 4096, 0, 255 * 2048]
+    # 20비트 부호 범위(< 2^19): 255 행은 경계(255 * 3072)까지 모두 초과, 3행(255 * 2048)은 범위 안
+    assert stats["wrap"].tolist() == [4, 0, 0]
+    assert stats["sat_low"].tolist() == [4, 0, 0]  # wrap으로 음수가 되어 0으로 포화
+
+    # sharpen: 255 샘플은 255 초과, 그 이웃 0 샘플은 0 미만으로 포화
+    _, sharp = fir_1d_fixed_golden_2d(
+        np.array([[0, 255, 0, 255, 255]], dtype=np.uint8), [-0.125, 1.25, -0.125], return_stats=True
+    )
+    assert sharp["sat_high"].tolist() == [3]
+    assert sharp["sat_low"].tolist() == [2]
+    assert sharp["wrap"].tolist() == [0]
+
+
+@pytest.mark.parametrize("method", ["direct", "loop", "folded", "csd", "boxsum"])
+def test_row_stats_are_engine_independent(method):
+    rng = np.random.default_rng(3)
+    x = rng.integers(0, 256, size=(4, 33), dtype=np.uint8)
+    plan = get_fixed_plan([-0.0625, -0.25, 1.625, -0.25, -0.0625], acc_bits=18)
+
+    y, info, stats = plan.apply_batch(x, method=method, return_info=True, return_stats=True)
+    y_ref, stats_ref = plan.apply_batch(x, return_stats=True)
+
+    assert info["wrap_emulated"]
+    assert np.array_equal(y, y_ref)
+    assert np.array_equal(stats, stats_ref)
@@ -0,0 +1,74 @@
+# File: test_1d_hw.py
+# Role: 사이클 단위 HW 파이프라인 모델의 픽셀 bit-exact 여부와 타이밍 통계를 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_hw import HwPipelineModel, adder_tree_levels, fir_1d_hw_pipeline
+
+SHARPEN = [-1 / 16, -4 / 16, 26 / 16, -4 / 16, -1 / 16]
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (12, 14, 16), (6, 12, 8)])
+@pytest.mark.parametrize(
+    "h", [[1.0], [0.5, 0.5], [0.25, 0.5, 0.25], SHARPEN, [0.1, 0.2, 0.3, 0.4], [0.05] * 20]
+)
+def test_hw_pipeline_pixels_are_bit_exact_including_wrap(h, frac_bits, acc_bits, coeff_bits):
+    # acc_bits=14/12는 가산 트리 중간 wrap이 실제로 발생하는 설정
+    rng = np.random.default_rng(len(h))
+    x = rng.integers(0, 256, size=(5, 77), dtype=np.uint8)
+
+    y, _ = fir_1d_hw_pipeline(x, h, frac_bits, acc_bits, coeff_bits, lanes=4)
+    np.testing.assert_array_equal(y, fir_1d_fixed_golden_2d(x, h, frac_bits, acc_bits, coeff_bits))
+
+
+def test_adder_tree_levels():
+    assert [adder_tree_levels(L) for L in (1, 2, 3, 4, 5, 8, 9)] == [0, 1, 2, 2, 3, 3, 4]
+
+
+def test_schedule_single_lane():
+    # 3탭: delay 1 beat, depth = 입력 1 + 곱셈 1 + 트리 2 + 후처리 1 = 5
+    model = HwPipelineModel([0.25, 0.5, 0.25])
+    report = model.schedule(2, 8)
+
+    assert report["pipeline_depth"] == 5
+    assert report["flush_beats"] == 1
+    assert report["first_output_cycle"] == 1 + 5
+    assert report["total_cycles"] == 2 * 8 + 1 + 5
+    np.testing.assert_array_equal(report["row_latency"], [8 + 1 + 5, 8 + 1 + 5])
+
+
+def test_schedule_multi_lane_and_time_multiplexed_multipliers():
+    # 5탭 x 4 lane = 20 곱셈기 -> 7개로 줄이면 ii = ceil(20 / 7) = 3
+    model = HwPipelineModel(SHARPEN, lanes=4, num_multipliers=7, adder_levels_per_stage=2)
+    report = model.schedule(3, 10, clock_mhz=200.0)
+
+    assert report["ii"] == 3
+    assert report["beats_per_row"] == 3
+    assert report["pipeline_depth"] == 1 + 1 + 2 + 1
+    assert report["peak_pixels_per_cycle"] == pytest.approx(4 / 3)
+    assert report["lane_utilization"] == pytest.approx(30 / 36)
+    # 입력 9 beat + flush 1 beat, 마지막 beat 출력 = 9 * 3 + (3 - 1) + 5
+    assert report["total_cycles"] == 9 * 3 + 2 + 5 + 1
+    assert report["mpix_per_s"] == pytest.approx(30 / report["total_cycles"] * 200.0)
+
+
+def test_row_gap_delays_following_rows_only():
+    base = HwPipelineModel([0.25, 0.5, 0.25]).schedule(3, 16)
+    gap = HwPipelineModel([0.25, 0.5, 0.25], row_gap=4).schedule(3, 16)
+    assert gap["total_cycles"] == base["total_cycles"] + 2 * 4
+    # 다음 행 첫 beat가 지연되므로 행 내부 지연은 마지막 행을 제외하고 gap만큼 늘어난다
+    np.testing.assert_array_equal(gap["row_latency"] - base["row_latency"], [4, 4, 0])
+
+
+def test_structure_counts_resources():
+    info = HwPipelineModel(SHARPEN, lanes=2).structure()
+    assert info["multipliers"] == 10
+    assert info["adders"] == 8
+    assert info["shift_register_samples"] == 6
+
+
+@pytest.mark.parametrize("kwargs", [{"lanes": 0}, {"num_multipliers": 0}, {"row_gap": -1}, {"lanes": True}])
+def test_invalid_config_raises(kwargs):
+    with pytest.raises(ValueError):
+        HwPipelineModel([0.25, 0.5, 0.25], **kwargs)
@@ -1,8 +1,28 @@
 # File: test_1d_ideal.py
 # Role: fir_1d_ideal의 동작, 전처리 규칙, 예외 정책을 단위 테스트한다.
+import numpy as np
 import pytest
 
-from fir_1d.model.python.fir_1d_ref import MAX_ABS_H_COEFF, fir_1d_ideal
+from fir_1d.model.python.fir_1d_fft import (
+    FFT_MAX_ABS_DEV_TOL,
+    fft_deviation_report,
+    select_ideal_method,
+)
+from fir_1d.model.python.fir_1d_ref import (
+    MAX_ABS_H_COEFF,
+    IdealFirPlan,
+    _preprocess_x_fast,
+    _preprocess_x_np,
+    fir_1d_ideal,
+    fir_1d_ideal_2d,
+    fir_1d_ideal_np,
+    get_ideal_plan,
+)
+from fir_1d.model.python.fir_1d_winograd import (
+    WINOGRAD_MAX_ABS_DEV_TOL,
+    winograd_matrices,
+    winograd_supported,
+)
 
 
 def test_same_mode_center_aligned_matches_manual_reference():
@@ -67,3 +87,165 @@ def test_h_magnitude_above_limit_raises_value_error():
 def test_h_limit_boundaries_are_accepted():
     result = fir_1d_ideal([10, 20], [-8.0, 8.0])
     assert len(result) == 2
+
+
+@pytest.mark.parametrize("taps", [1, 2, 3, 4, 5, 9])
+def test_numpy_engine_is_bit_identical_to_loop(taps):
+    rng = np.random.default_rng(taps)
+    x = rng.uniform(-20.0, 280.0, size=41)
+    h = rng.uniform(-MAX_ABS_H_COEFF, MAX_ABS_H_COEFF, size=taps).tolist()
+
+    expected = np.array(fir_1d_ideal(x.tolist(), h), dtype=np.float64)
+    result = fir_1d_ideal_np(x, h)
+
+    assert result.dtype == np.float64
+    assert np.array_equal(result, expected)
+
+
+def test_numpy_engine_handles_taps_longer_than_input():
+    x = [10, 200, 30]
+    h = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7]
+
+    assert np.array_equal(fir_1d_ideal_np(x, h), np.array(fir_1d_ideal(x, h)))
+
+
+@pytest.mark.parametrize("bad_x", [float("nan"), float("inf"), float("-inf")])
+def test_numpy_engine_non_finite_x_raises_value_error(bad_x):
+    with pytest.raises(ValueError, match=r"x\[1\].*finite"):
+        fir_1d_ideal_np(np.array([10, bad_x, 20]), [1.0])
+
+
+def test_uint8_input_skips_preprocessing_without_copy():
+    x = np.array([[0, 7, 255]], dtype=np.uint8)
+    assert _preprocess_x_fast(x) is x
+
+
+@pytest.mark.parametrize("dtype", [np.int8, np.int16, np.int64, np.uint16, np.bool_])
+def test_integer_input_is_clamped_like_float_input(dtype):
+    x = np.array([-5, 0, 1, 200, 300, 127], dtype=np.int64).astype(dtype)
+    expected = _preprocess_x_np(x.astype(np.float64))
+    np.testing.assert_array_equal(_preprocess_x_np(x), expected)
+
+
+def test_non_finite_x_reports_first_flat_index():
+    x = np.zeros((3, 4))
+    x[1, 2] = np.inf
+    x[2, 0] = np.nan
+    with pytest.raises(ValueError, match=r"x\[6\]=inf"):
+        _preprocess_x_np(x)
+
+
+def test_2d_api_matches_rowwise_loop():
+    rng = np.random.default_rng(3)
+    x = rng.integers(0, 256, size=(5, 23), dtype=np.uint8)
+    h = [1 / 16, 4 / 16, 6 / 16, 4 / 16, 1 / 16]
+
+    result = fir_1d_ideal_2d(x, h)
+
+    assert result.shape == x.shape
+    assert result.dtype == np.float64
+    for r in range(x.shape[0]):
+        assert np.array_equal(result[r, :], np.array(fir_1d_ideal(x[r, :].tolist(), h)))
+
+
+def test_2d_api_rejects_non_2d_input():
+    with pytest.raises(ValueError, match="expected 2D"):
+        fir_1d_ideal_2d(np.zeros((2, 3, 4), dtype=np.uint8), [1.0])
+
+
+def test_plan_apply_and_cache():
+    h = [0.25, 0.5, 0.25]
+    plan = IdealFirPlan(h)
+
+    assert plan.apply([10, 20, 30, 40]).tolist() == [10.0, 20.0, 30.0, 27.5]
+    x = np.arange(12, dtype=np.uint8).reshape(2, 6)
+    assert np.array_equal(plan.apply_batch(x), fir_1d_ideal_2d(x, h))
+    assert get_ideal_plan(h) is get_ideal_plan(tuple(h))
+
+
+@pytest.mark.parametrize(("width", "taps"), [(1, 3), (5, 31), (64, 63), (300, 127), (1000, 4)])
+def test_fft_method_matches_direct_within_tolerance(width, taps):
+    rng = np.random.default_rng(width + taps)
+    x = rng.integers(0, 256, size=(3, width), dtype=np.uint8)
+    h = rng.uniform(-1.0, 1.0, size=taps).tolist()
+
+    direct = fir_1d_ideal_2d(x, h)
+    fft = fir_1d_ideal_2d(x, h, method="fft")
+
+    assert fft.shape == direct.shape
+    assert np.max(np.abs(fft - direct)) <= FFT_MAX_ABS_DEV_TOL
+
+
+def test_auto_method_selects_by_taps_and_width():
+    assert select_ideal_method(3, 4499) == "direct"
+    assert select_ideal_method(127, 4499) == "fft"
+    assert select_ideal_method(127, 8) == "direct"
+
+
+def test_fft_deviation_report_is_within_tolerance():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 256, size=(20, 512)).astype(np.float64)
+    taps = rng.uniform(-1.0, 1.0, size=63)
+    y = fir_1d_ideal_2d(x, taps, method="fft")
+
+    report = fft_deviation_report(x, taps, y, max_rows=4)
+
+    assert report["checked_rows"] == 4
+    assert report["within_tol"]
+
+
+def test_dyadic_detection_for_tap_maps():
+    assert get_ideal_plan([0.25, 0.5, 0.25]).dyadic[1] == 2
+    assert get_ideal_plan([1 / 16, 4 / 16, 6 / 16, 4 / 16, 1 / 16]).dyadic[1] == 4
+    assert get_ideal_plan([-1.0, 0, 1.0]).dyadic[1] == 0
+    assert get_ideal_plan([1 / 3, 1 / 3, 1 / 3]).dyadic is None
+    assert get_ideal_plan([1 / 5] * 5).dyadic is None
+
+
+@pytest.mark.parametrize(
+    "h",
+    [
+        [0.25, 0.5, 0.25],
+        [-0.125, 1.25, -0.125],
+        [-1 / 16, -4 / 16, 26 / 16, -4 / 16, -1 / 16],
+        [-1 / 8, -2 / 8, 0, 2 / 8, 1 / 8],
+        [1 / 3, 1 / 3, 1 / 3],
+    ],
+)
+def test_dyadic_method_matches_direct(h):
+    rng = np.random.default_rng(len(h))
+    x = rng.integers(0, 256, size=(4, 31), dtype=np.uint8)
+
+    assert np.array_equal(fir_1d_ideal_2d(x, h, method="dyadic"), fir_1d_ideal_2d(x, h))
+    assert np.array_equal(fir_1d_ideal_np(x[0], h, method="auto"), fir_1d_ideal_2d(x, h)[0])
+
+
+
+def test_winograd_f23_matrices_match_textbook_form():
+    a_t, g, b_t = winograd_matrices(2, 3)
+
+    assert np.array_equal(a_t, [[1, 1, 1, 0], [0, 1, -1, 1]])
+    assert np.array_equal(g, [[1, 0, 0], [1, 1, 1], [1, -1, 1], [0, 0, 1]])
+    assert np.array_equal(b_t, [[1, 0, -1, 0], [0, 0.5, 0.5, 0], [0, -0.5, 0.5, 0], [0, -1, 0, 1]])
+
+
+@pytest.mark.parametrize("taps", [2, 3, 4, 5, 7])
+@pytest.mark.parametrize("width", [1, 3, 4, 5, 37, 1000])
+def test_winograd_method_matches_direct_within_tolerance(width, taps):
+    rng = np.random.default_rng(width * 10 + taps)
+    x = rng.integers(0, 256, size=(3, width), dtype=np.uint8)
+    h = rng.uniform(-1.0, 1.0, size=taps).tolist()
+
+    direct = fir_1d_ideal_2d(x, h)
+    wino = fir_1d_ideal_2d(x, h, method="winograd")
+
+    assert wino.shape == direct.shape
+    assert np.max(np.abs(wino - direct)) <= WINOGRAD_MAX_ABS_DEV_TOL
+
+
+def test_winograd_falls_back_to_direct_for_unsupported_taps():
+    assert not winograd_supported(1)
+    assert not winograd_supported(31)
+    assert get_ideal_plan([1.0]).resolve_method(100, "winograd") == "direct"
+    assert get_ideal_plan([0.1] * 31).resolve_method(100, "winograd") == "direct"
+    assert get_ideal_plan([0.1, 0.7, 0.2]).resolve_method(100, "winograd") == "winograd"
@@ -0,0 +1,66 @@
+# File: test_1d_polyphase.py
+# Role: polyphase 보간/데시메이션 결과가 전체 계산 후 샘플링한 결과와 같은지 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden, fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_polyphase import (
+    _zero_stuff,
+    fir_1d_fixed_polyphase,
+    fir_1d_ideal_polyphase,
+    polyphase_output_length,
+)
+from fir_1d.model.python.fir_1d_ref import fir_1d_ideal, fir_1d_ideal_2d
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+
+RATES = [(1, 1), (2, 1), (4, 1), (3, 1), (1, 2), (1, 3), (2, 3), (3, 2), (4, 4)]
+
+
+@pytest.mark.parametrize(("decimate", "interpolate"), RATES)
+@pytest.mark.parametrize("width", [1, 2, 7, 32])
+def test_ideal_polyphase_matches_full_then_sample(width, decimate, interpolate):
+    rng = np.random.default_rng(width)
+    x = rng.integers(0, 256, size=(3, width), dtype=np.uint8)
+
+    for h in list(h_coeff_3tap_map.values()) + list(h_coeff_5tap_map.values()):
+        expected = fir_1d_ideal_2d(_zero_stuff(x, interpolate), h)[:, ::decimate]
+        y = fir_1d_ideal_polyphase(x, h, decimate=decimate, interpolate=interpolate)
+
+        assert y.shape == (3, polyphase_output_length(width, decimate, interpolate))
+        assert np.array_equal(y, expected)
+
+
+@pytest.mark.parametrize(("decimate", "interpolate"), RATES)
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (7, 12, 8)])
+def test_fixed_polyphase_is_bit_exact(decimate, interpolate, frac_bits, acc_bits, coeff_bits):
+    rng = np.random.default_rng(decimate * 10 + interpolate)
+    x = rng.integers(0, 256, size=(4, 29), dtype=np.uint8)
+    limit = ((1 << (coeff_bits - 1)) - 1) / (1 << frac_bits)
+
+    for h in list(h_coeff_3tap_map.values()) + list(h_coeff_5tap_map.values()):
+        h = [min(max(c, -limit), limit) for c in h]
+        expected = fir_1d_fixed_golden_2d(_zero_stuff(x, interpolate), h, frac_bits, acc_bits, coeff_bits)
+        y = fir_1d_fixed_polyphase(
+            x, h, frac_bits, acc_bits, coeff_bits, decimate=decimate, interpolate=interpolate
+        )
+        assert np.array_equal(y, expected[:, ::decimate])
+
+
+def test_polyphase_accepts_1d_rows_with_preprocessing():
+    x = [-3.0, 10.5, 300.0, 42.2, 7.0, 0.0, 255.0]
+    h = [0.25, 0.5, 0.25]
+    x_up = [v for s in x for v in (s, 0.0)]
+
+    assert np.array_equal(fir_1d_ideal_polyphase(x, h, decimate=2), fir_1d_ideal(x, h)[::2])
+    assert np.array_equal(
+        fir_1d_fixed_polyphase(x, h, interpolate=2),
+        fir_1d_fixed_golden([max(0, min(255, v)) for v in x_up], h),
+    )
+
+
+@pytest.mark.parametrize("bad", [0, -1, 1.5, True])
+def test_invalid_rates_raise_value_error(bad):
+    with pytest.raises(ValueError, match="decimate"):
+        fir_1d_ideal_polyphase([1, 2, 3], [1.0], decimate=bad)
+    with pytest.raises(ValueError, match="interpolate"):
+        fir_1d_fixed_polyphase([1, 2, 3], [1.0], interpolate=bad)
@@ -0,0 +1,91 @@
+# File: test_1d_stream.py
+# Role: 청크 단위 streaming FIR 출력이 전체 신호 1회 필터링 결과와 같은지 검증한다.
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden
+from fir_1d.model.python.fir_1d_ref import _preprocess_x_fast, fir_1d_ideal_np
+from fir_1d.model.python.fir_1d_stream import StreamingFixedFir, StreamingIdealFir, _preprocess_chunk
+
+TAP_SETS = [
+    [1.0],
+    [0.5, 0.5],
+    [0.25, 0.5, 0.25],
+    [-1 / 16, -4 / 16, 26 / 16, -4 / 16, -1 / 16],
+    [0.1, 0.2, 0.3, 0.4],
+    [0.05] * 20,
+]
+
+
+# 길이 0과 L보다 짧은 청크가 섞인 불규칙 분할
+def _split(x: np.ndarray, seed: int) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    cuts = np.sort(rng.integers(0, len(x) + 1, size=12))
+    return np.split(x, cuts)
+
+
+def _run(stream, chunks) -> np.ndarray:
+    return np.concatenate(list(stream.run(chunks)))
+
+
+@pytest.mark.parametrize("h", TAP_SETS)
+@pytest.mark.parametrize("length", [0, 1, 7, 300])
+def test_streaming_ideal_is_bit_identical(h, length):
+    rng = np.random.default_rng(length)
+    x = rng.uniform(-20.0, 280.0, size=length)
+
+    y = _run(StreamingIdealFir(h), _split(x, len(h)))
+    np.testing.assert_array_equal(y, fir_1d_ideal_np(x, h))
+
+
+@pytest.mark.parametrize(("frac_bits", "acc_bits", "coeff_bits"), [(12, 32, 16), (12, 14, 16), (6, 12, 8)])
+@pytest.mark.parametrize("h", TAP_SETS)
+@pytest.mark.parametrize("length", [0, 1, 7, 300])
+def test_streaming_fixed_is_bit_exact_including_wrap(h, length, frac_bits, acc_bits, coeff_bits):
+    rng = np.random.default_rng(length)
+    x = rng.integers(0, 256, size=length, dtype=np.uint8)
+
+    stream = StreamingFixedFir(h, frac_bits, acc_bits, coeff_bits)
+    y = _run(stream, _split(x, len(h)))
+    assert y.dtype == np.uint8
+    np.testing.assert_array_equal(y, fir_1d_fixed_golden(x, h, frac_bits, acc_bits, coeff_bits))
+
+
+def test_streaming_output_lags_by_center_delay():
+    stream = StreamingFixedFir([0.2] * 5)
+    assert stream.delay == 2
+    assert len(stream.process(np.full(10, 100, dtype=np.uint8))) == 8
+    assert len(stream.process(np.full(3, 100, dtype=np.uint8))) == 3
+    assert len(stream.flush()) == 2
+
+
+def test_streaming_is_reusable_after_flush():
+    x = np.arange(50, dtype=np.uint8)
+    stream = StreamingFixedFir([0.25, 0.5, 0.25])
+    first = _run(stream, [x])
+    second = _run(stream, [x[:20], x[20:]])
+    np.testing.assert_array_equal(first, second)
+
+
+def test_streaming_reports_global_index_of_non_finite_sample():
+    stream = StreamingIdealFir([0.25, 0.5, 0.25])
+    stream.process([1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match=r"x\[4\]"):
+        stream.process([4.0, float("nan")])
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        np.array([-3.2, 0.5, 1.49, 254.5, 300.0]),
+        np.array([-5, 7, 256, 1000], dtype=np.int16),
+        np.array([0, 128, 255], dtype=np.uint8),
+    ],
+)
+def test_streaming_preprocessing_matches_batch_rule(chunk):
+    np.testing.assert_array_equal(_preprocess_chunk(chunk, 0), _preprocess_x_fast(chunk))
+
+
+def test_streaming_rejects_2d_chunk():
+    with pytest.raises(ValueError, match="1D"):
+        StreamingIdealFir([1.0]).process(np.zeros((2, 2)))
@@ -0,0 +1,83 @@
+# File: test_1d_sweep.py
+# Role: 비트 폭 sweep 엔진의 설정별 출력/지표가 단일 실행 결과와 같은지 검증한다.
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_ref import fir_1d_ideal_2d
+from fir_1d.model.python.fir_1d_sweep import bit_width_grid, fir_1d_fixed_sweep
+from fir_1d.sim.vector.gen_3tap_compare_report import _compute_metrics
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+
+
+def test_bit_width_grid_is_cartesian_product():
+    grid = bit_width_grid((8, 12), (16, 32), (16,))
+    assert grid == [(8, 16, 16), (8, 32, 16), (12, 16, 16), (12, 32, 16)]
+
+
+@pytest.mark.parametrize(
+    "h",
+    [h_coeff_3tap_map["sharpen"], h_coeff_5tap_map["sharpen"], h_coeff_5tap_map["edge"]],
+)
+def test_sweep_outputs_are_bit_exact_per_config(h):
+    rng = np.random.default_rng(len(h))
+    x = rng.integers(0, 256, size=(6, 41), dtype=np.uint8)
+    configs = bit_width_grid((3, 7, 12, 20), (8, 12, 16, 24, 32, 40), (8, 16, 32))
+
+    results = fir_1d_fixed_sweep(x, h, configs, keep_outputs=True)
+
+    assert [(r["frac_bits"], r["acc_bits"], r["coeff_bits"]) for r in results] == configs
+    for cfg, r in zip(configs, results):
+        try:
+            expected = fir_1d_fixed_golden_2d(x, h, *cfg)
+        except ValueError as e:
+            assert r["status"] == "invalid"
+            assert r["error"] == str(e)
+            continue
+        assert r["status"] == "ok"
+        assert np.array_equal(r["output"], expected), cfg
+
+
+def test_sweep_metrics_match_report_definition():
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 256, size=(5, 30), dtype=np.uint8)
+    h = h_coeff_3tap_map["sharpen"]
+    y_ideal = fir_1d_ideal_2d(x, h)
+
+    (r,) = fir_1d_fixed_sweep(x, h, [(6, 12, 16)])
+    expected = _compute_metrics(y_ideal, fir_1d_fixed_golden_2d(x, h, 6, 12, 16))
+
+    assert "output" not in r
+    for key in ("num_samples", "max_abs_err", "mae", "rmse", "mean_err", "sat_ratio"):
+        assert r[key] == pytest.approx(expected[key], rel=1e-12, abs=1e-12)
+
+
+def test_sweep_wrap_flag():
+    x = np.full((1, 8), 255, dtype=np.uint8)
+    h = h_coeff_3tap_map["simple_lp"]  # 합 1.0 -> 누산 최대 255 * 2^frac_bits
+
+    small, large = fir_1d_fixed_sweep(x, h, [(12, 16, 16), (12, 32, 16)])
+    assert small["wraps"] and not large["wraps"]
+
+
+# keep_outputs=False면 설정 수가 늘어도 최대 메모리가 늘지 않는다 (누산값/출력 미보관)
+def test_sweep_peak_memory_does_not_grow_with_configs():
+    rng = np.random.default_rng(1)
+    x = rng.integers(0, 256, size=(128, 128), dtype=np.uint8)
+    h = h_coeff_3tap_map["sharpen"]
+    reference = fir_1d_ideal_2d(x, h)
+
+    def _peak(configs):
+        fir_1d_fixed_sweep(x, h, configs[:1], reference=reference)  # plan 캐시 준비
+        tracemalloc.start()
+        try:
+            fir_1d_fixed_sweep(x, h, configs, reference=reference)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    one = _peak([(8, 32, 16)])
+    many = _peak(bit_width_grid(range(8, 21), (20, 32), (16, 20)))
+    assert many < one + 16 * x.size  # 작업 dtype이 하나 더 생기는 정도까지만 허용
@@ -0,0 +1,161 @@
+# File: test_build_cache.py
+# Role: 파이프라인 빌드 캐시가 입력 해시가 바뀐 산출물만 다시 만들고 매니페스트에 기록하는지 검증한다.
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+import pipeline_fir_1d
+from fir_1d.sim.tests.output_test_common import make_pipeline_images, run_pipeline_in
+from fir_1d.sim.vector import build_cache, gen_fixed_output, gen_ideal_output
+from fir_1d.sim.vector.build_cache import CACHE_MANIFEST_NAME, BuildCache, artifact_key, code_digest, model_modules
+
+
+def _manifest(root: Path) -> dict:
+    return json.loads((root / "output" / CACHE_MANIFEST_NAME).read_text(encoding="utf-8"))
+
+
+def _counts(summary: dict) -> tuple[int, int, int]:
+    return (
+        summary["ideal_counts"]["ideal_3tap"],
+        summary["fixed_counts"]["fixed_3tap"],
+        summary["restore_summary"]["num_converted"],
+    )
+
+
+def _report_rows(summary: dict) -> list[dict[str, str]]:
+    with Path(summary["report_results"]["report_3tap"]["csv_path"]).open(encoding="utf-8") as fp:
+        return list(csv.DictReader(fp))
+
+
+def test_artifact_key_depends_on_every_part():
+    base = artifact_key("fixed", input="abc", params=[[0.25, 0.5, 0.25], 12, 32, 16])
+    assert base == artifact_key("fixed", params=[[0.25, 0.5, 0.25], 12, 32, 16], input="abc")
+    assert base != artifact_key("fixed", input="abd", params=[[0.25, 0.5, 0.25], 12, 32, 16])
+    assert base != artifact_key("fixed", input="abc", params=[[0.25, 0.5, 0.25], 12, 31, 16])
+    assert base != artifact_key("ideal", input="abc", params=[[0.25, 0.5, 0.25], 12, 32, 16])
+
+
+def test_cache_lookup_detects_modified_file(tmp_path: Path):
+    path = tmp_path / "a.npy"
+    np.save(path, np.zeros(3))
+    cache = BuildCache(tmp_path / CACHE_MANIFEST_NAME)
+    cache.record("a", "k1", [path])
+    assert cache.lookup("a", "k1") is not None
+    assert cache.lookup("a", "k2") is None
+    np.save(path, np.ones(4))
+    assert cache.lookup("a", "k1") is None
+
+
+def test_second_run_reuses_everything(tmp_path: Path):
+    make_pipeline_images(tmp_path / "img")
+    first = run_pipeline_in(tmp_path)
+    assert _counts(first) == (8, 8, 16)
+
+    second = run_pipeline_in(tmp_path)
+    assert _counts(second) == (0, 0, 0)
+    assert _report_rows(second) == _report_rows(first)
+    manifest = _manifest(tmp_path)
+    assert manifest["summary"] == {"reused": 2 + 16 + 8 + 16, "rebuilt": 0}
+
+
+def test_changed_image_rebuilds_only_its_case(tmp_path: Path):
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path)
+
+    Image.fromarray(np.full((6, 9), 77, dtype=np.uint8), mode="L").save(tmp_path / "img" / "img_0.bmp")
+    summary = run_pipeline_in(tmp_path)
+    assert _counts(summary) == (4, 4, 8)
+    rebuilt = _manifest(tmp_path)["rebuilt"]
+    assert "input:case_000_img_0_x_u8.npy" in rebuilt
+    assert not any("case_001" in name for name in rebuilt)
+
+
+def test_changed_coefficient_and_bits_rebuild_dependents(tmp_path: Path, monkeypatch):
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path)
+
+    monkeypatch.setitem(pipeline_fir_1d.TAP_COEFF_MAPS["3"], "edge", [-0.5, 0.0, 0.5])
+    summary = run_pipeline_in(tmp_path)
+    assert _counts(summary) == (2, 2, 4)
+
+    monkeypatch.setitem(pipeline_fir_1d.FIXED_BITS, "frac_bits", 10)
+    summary = run_pipeline_in(tmp_path)
+    assert _counts(summary) == (0, 8, 8)
+
+    # 부분 재생성 후 리포트는 처음부터 만든 리포트와 같다
+    fresh = tmp_path / "fresh"
+    make_pipeline_images(fresh / "img")
+    assert _report_rows(summary) == _report_rows(run_pipeline_in(fresh))
+
+
+def test_externally_modified_or_unrecorded_outputs_are_rebuilt(tmp_path: Path):
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path)
+
+    fixed_dir = tmp_path / "output" / "fixed_3tap"
+    target = sorted(fixed_dir.glob("*.npy"))[0]
+    np.save(target, np.zeros((2, 2), dtype=np.uint8))
+    summary = run_pipeline_in(tmp_path, skip_restore=True)
+    assert summary["fixed_counts"] == {"fixed_3tap": 1}
+    assert np.load(target).shape != (2, 2)
+
+    # 매니페스트가 없으면 기존 파일의 출처를 알 수 없으므로 모두 다시 만든다
+    (tmp_path / "output" / CACHE_MANIFEST_NAME).unlink()
+    assert _counts(run_pipeline_in(tmp_path)) == (8, 8, 16)
+
+
+def test_overwrite_flags_force_rebuild(tmp_path: Path):
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path)
+    summary = run_pipeline_in(tmp_path, overwrite_vectors=True, overwrite_images=True)
+    assert _counts(summary) == (8, 8, 16)
+    assert _manifest(tmp_path)["summary"]["reused"] == 0
+
+
+def test_vector_code_covers_only_imported_model_modules():
+    ideal = {p.name for p in pipeline_fir_1d.VECTOR_CODE["ideal"]}
+    fixed = {p.name for p in pipeline_fir_1d.VECTOR_CODE["fixed"]}
+    assert {"fir_1d_ref.py", "fir_1d_fft.py", "fir_1d_winograd.py"} <= ideal
+    assert {"fir_1d_fixed_ref.py", "fir_1d_range.py", "fir_1d_fold.py", "fir_1d_csd.py"} <= fixed
+    assert "fir_1d_fixed_ref.py" not in ideal
+    for unrelated in ("fir_1d_hw.py", "fir_1d_sweep.py", "fir_1d_stream.py", "fir_1d_polyphase.py"):
+        assert unrelated not in ideal | fixed
+
+
+def test_unrelated_model_edit_keeps_vectors_reused(tmp_path: Path, monkeypatch):
+    model_dir = tmp_path / "model"
+    shutil.copytree(build_cache.MODEL_DIR, model_dir, ignore=shutil.ignore_patterns("__pycache__"))
+    monkeypatch.setattr(build_cache, "MODEL_DIR", model_dir)
+
+    def _use_model_copy() -> None:
+        code_digest.cache_clear()
+        monkeypatch.setattr(
+            pipeline_fir_1d,
+            "VECTOR_CODE",
+            {
+                "ideal": (*model_modules.__wrapped__("fir_1d_ref", "fir_1d_fft"), gen_ideal_output.THIS_FILE),
+                "fixed": (*model_modules.__wrapped__("fir_1d_fixed_ref"), gen_fixed_output.THIS_FILE),
+            },
+        )
+
+    make_pipeline_images(tmp_path / "img")
+    _use_model_copy()
+    run_pipeline_in(tmp_path)
+
+    with (model_dir / "fir_1d_hw.py").open("a", encoding="utf-8") as fp:
+        fp.write("\n# edited\n")
+    _use_model_copy()
+    assert _counts(run_pipeline_in(tmp_path)) == (0, 0, 0)
+
+    # fixed 경로가 import 하는 모듈을 고치면 fixed(와 그 복원 이미지)만 다시 만든다
+    with (model_dir / "fir_1d_fold.py").open("a", encoding="utf-8") as fp:
+        fp.write("\n# edited\n")
+    _use_model_copy()
+    assert _counts(run_pipeline_in(tmp_path)) == (0, 8, 8)
+    code_digest.cache_clear()
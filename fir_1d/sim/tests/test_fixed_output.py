@@ -6,10 +6,12 @@ from pathlib import Path
 
 import numpy as np
 
-from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden, fir_1d_fixed_golden_2d
 from fir_1d.sim.vector.gen_fixed_output import (
+    ROW_STATS_SUFFIX,
     generate_fixed_3tap_output_vector,
     generate_fixed_5tap_output_vector,
+    generate_fixed_output_vectors_bank,
 )
 from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
 from fir_1d.sim.tests.output_test_common import (
@@ -94,3 +96,88 @@ def test_spot_check_against_direct_fixed_row_result(tmp_path: Path):
 
     assert np.array_equal(y[0, :], expected_row0)
     assert np.array_equal(y[2, :], expected_row2)
+
+
+def test_bank_mode_matches_per_tap_map_outputs(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+
+    ref_dir = tmp_path / "ref"
+    generate_fixed_3tap_output_vector(input_dir=input_dir, output_dir=ref_dir)
+    generate_fixed_5tap_output_vector(input_dir=input_dir, output_dir=ref_dir)
+
+    bank_dir = tmp_path / "bank"
+    counts = generate_fixed_output_vectors_bank(input_dir=input_dir, output_dir=bank_dir)
+    assert counts == {"fixed_3tap": len(h_coeff_3tap_map), "fixed_5tap": len(h_coeff_5tap_map)}
+
+    for subdir in ("fixed_3tap", "fixed_5tap"):
+        ref_files = sorted((ref_dir / subdir).glob("*.npy"))
+        bank_files = sorted((bank_dir / subdir).glob("*.npy"))
+        assert [p.name for p in bank_files] == [p.name for p in ref_files]
+        for ref_file, bank_file in zip(ref_files, bank_files):
+            assert bank_file.read_bytes() == ref_file.read_bytes()
+
+    # 기존 출력은 overwrite=False에서 건너뛴다
+    counts = generate_fixed_output_vectors_bank(input_dir=input_dir, output_dir=bank_dir)
+    assert counts == {"fixed_3tap": 0, "fixed_5tap": 0}
+
+
+def test_row_stats_are_saved_beside_outputs(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    input_file = prepare_single_input_case(input_dir)
+    x = np.load(input_file)
+
+    generate_fixed_3tap_output_vector(
+        input_dir=input_dir, output_dir=output_dir, acc_bits=16, row_stats=True
+    )
+
+    out_dir = output_dir / "fixed_3tap"
+    for coeff_name, h in h_coeff_3tap_map.items():
+        y_path = next(out_dir.glob(f"*__{coeff_name}_fixed_3tap_y_u8.npy"))
+        stats_path = y_path.with_name(y_path.name.removesuffix("_y_u8.npy") + ROW_STATS_SUFFIX)
+        with np.load(stats_path) as saved:
+            _, expected = fir_1d_fixed_golden_2d(x, h, acc_bits=16, return_stats=True)
+            assert np.array_equal(saved["row_stats"], expected)
+            assert "acc in [" in str(saved["range_proof"])
+
+    # 카운터 파일은 *.npy 수집 대상이 아니다
+    assert len(list(out_dir.glob("*.npy"))) == len(h_coeff_3tap_map)
+
+
+def test_row_stats_fill_in_existing_outputs(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    output_dir = tmp_path / "output"
+    prepare_single_input_case(input_dir)
+    out_dir = output_dir / "fixed_3tap"
+
+    assert generate_fixed_3tap_output_vector(input_dir=input_dir, output_dir=output_dir) == len(h_coeff_3tap_map)
+    assert not list(out_dir.glob(f"*{ROW_STATS_SUFFIX}"))
+
+    # 출력은 있지만 카운터가 없으면 --row-stats 실행에서 다시 만든다
+    count = generate_fixed_3tap_output_vector(input_dir=input_dir, output_dir=output_dir, row_stats=True)
+    assert count == len(h_coeff_3tap_map)
+    for y_path in out_dir.glob("*_y_u8.npy"):
+        assert y_path.with_name(y_path.name.removesuffix("_y_u8.npy") + ROW_STATS_SUFFIX).exists()
+
+    assert generate_fixed_3tap_output_vector(input_dir=input_dir, output_dir=output_dir, row_stats=True) == 0
+
+
+def test_workers_match_serial_outputs_and_counts(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+    x = np.load(input_dir / "case_000_small_x_u8.npy")
+    np.save(input_dir / "case_001_flip_x_u8.npy", x[::-1].copy())
+
+    serial = generate_fixed_5tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "serial")
+    pooled = generate_fixed_5tap_output_vector(
+        input_dir=input_dir, output_dir=tmp_path / "pool", workers=2, row_stats=True
+    )
+    assert serial == pooled == 2 * len(h_coeff_5tap_map)
+
+    for ref_file in sorted((tmp_path / "serial" / "fixed_5tap").glob("*.npy")):
+        pool_file = tmp_path / "pool" / "fixed_5tap" / ref_file.name
+        assert pool_file.read_bytes() == ref_file.read_bytes()
+
+    # 기존 출력은 overwrite=False에서 건너뛴다
+    assert generate_fixed_5tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "pool", workers=2) == 0
@@ -0,0 +1,94 @@
+# File: test_fused_pipeline.py
+# Role: --fused 파이프라인이 중간 .npy 없이 staged 경로와 같은 리포트/복원 이미지를 만드는지 검증한다.
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from fir_1d.sim.tests.output_test_common import make_pipeline_images, run_pipeline_in
+
+
+def _report_payload(summary: dict) -> tuple[str, dict]:
+    report = summary["report_results"]["report_3tap"]
+    csv_text = Path(report["csv_path"]).read_text(encoding="utf-8")
+    payload = json.loads(Path(report["json_path"]).read_text(encoding="utf-8"))
+    payload.pop("generated_at_utc")
+    for name in ("ideal_dir", "fixed_dir", "report_dir"):
+        payload["config"].pop(name)
+    return csv_text, payload
+
+
+def _pngs(root: Path) -> dict[str, np.ndarray]:
+    out_dir = root / "output_img"
+    return {
+        str(path.relative_to(out_dir)): np.asarray(Image.open(path))
+        for path in sorted(out_dir.rglob("*.png"))
+    }
+
+
+def _output_npys(root: Path) -> list[str]:
+    out_dir = root / "output"
+    return sorted(str(p.relative_to(out_dir)) for p in out_dir.glob("*_3tap/*.npy"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_fused_matches_staged_without_output_vectors(tmp_path, workers):
+    staged_root, fused_root = tmp_path / "staged", tmp_path / "fused"
+    make_pipeline_images(staged_root / "img")
+    make_pipeline_images(fused_root / "img")
+
+    staged = run_pipeline_in(staged_root)
+    fused = run_pipeline_in(fused_root, fused=True, workers=workers)
+
+    assert _report_payload(fused) == _report_payload(staged)
+    staged_pngs, fused_pngs = _pngs(staged_root), _pngs(fused_root)
+    assert sorted(fused_pngs) == sorted(staged_pngs) and len(staged_pngs) == 16
+    for name, arr in staged_pngs.items():
+        assert np.array_equal(fused_pngs[name], arr), name
+    assert fused["ideal_counts"] == staged["ideal_counts"] == {"ideal_3tap": 8}
+    assert fused["restore_summary"] == staged["restore_summary"]
+    assert _output_npys(fused_root) == []
+
+
+def test_fused_keep_vectors_writes_staged_outputs(tmp_path):
+    staged_root, fused_root = tmp_path / "staged", tmp_path / "fused"
+    make_pipeline_images(staged_root / "img")
+    make_pipeline_images(fused_root / "img")
+
+    run_pipeline_in(staged_root, skip_report=True, skip_restore=True)
+    run_pipeline_in(fused_root, fused=True, keep_vectors=True)
+
+    names = _output_npys(staged_root)
+    assert _output_npys(fused_root) == names and len(names) == 16
+    for name in names:
+        a = np.load(staged_root / "output" / name)
+        b = np.load(fused_root / "output" / name)
+        assert a.dtype == b.dtype and np.array_equal(a, b), name
+
+
+def test_fused_second_run_reuses_everything(tmp_path):
+    make_pipeline_images(tmp_path / "img")
+    first = run_pipeline_in(tmp_path, fused=True)
+    second = run_pipeline_in(tmp_path, fused=True)
+
+    assert second["ideal_counts"] == {"ideal_3tap": 0}
+    assert second["restore_summary"] == {"num_converted": 0, "num_skipped": 16}
+    assert _report_payload(second) == _report_payload(first)
+    manifest = json.loads((tmp_path / "output" / "build_cache_manifest.json").read_text(encoding="utf-8"))
+    assert manifest["summary"]["rebuilt"] == 0
+
+    forced = run_pipeline_in(tmp_path, fused=True, overwrite_images=True)
+    assert forced["ideal_counts"] == {"ideal_3tap": 8}
+    assert forced["restore_summary"]["num_converted"] == 16
+
+
+def test_fused_rejects_skipped_output_stage(tmp_path):
+    make_pipeline_images(tmp_path / "img")
+    with pytest.raises(ValueError, match="--fused"):
+        run_pipeline_in(tmp_path, fused=True, skip_fixed=True)
+    with pytest.raises(ValueError, match="--keep-vectors"):
+        run_pipeline_in(tmp_path, keep_vectors=True)
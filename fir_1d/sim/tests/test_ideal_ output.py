@@ -5,11 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from fir_1d.model.python.fir_1d_ref import fir_1d_ideal
 from fir_1d.sim.vector.gen_ideal_output import (
+    _ideal_output_job,
     generate_ideal_3tap_output_vector,
     generate_ideal_5tap_output_vector,
+    generate_ideal_output_vectors_bank,
 )
 from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
 from fir_1d.sim.tests.output_test_common import (
@@ -88,3 +91,81 @@ def test_spot_check_against_direct_ideal_row_result(tmp_path: Path):
 
     assert np.allclose(y[0, :], expected_row0)
     assert np.allclose(y[2, :], expected_row2)
+
+
+def test_bank_mode_matches_per_tap_map_outputs(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+
+    ref_dir = tmp_path / "ref"
+    generate_ideal_3tap_output_vector(input_dir=input_dir, output_dir=ref_dir)
+    generate_ideal_5tap_output_vector(input_dir=input_dir, output_dir=ref_dir)
+
+    bank_dir = tmp_path / "bank"
+    counts = generate_ideal_output_vectors_bank(input_dir=input_dir, output_dir=bank_dir)
+    assert counts == {"ideal_3tap": len(h_coeff_3tap_map), "ideal_5tap": len(h_coeff_5tap_map)}
+
+    for subdir in ("ideal_3tap", "ideal_5tap"):
+        ref_files = sorted((ref_dir / subdir).glob("*.npy"))
+        bank_files = sorted((bank_dir / subdir).glob("*.npy"))
+        assert [p.name for p in bank_files] == [p.name for p in ref_files]
+        for ref_file, bank_file in zip(ref_files, bank_files):
+            assert bank_file.read_bytes() == ref_file.read_bytes()
+
+    # 기존 출력은 overwrite=False에서 건너뛴다
+    counts = generate_ideal_output_vectors_bank(input_dir=input_dir, output_dir=bank_dir)
+    assert counts == {"ideal_3tap": 0, "ideal_5tap": 0}
+
+
+def test_fft_engine_outputs_match_numpy_engine(tmp_path: Path, capsys):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+
+    generate_ideal_5tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "numpy")
+    assert "[fft]" not in capsys.readouterr().out
+    generate_ideal_5tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "fft", engine="fft")
+
+    # 편차는 job마다가 아니라 생성 호출당 1줄로 요약한다
+    fft_lines = [line for line in capsys.readouterr().out.splitlines() if line.startswith("[fft]")]
+    assert len(fft_lines) == 1
+    assert f"outputs={len(h_coeff_5tap_map)}" in fft_lines[0]
+
+    for ref_file in sorted((tmp_path / "numpy" / "ideal_5tap").glob("*.npy")):
+        fft_file = tmp_path / "fft" / "ideal_5tap" / ref_file.name
+        assert np.allclose(np.load(fft_file), np.load(ref_file), rtol=0.0, atol=1e-9)
+
+
+def test_workers_match_serial_outputs_and_counts(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+    x = np.load(input_dir / "case_000_small_x_u8.npy")
+    np.save(input_dir / "case_001_flip_x_u8.npy", x[::-1].copy())
+
+    serial = generate_ideal_3tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "serial")
+    pooled = generate_ideal_3tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "pool", workers=2)
+    assert serial == pooled == 2 * len(h_coeff_3tap_map)
+
+    for ref_file in sorted((tmp_path / "serial" / "ideal_3tap").glob("*.npy")):
+        pool_file = tmp_path / "pool" / "ideal_3tap" / ref_file.name
+        assert pool_file.read_bytes() == ref_file.read_bytes()
+
+    # 기존 출력은 overwrite=False에서 건너뛴다
+    assert generate_ideal_3tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "pool", workers=2) == 0
+
+
+def test_invalid_workers_raises(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    prepare_single_input_case(input_dir)
+    with pytest.raises(ValueError, match="workers"):
+        generate_ideal_3tap_output_vector(input_dir=input_dir, output_dir=tmp_path / "out", workers=0)
+
+
+def test_ideal_job_returns_fft_deviation_report(tmp_path: Path):
+    input_dir = tmp_path / "input"
+    input_file = prepare_single_input_case(input_dir)
+    h = h_coeff_5tap_map["sharpen"]
+
+    report = _ideal_output_job(input_file, tmp_path / "fft.npy", h, "fft")
+    assert report["method"] == "fft" and report["within_tol"]
+    assert report["max_abs_dev"] < 1e-9
+    assert _ideal_output_job(input_file, tmp_path / "direct.npy", h, "numpy") is None
@@ -0,0 +1,279 @@
+# File: test_job_pool.py
+# Role: 출력 생성기 job pool의 순서 보존, 공유 메모리 입력 게시/해제, 의존성 그래프 실행, bank 출력 기록을 검증한다.
+from __future__ import annotations
+
+import os
+import weakref
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fir_1d.sim.vector.job_pool import (
+    DagTask,
+    SharedArrays,
+    attach_shared,
+    resolve_input,
+    run_dag,
+    run_image_jobs,
+    write_bank_outputs,
+)
+
+
+# worker에서 실행되는 job (pickle 가능한 모듈 최상위 함수)
+def _row_sum_job(source, scale: int) -> int:
+    return int(resolve_input(source, np.load).sum()) * scale
+
+
+def _failing_job(source, scale: int) -> int:
+    x = resolve_input(source, np.load)
+    if scale == 2:
+        raise RuntimeError("job failed")
+    return int(x.sum())
+
+
+def _add(a: int, b: int = 0) -> int:
+    return a + b
+
+
+def _fail_if_negative(a: int) -> int:
+    if a < 0:
+        raise RuntimeError("negative input")
+    return a
+
+
+# local task: 의존 task 결과를 모은다
+def _collect(dep_results: dict, scale: int) -> list[int]:
+    return [v * scale for v in dep_results.values()]
+
+
+def _segment_exists(name: str) -> bool:
+    try:
+        shm = shared_memory.SharedMemory(name=name, track=False)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+def test_shared_arrays_attach_zero_copy_and_unlink_on_exit():
+    x = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    with SharedArrays() as shared:
+        ref = shared.publish(x)
+        y = attach_shared(ref)
+        np.testing.assert_array_equal(y, x)
+        assert not y.flags.writeable
+        del y
+    assert not _segment_exists(ref[0])
+
+
+def test_shared_arrays_unlink_on_exception():
+    with pytest.raises(KeyboardInterrupt):
+        with SharedArrays() as shared:
+            ref = shared.publish(np.zeros(8, dtype=np.uint8))
+            raise KeyboardInterrupt
+    assert not _segment_exists(ref[0])
+
+
+def _write_inputs(tmp_path: Path) -> list[Path]:
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"case_{i:03d}_x_u8.npy"
+        np.save(path, np.full((4, 5), i + 1, dtype=np.uint8))
+        paths.append(path)
+    return paths
+
+
+def test_image_jobs_keep_order_with_workers(tmp_path: Path):
+    paths = _write_inputs(tmp_path)
+    jobs = [(p, s) for p in paths for s in (1, 2, 3)]
+
+    serial, _ = run_image_jobs(_row_sum_job, jobs, workers=1, load=np.load)
+    pooled, timing = run_image_jobs(_row_sum_job, jobs, workers=2, load=np.load)
+    assert pooled == serial == [20, 40, 60, 40, 80, 120]
+    assert sum(entry["jobs"] for entry in timing) == len(jobs)
+
+
+def test_image_jobs_failure_raises_and_releases_segments(tmp_path: Path, monkeypatch):
+    paths = _write_inputs(tmp_path)
+    published: list[str] = []
+    publish = SharedArrays.publish
+
+    def _record(self, array):
+        ref = publish(self, array)
+        published.append(ref[0])
+        return ref
+
+    monkeypatch.setattr(SharedArrays, "publish", _record)
+    with pytest.raises(RuntimeError, match="job failed"):
+        run_image_jobs(_failing_job, [(p, s) for p in paths for s in (1, 2)], workers=2, load=np.load)
+    # 게시는 job 순서대로 필요할 때만 하므로, 실패 후에는 뒤 입력이 게시되지 않을 수 있다
+    assert 1 <= len(published) <= 2
+    assert not any(_segment_exists(name) for name in published)
+
+
+def test_image_jobs_publish_lazily_and_release_after_last_job(tmp_path: Path, monkeypatch):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"case_{i:03d}_x_u8.npy"
+        np.save(path, np.full((4, 5), i + 1, dtype=np.uint8))
+        paths.append(path)
+    events: list[tuple[str, str]] = []
+    publish, release = SharedArrays.publish, SharedArrays.release
+
+    def _publish(self, array):
+        ref = publish(self, array)
+        events.append(("publish", ref[0]))
+        return ref
+
+    def _release(self, ref):
+        events.append(("release", ref[0]))
+        release(self, ref)
+
+    monkeypatch.setattr(SharedArrays, "publish", _publish)
+    monkeypatch.setattr(SharedArrays, "release", _release)
+    results, _ = run_image_jobs(_row_sum_job, [(p, s) for p in paths for s in (1, 2)], workers=2, load=np.load)
+
+    assert results == [v * s for v in (20, 40, 60, 80) for s in (1, 2)]
+    published = [name for kind, name in events if kind == "publish"]
+    assert len(published) == 4  # 입력당 1회
+    # 입력 0은 마지막 입력이 게시되기 전에 (실행 도중) 해제된다
+    assert events.index(("release", published[0])) < events.index(("publish", published[-1]))
+    live = max(
+        sum(1 if kind == "publish" else -1 for kind, _ in events[: i + 1]) for i in range(len(events))
+    )
+    assert live <= 3  # workers + 1 (입력 디렉터리 크기와 무관)
+    assert not any(_segment_exists(name) for name in published)
+
+
+def _diamond() -> dict[str, DagTask]:
+    return {
+        "a": DagTask(_add, (1,)),
+        "b": DagTask(_add, (2,), {"b": 10}, deps=["a"]),
+        "c": DagTask(_add, (3,), deps=["a"]),
+        "sum": DagTask(_collect, (2,), deps=["c", "b"], local=True),
+    }
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_dag_results_and_local_dep_order(workers: int):
+    results, timing = run_dag(_diamond(), workers=workers)
+    assert results == {"a": 1, "b": 12, "c": 3, "sum": [6, 24]}
+    assert sum(entry["jobs"] for entry in timing) == 3  # local task는 풀 집계에서 제외
+
+
+def test_run_dag_rejects_unknown_dep_and_cycle():
+    with pytest.raises(ValueError, match="unknown task"):
+        run_dag({"a": DagTask(_add, (1,), deps=["x"])})
+    with pytest.raises(ValueError, match="cycle"):
+        run_dag(
+            {
+                "a": DagTask(_add, (1,), deps=["c"]),
+                "b": DagTask(_add, (1,), deps=["a"]),
+                "c": DagTask(_add, (1,), deps=["b"]),
+            }
+        )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_dag_failure_stops_dependents(workers: int):
+    tasks = {
+        "bad": DagTask(_fail_if_negative, (-1,)),
+        "after": DagTask(_collect, (1,), deps=["bad"], local=True),
+    }
+    with pytest.raises(RuntimeError, match="negative input"):
+        run_dag(tasks, workers=workers)
+
+
+# 입력 생성 task (shared_input task의 dep): 값 i로 채운 입력 파일을 쓴다
+def _write_input(path: Path, value: int) -> None:
+    np.save(path, np.full((4, 5), value, dtype=np.uint8))
+
+
+def _source_kind_sum(source, scale: int) -> tuple[str, int]:
+    kind = "path" if isinstance(source, Path) else "shared"
+    return kind, int(resolve_input(source, np.load).sum()) * scale
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_dag_publishes_shared_input_once_per_path(tmp_path: Path, monkeypatch, workers: int):
+    published: list[str] = []
+    publish = SharedArrays.publish
+
+    def _record(self, array):
+        ref = publish(self, array)
+        published.append(ref[0])
+        return ref
+
+    monkeypatch.setattr(SharedArrays, "publish", _record)
+    tasks: dict[str, DagTask] = {}
+    for i in range(2):
+        path = tmp_path / f"case_{i:03d}_x_u8.npy"
+        tasks[f"input:{i}"] = DagTask(_write_input, (path, i + 1))
+        for scale in (1, 2, 3):
+            tasks[f"use:{i}:{scale}"] = DagTask(
+                _source_kind_sum, (path, scale), deps=[f"input:{i}"], shared_input=True
+            )
+
+    results, _ = run_dag(tasks, workers=workers, load=np.load)
+    expected_kind = "path" if workers == 1 else "shared"
+    assert [results[f"use:{i}:{s}"] for i in range(2) for s in (1, 2, 3)] == [
+        (expected_kind, v) for v in (20, 40, 60, 40, 80, 120)
+    ]
+    assert len(published) == (0 if workers == 1 else 2)
+    assert not any(_segment_exists(name) for name in published)
+
+
+def test_run_dag_shared_input_needs_load(tmp_path: Path):
+    tasks = {
+        "use": DagTask(_source_kind_sum, (tmp_path / "x.npy", 1), shared_input=True),
+        "other": DagTask(_add, (1,)),
+    }
+    with pytest.raises(ValueError, match="load="):
+        run_dag(tasks, workers=2)
+    with pytest.raises(ValueError, match="pool tasks"):
+        DagTask(_collect, (1,), local=True, shared_input=True)
+
+
+def test_write_bank_outputs_blocks_and_cleans_up_on_error(tmp_path: Path):
+    x = np.arange(35, dtype=np.uint8).reshape(7, 5)
+    out_paths = [tmp_path / "a.npy", tmp_path / "b.npy"]
+    write_bank_outputs(
+        x,
+        out_paths,
+        compute_block=lambda xb: np.stack([xb, xb * 2], axis=-1),
+        dtype=np.uint8,
+        block_rows=3,
+    )
+    assert np.array_equal(np.load(out_paths[0]), x)
+    assert np.array_equal(np.load(out_paths[1]), x * 2)
+
+    bad_paths = [tmp_path / "c.npy"]
+    with pytest.raises(ValueError, match="shape mismatch"):
+        write_bank_outputs(x, bad_paths, compute_block=lambda xb: xb[..., None][:, :2], dtype=np.uint8)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.npy", "b.npy"]
+
+
+def test_write_bank_outputs_closes_memmaps_before_replace(tmp_path: Path, monkeypatch):
+    maps: list[weakref.ref] = []
+    open_memmap, replace = np.lib.format.open_memmap, os.replace
+
+    def _open(*args, **kwargs):
+        mm = open_memmap(*args, **kwargs)
+        maps.append(weakref.ref(mm))
+        return mm
+
+    def _replace(src, dst):
+        # Windows는 매핑이 열린 파일을 replace 할 수 없으므로 이 시점에 참조가 없어야 한다
+        assert all(ref() is None for ref in maps)
+        replace(src, dst)
+
+    monkeypatch.setattr(np.lib.format, "open_memmap", _open)
+    monkeypatch.setattr(os, "replace", _replace)
+    x = np.arange(12, dtype=np.uint8).reshape(3, 4)
+    write_bank_outputs(
+        x, [tmp_path / "a.npy", tmp_path / "b.npy"], compute_block=lambda xb: np.stack([xb, xb], -1), dtype=np.uint8
+    )
+    assert len(maps) == 2
+    assert np.array_equal(np.load(tmp_path / "b.npy"), x)
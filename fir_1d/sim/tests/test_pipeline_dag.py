@@ -0,0 +1,85 @@
+# File: test_pipeline_dag.py
+# Role: 의존성 그래프로 실행하는 pipeline_fir_1d가 단계별 생성기와 같은 파일/요약을 만드는지 검증한다.
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fir_1d.sim.tests.output_test_common import make_pipeline_images, run_pipeline_in
+from fir_1d.sim.vector.gen_3tap_compare_report import generate_3tap_compare_report
+from fir_1d.sim.vector.gen_fixed_output import generate_fixed_3tap_output_vector
+from fir_1d.sim.vector.gen_ideal_output import generate_ideal_3tap_output_vector
+from fir_1d.sim.vector.gen_input_vectors import generate_input_vector_jsons
+from fir_1d.sim.vector.job_pool import SharedArrays
+
+
+def _read_csv(path: Path) -> list[dict[str, str]]:
+    with path.open(encoding="utf-8") as fp:
+        return list(csv.DictReader(fp))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_pipeline_matches_stage_generators(tmp_path: Path, workers: int):
+    make_pipeline_images(tmp_path / "img")
+    summary = run_pipeline_in(tmp_path, workers=workers)
+
+    assert summary["selected_taps"] == ["3"]
+    assert summary["input_manifest"]["generated_cases"] == 2
+    assert summary["ideal_counts"] == {"ideal_3tap": 8}
+    assert summary["fixed_counts"] == {"fixed_3tap": 8}
+    assert summary["report_results"]["report_3tap"]["num_cases"] == 8
+    assert summary["restore_summary"] == {"num_converted": 16, "num_skipped": 0}
+
+    # 같은 입력을 단계별 생성기로 순서대로 만든 결과와 비교
+    ref = tmp_path / "ref"
+    generate_input_vector_jsons(tmp_path / "img", ref / "input")
+    generate_ideal_3tap_output_vector(ref / "input", ref / "output")
+    generate_fixed_3tap_output_vector(ref / "input", ref / "output")
+    ref_report = generate_3tap_compare_report(
+        ideal_dir=ref / "output" / "ideal_3tap",
+        fixed_dir=ref / "output" / "fixed_3tap",
+        report_dir=ref / "output" / "report_3tap",
+    )
+    for sub in ("ideal_3tap", "fixed_3tap"):
+        names = sorted(p.name for p in (ref / "output" / sub).glob("*.npy"))
+        assert names == sorted(p.name for p in (tmp_path / "output" / sub).glob("*.npy"))
+        for name in names:
+            np.testing.assert_array_equal(
+                np.load(tmp_path / "output" / sub / name), np.load(ref / "output" / sub / name)
+            )
+    assert _read_csv(Path(summary["report_results"]["report_3tap"]["csv_path"])) == _read_csv(
+        Path(ref_report["csv_path"])
+    )
+
+
+def test_pipeline_skip_flags_keep_summary_contract(tmp_path: Path):
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path)
+
+    summary = run_pipeline_in(tmp_path, skip_input=True, skip_ideal=True, skip_restore=True)
+    assert set(summary) == {"selected_taps", "fixed_counts", "report_results"}
+    assert summary["fixed_counts"] == {"fixed_3tap": 0}  # 기존 파일은 건너뜀
+    assert summary["report_results"]["report_3tap"]["num_cases"] == 8
+
+
+def test_pipeline_without_inputs_raises(tmp_path: Path):
+    with pytest.raises(FileNotFoundError):
+        run_pipeline_in(tmp_path, skip_input=True)
+
+
+@pytest.mark.parametrize("fused", [False, True])
+def test_pipeline_publishes_each_input_once_with_workers(tmp_path: Path, monkeypatch, fused: bool):
+    published: list[tuple[int, ...]] = []
+    publish = SharedArrays.publish
+
+    def _record(self, array):
+        published.append(array.shape)
+        return publish(self, array)
+
+    monkeypatch.setattr(SharedArrays, "publish", _record)
+    make_pipeline_images(tmp_path / "img")
+    run_pipeline_in(tmp_path, workers=2, fused=fused)
+    assert sorted(published) == [(5, 7), (6, 9)]
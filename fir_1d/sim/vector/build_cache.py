@@ -0,0 +1,160 @@
+# File: build_cache.py
+# Role: 파이프라인 산출물을 입력 내용 해시(key)로 식별해 재사용/재생성을 판단하고 캐시 매니페스트를 기록한다.
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# 매니페스트 형식 버전 (형식이 바뀌면 이전 매니페스트는 통째로 무효화)
+CACHE_SCHEMA = 1
+CACHE_MANIFEST_NAME = "build_cache_manifest.json"
+
+THIS_FILE = Path(__file__).resolve()
+MODEL_DIR = THIS_FILE.parent.parent.parent / "model" / "python"
+
+
+def file_digest(path: Path) -> str:
+    with path.open("rb") as fp:
+        return hashlib.file_digest(fp, "sha256").hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_digest(*paths: Path) -> str:
+    """
+    모델 버전: 산출물을 만드는 소스 파일(디렉터리면 그 안의 *.py) 내용의 해시.
+    코드가 바뀌면 그 코드로 만든 산출물의 key가 모두 바뀐다. (프로세스당 1회 계산)
+    """
+    files: list[Path] = []
+    for path in paths:
+        files.extend(sorted(path.glob("*.py")) if path.is_dir() else [path])
+    h = hashlib.sha256()
+    for path in files:
+        h.update(path.name.encode("utf-8") + b"\0")
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def model_modules(*names: str) -> tuple[Path, ...]:
+    """
+    모델 모듈 names(예: "fir_1d_ref")와 그 모듈들이 (함수 내부 포함) import 하는 모델 모듈
+    파일 전체. code_digest 대상을 산출물 계산에 실제로 쓰이는 모듈로 한정해, 관련 없는
+    엔진 파일을 고쳐도 산출물이 무효화되지 않게 한다.
+    """
+    package = "fir_1d.model.python"
+    pending = list(names)
+    found: dict[str, Path] = {}
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        path = MODEL_DIR / f"{name}.py"
+        found[name] = path
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"), filename=str(path))):
+            if not isinstance(node, ast.ImportFrom) or node.module is None:
+                continue
+            if node.level == 1:
+                pending.append(node.module)
+            elif node.level == 0 and node.module.startswith(package + "."):
+                pending.append(node.module.removeprefix(package + "."))
+    return tuple(sorted(found.values()))
+
+
+def artifact_key(kind: str, **parts: Any) -> str:
+    """
+    산출물 key: 종류와 모든 입력(상위 산출물 key, 계수, 비트 폭, 코드 해시 등)의 해시.
+    parts는 JSON 직렬화 가능해야 한다 (float은 repr 기준으로 정확히 기록됨).
+    """
+    payload = json.dumps({"kind": kind, **parts}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# 파일 상태 지문 (size, mtime_ns): 기록 이후 외부에서 바뀐 파일 감지용
+def _file_stat(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_size, st.st_mtime_ns]
+
+
+class BuildCache:
+    """
+    산출물 id -> {"key", "files": {경로: [size, mtime_ns]}, "status", ...} 매니페스트
+
+    - plan(): 기록된 key가 같고 파일이 그대로면 재사용, 아니면 재생성으로 판단한다.
+      재생성 대상의 이전 기록은 즉시 지운다 (실행 중 실패해도 다음 실행에서 다시 만든다).
+    - record(): 재생성이 끝난 산출물의 key와 파일 상태를 기록한다.
+    - save(): 이번 실행의 재사용/재생성 목록과 함께 매니페스트를 원자적으로 기록한다.
+    기록이 없는 기존 파일(캐시 도입 이전 산출물 포함)은 출처를 알 수 없으므로 재생성한다.
+    """
+
+    __slots__ = ("path", "entries", "_status")
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        self._status: dict[str, str] = {}
+        if path.exists():
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("schema") == CACHE_SCHEMA:
+                self.entries = payload.get("artifacts", {})
+
+    def _unchanged(self, entry: dict[str, Any]) -> bool:
+        for name, stat in entry.get("files", {}).items():
+            path = Path(name)
+            if not path.exists() or _file_stat(path) != stat:
+                return False
+        return True
+
+    def lookup(self, artifact_id: str, key: str) -> dict[str, Any] | None:
+        entry = self.entries.get(artifact_id)
+        if entry is None or entry["key"] != key or not self._unchanged(entry):
+            return None
+        return entry
+
+    def plan(self, artifact_id: str, key: str, *, force: bool = False) -> bool:
+        """True면 재생성, False면 재사용."""
+        rebuild = force or self.lookup(artifact_id, key) is None
+        self._status[artifact_id] = "rebuilt" if rebuild else "reused"
+        if rebuild:
+            self.entries.pop(artifact_id, None)
+        return rebuild
+
+    def existing_key(self, artifact_id: str, path: Path) -> str:
+        """이번 실행에서 만들지 않는 기존 파일의 key (기록이 그대로면 기록값, 아니면 내용 해시)."""
+        entry = self.entries.get(artifact_id)
+        if entry is not None and str(path) in entry.get("files", {}) and self._unchanged(entry):
+            return entry["key"]
+        return artifact_key("file", digest=file_digest(path))
+
+    def record(self, artifact_id: str, key: str, files: Iterable[Path] = (), **extra: Any) -> None:
+        self.entries[artifact_id] = {
+            "key": key,
+            "files": {str(path): _file_stat(path) for path in files},
+            **extra,
+        }
+
+    def summary(self) -> dict[str, int]:
+        statuses = list(self._status.values())
+        return {"reused": statuses.count("reused"), "rebuilt": statuses.count("rebuilt")}
+
+    def save(self) -> None:
+        for artifact_id, entry in self.entries.items():
+            entry["status"] = self._status.get(artifact_id, "untouched")
+        payload = {
+            "schema": CACHE_SCHEMA,
+            "updated_at_utc": datetime.now(timezone.utc).isoformat(),
+            "summary": self.summary(),
+            "reused": sorted(k for k, v in self._status.items() if v == "reused"),
+            "rebuilt": sorted(k for k, v in self._status.items() if v == "rebuilt"),
+            "artifacts": dict(sorted(self.entries.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        part = self.path.with_name(self.path.name + ".part")
+        part.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(part, self.path)
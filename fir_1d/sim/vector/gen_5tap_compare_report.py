@@ -112,6 +112,66 @@ def _compute_metrics(y_ideal: np.ndarray, y_fixed: np.ndarray) -> dict[str, floa
     }
 
 
+def compare_output_pair(
+    key: PairKey,
+    ideal_path: Path,
+    fixed_path: Path,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """
+    ideal/fixed 출력 쌍 1개를 비교한다 (파이프라인에서 쌍이 준비되는 즉시 실행 가능).
+
+    Returns:
+        (row, None): 리포트 CSV/JSON의 case 행
+        (None, mismatch): shape가 다르면 shape_mismatch_cases 항목
+    """
+    return compare_output_arrays(
+        key, np.load(ideal_path), np.load(fixed_path), ideal_file=ideal_path.name, fixed_file=fixed_path.name
+    )
+
+
+def compare_output_arrays(
+    key: PairKey,
+    y_ideal: np.ndarray,
+    y_fixed: np.ndarray,
+    *,
+    ideal_file: str,
+    fixed_file: str,
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """메모리의 ideal/fixed 출력으로 compare_output_pair와 같은 결과를 만든다 (fused 경로)."""
+    if y_ideal.shape != y_fixed.shape:
+        return None, {
+            "key": _key_to_str(key),
+            "ideal_shape": list(y_ideal.shape),
+            "fixed_shape": list(y_fixed.shape),
+            "ideal_file": ideal_file,
+            "fixed_file": fixed_file,
+        }
+
+    metrics = _compute_metrics(y_ideal, y_fixed)
+    case_stem, coeff_name = key
+    height = int(y_ideal.shape[0]) if y_ideal.ndim >= 2 else 1
+    width = int(y_ideal.shape[1]) if y_ideal.ndim >= 2 else int(y_ideal.shape[0])
+
+    return {
+        "key": _key_to_str(key),
+        "case_stem": case_stem,
+        "coeff_name": coeff_name,
+        "height": height,
+        "width": width,
+        "num_samples": metrics["num_samples"],
+        "max_abs_err": metrics["max_abs_err"],
+        "mae": metrics["mae"],
+        "rmse": metrics["rmse"],
+        "mean_err": metrics["mean_err"],
+        "sat_low_ratio": metrics["sat_low_ratio"],
+        "sat_high_ratio": metrics["sat_high_ratio"],
+        "sat_ratio": metrics["sat_ratio"],
+        "clip_needed_ratio": metrics["clip_needed_ratio"],
+        "ideal_file": ideal_file,
+        "fixed_file": fixed_file,
+    }, None
+
+
 def _summarize_rows(rows: list[dict[str, Any]]) -> dict[str, Any]:
     if not rows:
         return {
@@ -267,7 +327,12 @@ def generate_5tap_compare_report(
     report_dir: Path = DEFAULT_REPORT_DIR,
     top_k: int = 5,
     strict: bool = False,
+    pair_results: dict[PairKey, tuple[dict[str, Any] | None, dict[str, Any] | None]] | None = None,
 ) -> dict[str, Any]:
+    """
+    pair_results: compare_output_pair 결과 {(case_stem, coeff_name): (row, mismatch)}.
+    디렉터리에서 찾은 쌍과 파일 이름이 같으면 다시 읽지 않고 재사용한다.
+    """
     ideal_dir = ideal_dir.resolve()
     fixed_dir = fixed_dir.resolve()
     report_dir = report_dir.resolve()
@@ -300,60 +365,109 @@ def generate_5tap_compare_report(
         ideal_path = ideal_map[key]
         fixed_path = fixed_map[key]
 
-        y_ideal = np.load(ideal_path)
-        y_fixed = np.load(fixed_path)
-        if y_ideal.shape != y_fixed.shape:
-            shape_mismatch_cases.append(
-                {
-                    "key": _key_to_str(key),
-                    "ideal_shape": list(y_ideal.shape),
-                    "fixed_shape": list(y_fixed.shape),
-                    "ideal_file": ideal_path.name,
-                    "fixed_file": fixed_path.name,
-                }
-            )
+        # 미리 계산된 쌍 결과는 같은 파일 쌍일 때만 재사용한다
+        cached = (pair_results or {}).get(key)
+        entry = None if cached is None else (cached[0] or cached[1])
+        if entry is not None and (entry["ideal_file"], entry["fixed_file"]) == (
+            ideal_path.name,
+            fixed_path.name,
+        ):
+            row, mismatch = cached
+        else:
+            row, mismatch = compare_output_pair(key, ideal_path, fixed_path)
+        if mismatch is not None:
+            shape_mismatch_cases.append(mismatch)
             continue
+        rows.append(row)
+
+    return _write_report(
+        rows=rows,
+        shape_mismatch_cases=shape_mismatch_cases,
+        validation_lists={
+            "invalid_ideal_filenames": sorted(invalid_ideal_names),
+            "invalid_fixed_filenames": sorted(invalid_fixed_names),
+            "duplicate_ideal_keys": duplicate_ideal_keys,
+            "duplicate_fixed_keys": duplicate_fixed_keys,
+            "missing_ideal_keys": [_key_to_str(key) for key in missing_ideal_keys],
+            "missing_fixed_keys": [_key_to_str(key) for key in missing_fixed_keys],
+        },
+        ideal_dir=ideal_dir,
+        fixed_dir=fixed_dir,
+        report_dir=report_dir,
+        top_k=top_k,
+        strict=strict,
+    )
+
 
-        metrics = _compute_metrics(y_ideal, y_fixed)
-        case_stem, coeff_name = key
-        height = int(y_ideal.shape[0]) if y_ideal.ndim >= 2 else 1
-        width = int(y_ideal.shape[1]) if y_ideal.ndim >= 2 else int(y_ideal.shape[0])
-
-        rows.append(
-            {
-                "key": _key_to_str(key),
-                "case_stem": case_stem,
-                "coeff_name": coeff_name,
-                "height": height,
-                "width": width,
-                "num_samples": metrics["num_samples"],
-                "max_abs_err": metrics["max_abs_err"],
-                "mae": metrics["mae"],
-                "rmse": metrics["rmse"],
-                "mean_err": metrics["mean_err"],
-                "sat_low_ratio": metrics["sat_low_ratio"],
-                "sat_high_ratio": metrics["sat_high_ratio"],
-                "sat_ratio": metrics["sat_ratio"],
-                "clip_needed_ratio": metrics["clip_needed_ratio"],
-                "ideal_file": ideal_path.name,
-                "fixed_file": fixed_path.name,
-            }
+def write_compare_report_from_pairs(
+    pair_results: dict[PairKey, tuple[dict[str, Any] | None, dict[str, Any] | None]],
+    *,
+    ideal_dir: Path = DEFAULT_IDEAL_5TAP_DIR,
+    fixed_dir: Path = DEFAULT_FIXED_5TAP_DIR,
+    report_dir: Path = DEFAULT_REPORT_DIR,
+    top_k: int = 5,
+    strict: bool = False,
+) -> dict[str, Any]:
+    """
+    출력 파일 없이 compare_output_arrays 결과만으로 리포트를 기록한다 (fused 경로).
+
+    쌍은 ideal/fixed가 함께 만들어지므로 파일 이름/누락/중복 검증 항목은 비어 있고,
+    나머지 CSV/JSON 내용은 같은 쌍을 디렉터리에서 읽은 generate_5tap_compare_report와 같다.
+    ideal_dir/fixed_dir는 config 기록에만 쓴다.
+    """
+    if not pair_results:
+        raise ValueError(
+            "No matched 5tap ideal/fixed pairs found. "
+            f"ideal_dir={ideal_dir.resolve()}, fixed_dir={fixed_dir.resolve()}"
         )
+    rows: list[dict[str, Any]] = []
+    shape_mismatch_cases: list[dict[str, Any]] = []
+    for key in sorted(pair_results, key=lambda k: (k[0], k[1])):
+        row, mismatch = pair_results[key]
+        if mismatch is not None:
+            shape_mismatch_cases.append(mismatch)
+        else:
+            rows.append(row)
+    return _write_report(
+        rows=rows,
+        shape_mismatch_cases=shape_mismatch_cases,
+        validation_lists={
+            name: []
+            for name in (
+                "invalid_ideal_filenames",
+                "invalid_fixed_filenames",
+                "duplicate_ideal_keys",
+                "duplicate_fixed_keys",
+                "missing_ideal_keys",
+                "missing_fixed_keys",
+            )
+        },
+        ideal_dir=ideal_dir.resolve(),
+        fixed_dir=fixed_dir.resolve(),
+        report_dir=report_dir.resolve(),
+        top_k=top_k,
+        strict=strict,
+    )
+
 
+# case 행 + 검증 목록 -> 요약/검증 -> CSV/JSON 기록과 콘솔 요약
+def _write_report(
+    *,
+    rows: list[dict[str, Any]],
+    shape_mismatch_cases: list[dict[str, Any]],
+    validation_lists: dict[str, list[str]],
+    ideal_dir: Path,
+    fixed_dir: Path,
+    report_dir: Path,
+    top_k: int,
+    strict: bool,
+) -> dict[str, Any]:
     rows = sorted(rows, key=lambda r: (str(r["case_stem"]), str(r["coeff_name"])))
     overall = _summarize_rows(rows)
     by_coeff = _summarize_by_coeff(rows)
     worst_cases = _build_worst_cases(rows, top_k=top_k)
 
-    validation = {
-        "invalid_ideal_filenames": sorted(invalid_ideal_names),
-        "invalid_fixed_filenames": sorted(invalid_fixed_names),
-        "duplicate_ideal_keys": duplicate_ideal_keys,
-        "duplicate_fixed_keys": duplicate_fixed_keys,
-        "missing_ideal_keys": [_key_to_str(key) for key in missing_ideal_keys],
-        "missing_fixed_keys": [_key_to_str(key) for key in missing_fixed_keys],
-        "shape_mismatch_cases": shape_mismatch_cases,
-    }
+    validation = {**validation_lists, "shape_mismatch_cases": shape_mismatch_cases}
 
     if strict and _has_validation_issue(validation):
         raise ValueError(
@@ -8,13 +8,26 @@ from time import perf_counter
 
 import numpy as np
 
-from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden
+from fir_1d.model.python.fir_1d_fixed_ref import fir_1d_fixed_golden_2d
+from fir_1d.model.python.fir_1d_bank import fir_1d_fixed_bank
 from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+from fir_1d.sim.vector.job_pool import (
+    SharedArrayRef,
+    load_input_latest,
+    load_input_u8,
+    log_worker_timing,
+    resolve_input,
+    run_image_jobs,
+    validate_workers,
+    write_bank_outputs,
+)
 
 
 THIS_FILE = Path(__file__).resolve()
 DEFAULT_INPUT_DIR = THIS_FILE.parent / "input"
 DEFAULT_OUTPUT_DIR = THIS_FILE.parent / "output"
+# 행별 wrap/포화 카운터 파일 접미사 (y_u8.npy 옆에 저장, 비교 리포트의 *.npy 수집 대상 아님)
+ROW_STATS_SUFFIX = "_row_stats.npz"
 
 
 def _iter_input_npy_files(input_dir: Path) -> list[Path]:
@@ -22,42 +35,53 @@ def _iter_input_npy_files(input_dir: Path) -> list[Path]:
     return sorted(files, key=lambda p: p.name.lower())
 
 
-def _load_input_image_u8(path: Path) -> np.ndarray:
-    x = np.load(path)
-    if x.ndim != 2:
-        raise ValueError(f"{path.name}: expected 2D array, got shape={x.shape}")
-    if x.dtype != np.uint8:
-        x = x.astype(np.uint8)
-    return x
-
-
-def _run_fixed_rowwise(
+def _run_fixed(
     x_u8: np.ndarray,
     h: list[float],
     *,
     frac_bits: int,
     acc_bits: int,
     coeff_bits: int,
-) -> np.ndarray:
-    height, width = x_u8.shape
-    y = np.zeros((height, width), dtype=np.uint8)
-    for r in range(height):
-        row = x_u8[r, :]
-        y_row = fir_1d_fixed_golden(
-            row.tolist(),
-            h,
-            frac_bits=frac_bits,
-            acc_bits=acc_bits,
-            coeff_bits=coeff_bits,
+    row_stats: bool = False,
+) -> tuple[np.ndarray, tuple[np.ndarray, dict] | None]:
+    # row_stats=True면 같은 패스에서 행별 카운터와 실행 정보(범위 증명)를 함께 받는다
+    result = fir_1d_fixed_golden_2d(
+        x_u8,
+        h,
+        frac_bits=frac_bits,
+        acc_bits=acc_bits,
+        coeff_bits=coeff_bits,
+        return_info=row_stats,
+        return_stats=row_stats,
+    )
+    if row_stats:
+        y, info, stats = result
+        extra = (stats, info)
+    else:
+        y, extra = result, None
+    if y.shape != x_u8.shape:
+        raise ValueError(
+            f"Output shape mismatch: expected {x_u8.shape}, got {y.shape}. "
+            "Check fir_1d_fixed_golden_2d same-mode output length."
         )
-        y_arr = np.asarray(y_row, dtype=np.uint8)
-        if y_arr.shape != (width,):
-            raise ValueError(
-                f"Row output length mismatch at row={r}: expected {width}, got {y_arr.shape}. "
-                "Check fir_1d_fixed_golden same-mode output length."
-            )
-        y[r, :] = y_arr
-    return y
+    return y, extra
+
+
+# y_u8.npy 옆 행별 카운터 파일 경로
+def _row_stats_path(y_path: Path) -> Path:
+    return y_path.with_name(y_path.name.removesuffix("_y_u8.npy") + ROW_STATS_SUFFIX)
+
+
+# 행별 카운터(구조 배열)와 누산 범위 증명을 y_u8.npy 옆 .npz로 저장
+def _save_row_stats(y_path: Path, row_stats: np.ndarray, info: dict) -> Path:
+    stats_path = _row_stats_path(y_path)
+    np.savez(
+        stats_path,
+        row_stats=row_stats,
+        range_proof=np.array(info["range"]["proof"]),
+        wrap_emulated=np.array(info["wrap_emulated"]),
+    )
+    return stats_path
 
 
 def _case_stem_from_input(path: Path) -> str:
@@ -67,44 +91,94 @@ def _case_stem_from_input(path: Path) -> str:
     return path.stem
 
 
-def _generate_fixed_outputs_for_tap_map(
-    *,
-    input_dir: Path,
+# (case, coeff) job 1개: 입력(경로 또는 공유 메모리) -> fixed 실행 -> 출력(및 행별 카운터) 저장
+def _fixed_output_job(
+    source: Path | SharedArrayRef,
+    out_path: Path,
+    h: list[float],
+    frac_bits: int,
+    acc_bits: int,
+    coeff_bits: int,
+    row_stats: bool,
+) -> None:
+    x_u8 = resolve_input(source, load_input_latest)
+    y, extra = _run_fixed(
+        x_u8,
+        h,
+        frac_bits=frac_bits,
+        acc_bits=acc_bits,
+        coeff_bits=coeff_bits,
+        row_stats=row_stats,
+    )
+    np.save(out_path, y)
+    if extra is not None:
+        _save_row_stats(out_path, *extra)
+
+
+# 생성할 (case, coeff) job 목록: (입력 경로, 출력 경로, h, frac_bits, acc_bits, coeff_bits, row_stats)
+# skip 판단은 실행 전에 부모 프로세스에서 끝내므로 workers 수와 무관하게 결정적이다
+# row_stats=True면 출력이 있어도 카운터 파일이 없는 job은 다시 실행한다
+def _fixed_output_jobs(
+    input_files: list[Path],
     out_dir: Path,
     coeff_map: dict[str, list[float]],
     tap_label: str,
+    *,
     frac_bits: int,
     acc_bits: int,
     coeff_bits: int,
     overwrite: bool = False,
-) -> int:
-    input_files = _iter_input_npy_files(input_dir)
-    if not input_files:
-        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
-
+    row_stats: bool = False,
+) -> list[tuple[Path, Path, list[float], int, int, int, bool]]:
     out_dir.mkdir(parents=True, exist_ok=True)
-    generated = 0
-
+    jobs = []
     for in_path in input_files:
-        x_u8 = _load_input_image_u8(in_path)
         case_stem = _case_stem_from_input(in_path)
-
         for coeff_name, h in coeff_map.items():
             out_name = f"{case_stem}__{coeff_name}_fixed_{tap_label}_y_u8.npy"
             out_path = out_dir / out_name
-            if out_path.exists() and not overwrite:
+            stats_missing = row_stats and not _row_stats_path(out_path).exists()
+            if out_path.exists() and not overwrite and not stats_missing:
                 continue
-            y = _run_fixed_rowwise(
-                x_u8,
-                h,
-                frac_bits=frac_bits,
-                acc_bits=acc_bits,
-                coeff_bits=coeff_bits,
-            )
-            np.save(out_path, y)
-            generated += 1
+            jobs.append((in_path, out_path, h, frac_bits, acc_bits, coeff_bits, row_stats))
+    return jobs
 
-    return generated
+
+def _generate_fixed_outputs_for_tap_map(
+    *,
+    input_dir: Path,
+    out_dir: Path,
+    coeff_map: dict[str, list[float]],
+    tap_label: str,
+    frac_bits: int,
+    acc_bits: int,
+    coeff_bits: int,
+    overwrite: bool = False,
+    row_stats: bool = False,
+    workers: int = 1,
+) -> int:
+    validate_workers(workers)
+    input_files = _iter_input_npy_files(input_dir)
+    if not input_files:
+        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
+
+    jobs = _fixed_output_jobs(
+        input_files,
+        out_dir,
+        coeff_map,
+        tap_label,
+        frac_bits=frac_bits,
+        acc_bits=acc_bits,
+        coeff_bits=coeff_bits,
+        overwrite=overwrite,
+        row_stats=row_stats,
+    )
+    _, worker_timing = run_image_jobs(
+        _fixed_output_job, jobs, workers=workers, load=load_input_latest
+    )
+    if workers > 1:
+        log_worker_timing(f"fixed_{tap_label}", worker_timing)
+    return len(jobs)
 
 
 def generate_fixed_3tap_output_vector(
@@ -115,6 +189,8 @@ def generate_fixed_3tap_output_vector(
     acc_bits: int = 32,
     coeff_bits: int = 16,
     overwrite: bool = False,
+    row_stats: bool = False,
+    workers: int = 1,
 ) -> int:
     return _generate_fixed_outputs_for_tap_map(
         input_dir=input_dir.resolve(),
@@ -125,6 +201,8 @@ def generate_fixed_3tap_output_vector(
         acc_bits=acc_bits,
         coeff_bits=coeff_bits,
         overwrite=overwrite,
+        row_stats=row_stats,
+        workers=workers,
     )
 
 
@@ -136,6 +214,8 @@ def generate_fixed_5tap_output_vector(
     acc_bits: int = 32,
     coeff_bits: int = 16,
     overwrite: bool = False,
+    row_stats: bool = False,
+    workers: int = 1,
 ) -> int:
     return _generate_fixed_outputs_for_tap_map(
         input_dir=input_dir.resolve(),
@@ -146,6 +226,89 @@ def generate_fixed_5tap_output_vector(
         acc_bits=acc_bits,
         coeff_bits=coeff_bits,
         overwrite=overwrite,
+        row_stats=row_stats,
+        workers=workers,
+    )
+
+
+# 선택된 모든 탭 맵의 계수 세트를 이미지당 1회 순회(filter-bank)로 생성
+def _generate_fixed_outputs_bank(
+    *,
+    input_dir: Path,
+    output_root: Path,
+    tap_maps: dict[str, dict[str, list[float]]],
+    frac_bits: int,
+    acc_bits: int,
+    coeff_bits: int,
+    overwrite: bool = False,
+) -> dict[str, int]:
+    input_files = _iter_input_npy_files(input_dir)
+    if not input_files:
+        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
+
+    counts = {f"fixed_{tap_label}": 0 for tap_label in tap_maps}
+    for tap_label in tap_maps:
+        (output_root / f"fixed_{tap_label}").mkdir(parents=True, exist_ok=True)
+
+    for in_path in input_files:
+        case_stem = _case_stem_from_input(in_path)
+        h_list: list[list[float]] = []
+        out_paths: list[Path] = []
+        count_keys: list[str] = []
+        for tap_label, coeff_map in tap_maps.items():
+            out_dir = output_root / f"fixed_{tap_label}"
+            for coeff_name, h in coeff_map.items():
+                out_path = out_dir / f"{case_stem}__{coeff_name}_fixed_{tap_label}_y_u8.npy"
+                if out_path.exists() and not overwrite:
+                    continue
+                h_list.append(h)
+                out_paths.append(out_path)
+                count_keys.append(f"fixed_{tap_label}")
+        if not h_list:
+            continue
+
+        x_u8 = load_input_u8(in_path)
+        write_bank_outputs(
+            x_u8,
+            out_paths,
+            compute_block=lambda x_block: fir_1d_fixed_bank(
+                x_block,
+                h_list,
+                frac_bits=frac_bits,
+                acc_bits=acc_bits,
+                coeff_bits=coeff_bits,
+            ),
+            dtype=np.uint8,
+        )
+        for key in count_keys:
+            counts[key] += 1
+
+    return counts
+
+
+def generate_fixed_output_vectors_bank(
+    input_dir: Path = DEFAULT_INPUT_DIR,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    *,
+    tap: str = "all",
+    frac_bits: int = 12,
+    acc_bits: int = 32,
+    coeff_bits: int = 16,
+    overwrite: bool = False,
+) -> dict[str, int]:
+    tap_maps: dict[str, dict[str, list[float]]] = {}
+    if tap in ("all", "3"):
+        tap_maps["3tap"] = h_coeff_3tap_map
+    if tap in ("all", "5"):
+        tap_maps["5tap"] = h_coeff_5tap_map
+    return _generate_fixed_outputs_bank(
+        input_dir=input_dir.resolve(),
+        output_root=output_dir.resolve(),
+        tap_maps=tap_maps,
+        frac_bits=frac_bits,
+        acc_bits=acc_bits,
+        coeff_bits=coeff_bits,
+        overwrite=overwrite,
     )
 
 
@@ -194,6 +357,25 @@ def _build_argparser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing output vectors instead of skipping duplicates.",
     )
+    parser.add_argument(
+        "--bank",
+        action="store_true",
+        help="Evaluate all selected coefficient sets in one pass per image (filter-bank mode).",
+    )
+    parser.add_argument(
+        "--row-stats",
+        action="store_true",
+        help=(
+            f"Also save per-row wrap/saturation counters beside each output (*{ROW_STATS_SUFFIX}); "
+            "existing outputs without counters are regenerated."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for (case, coeff) jobs (default: 1, serial).",
+    )
     return parser
 
 
@@ -214,24 +396,47 @@ if __name__ == "__main__":
         e5 = 0
         if _args.tap in ("all", "3"):
             e3 = _expected_num_outputs(_input_dir, len(h_coeff_3tap_map))
-            c3 = generate_fixed_3tap_output_vector(
-                input_dir=_input_dir,
-                output_dir=_output_dir,
-                frac_bits=_args.frac_bits,
-                acc_bits=_args.acc_bits,
-                coeff_bits=_args.coeff_bits,
-                overwrite=_args.overwrite,
-            )
         if _args.tap in ("all", "5"):
             e5 = _expected_num_outputs(_input_dir, len(h_coeff_5tap_map))
-            c5 = generate_fixed_5tap_output_vector(
+        if _args.bank and _args.row_stats:
+            raise ValueError("--row-stats is not supported with --bank.")
+        if _args.bank and _args.workers != 1:
+            raise ValueError("--workers is not supported with --bank.")
+        if _args.bank:
+            _counts = generate_fixed_output_vectors_bank(
                 input_dir=_input_dir,
                 output_dir=_output_dir,
+                tap=_args.tap,
                 frac_bits=_args.frac_bits,
                 acc_bits=_args.acc_bits,
                 coeff_bits=_args.coeff_bits,
                 overwrite=_args.overwrite,
             )
+            c3 = _counts.get("fixed_3tap", 0)
+            c5 = _counts.get("fixed_5tap", 0)
+        else:
+            if _args.tap in ("all", "3"):
+                c3 = generate_fixed_3tap_output_vector(
+                    input_dir=_input_dir,
+                    output_dir=_output_dir,
+                    frac_bits=_args.frac_bits,
+                    acc_bits=_args.acc_bits,
+                    coeff_bits=_args.coeff_bits,
+                    overwrite=_args.overwrite,
+                    row_stats=_args.row_stats,
+                    workers=_args.workers,
+                )
+            if _args.tap in ("all", "5"):
+                c5 = generate_fixed_5tap_output_vector(
+                    input_dir=_input_dir,
+                    output_dir=_output_dir,
+                    frac_bits=_args.frac_bits,
+                    acc_bits=_args.acc_bits,
+                    coeff_bits=_args.coeff_bits,
+                    overwrite=_args.overwrite,
+                    row_stats=_args.row_stats,
+                    workers=_args.workers,
+                )
         total = c3 + c5
         expected_total = e3 + e5
         skipped_total = max(expected_total - total, 0)
@@ -0,0 +1,89 @@
+# File: gen_fused_output.py
+# Role: (case, coeff) 1개의 ideal/fixed 출력을 메모리에서 계산해 비교 지표와 복원 PNG로 바로 넘기는 fused job을 제공한다.
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from fir_1d.sim.vector import gen_3tap_compare_report, gen_5tap_compare_report
+from fir_1d.sim.vector.gen_fixed_output import _run_fixed
+from fir_1d.sim.vector.gen_ideal_output import _run_ideal
+from fir_1d.sim.vector.job_pool import SharedArrayRef, load_input_latest, resolve_input
+from fir_1d.sim.vector.restore_images import _load_gray_u8_image_backend, save_restored_image
+
+# 탭별 메모리 배열 비교 함수 (리포트 모듈의 compare_output_pair와 같은 행을 만든다)
+COMPARE_ARRAYS = {
+    "3": gen_3tap_compare_report.compare_output_arrays,
+    "5": gen_5tap_compare_report.compare_output_arrays,
+}
+
+
+def _fused_output_job(
+    source: Path | SharedArrayRef,
+    tap: str,
+    key: tuple[str, str],
+    h: list[float],
+    fixed_bits: tuple[int, int, int],
+    ideal_path: Path,
+    fixed_path: Path,
+    *,
+    save_ideal: bool = False,
+    save_fixed: bool = False,
+    compare: bool = True,
+    images: Sequence[tuple[str, Path]] = (),
+    ideal_policy: str = "clip",
+) -> dict[str, Any]:
+    """
+    입력 1장 x 계수 1개를 한 번에 처리한다: ideal/fixed 계산 -> (요청 시) .npy 저장
+    -> 비교 지표 -> 복원 PNG. 중간 벡터를 파일로 썼다가 다시 읽지 않는다.
+
+    ideal_path/fixed_path는 staged 경로와 같은 이름을 리포트 행과 복원 요약에 기록하기
+    위한 것이며, save_ideal/save_fixed일 때만 실제로 쓴다.
+
+    Args:
+        images: 저장할 PNG 목록 [(kind, png 경로)...] (kind: "ideal" | "fixed")
+
+    Returns:
+        {"pair": compare_output_arrays 결과 (compare=False면 None),
+         "converted": restore_images의 "converted"와 같은 항목 목록}
+    """
+    frac_bits, acc_bits, coeff_bits = fixed_bits
+    x_u8 = resolve_input(source, load_input_latest)
+    y_ideal, _ = _run_ideal(x_u8, h)  # numpy(direct) 엔진: FFT 편차 리포트 없음
+    y_fixed, _ = _run_fixed(x_u8, h, frac_bits=frac_bits, acc_bits=acc_bits, coeff_bits=coeff_bits)
+
+    if save_ideal:
+        ideal_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(ideal_path, y_ideal)
+    if save_fixed:
+        fixed_path.parent.mkdir(parents=True, exist_ok=True)
+        np.save(fixed_path, y_fixed)
+
+    pair = None
+    if compare:
+        pair = COMPARE_ARRAYS[tap](
+            key, y_ideal, y_fixed, ideal_file=ideal_path.name, fixed_file=fixed_path.name
+        )
+
+    converted: list[dict[str, Any]] = []
+    if images:
+        Image = _load_gray_u8_image_backend()
+        arrays = {"ideal": (y_ideal, ideal_path), "fixed": (y_fixed, fixed_path)}
+        for kind, png_path in images:
+            arr, npy_path = arrays[kind]
+            png_path.parent.mkdir(parents=True, exist_ok=True)
+            converted.append(
+                save_restored_image(
+                    Image,
+                    arr,
+                    png_path,
+                    kind=kind,
+                    tap=tap,
+                    ideal_policy=ideal_policy,
+                    input_npy=npy_path,
+                )
+            )
+    return {"pair": pair, "converted": converted}
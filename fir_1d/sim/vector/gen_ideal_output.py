@@ -5,16 +5,33 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 from time import perf_counter
+from typing import Any
 
 import numpy as np
 
-from fir_1d.model.python.fir_1d_ref import fir_1d_ideal
+from fir_1d.model.python.fir_1d_fft import fft_deviation_report
+from fir_1d.model.python.fir_1d_ref import fir_1d_ideal, fir_1d_ideal_2d, get_ideal_plan
+from fir_1d.model.python.fir_1d_bank import fir_1d_ideal_bank
 from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+from fir_1d.sim.vector.job_pool import (
+    SharedArrayRef,
+    load_input_latest,
+    load_input_u8,
+    log_worker_timing,
+    resolve_input,
+    run_image_jobs,
+    validate_workers,
+    write_bank_outputs,
+)
 
 
 THIS_FILE = Path(__file__).resolve()
 DEFAULT_INPUT_DIR = THIS_FILE.parent / "input"
 DEFAULT_OUTPUT_DIR = THIS_FILE.parent / "output"
+# numpy: fir_1d_ideal_2d(행렬 단위 벡터화, 루프와 bit-identical) / loop: fir_1d_ideal(참조 루프)
+# fft: overlap-add FFT (direct 대비 편차 검사) / dyadic: m/2^e 계수 정수 누산(정확값)
+# boxsum: 동일 계수 커널 누적합 / auto: dyadic > boxsum > 탭 수·폭 기준 direct/fft 자동 선택
+IDEAL_ENGINES = ("numpy", "loop", "fft", "dyadic", "boxsum", "auto")
 
 # 입력 : 처리 대상 파일 경로
 # 출력 : 처리 대상 파일 리스트
@@ -22,18 +39,7 @@ def _iter_input_npy_files(input_dir: Path) -> list[Path]:
     files = [p for p in input_dir.glob("*.npy") if p.name.endswith("_x_u8.npy")]
     return sorted(files, key=lambda p: p.name.lower())
 
-# 데이터 유효성 검토
-# 입력 : u8이미지 데이터 경로 
-# 출력 : 해당 데이터
-def _load_input_image_u8(path: Path) -> np.ndarray:
-    x = np.load(path)
-    if x.ndim != 2:
-        raise ValueError(f"{path.name}: expected 2D array, got shape={x.shape}")
-    if x.dtype != np.uint8:
-        x = x.astype(np.uint8)
-    return x
-
-# Fir 행 단위 실행
+# Fir 행 단위 실행 (참조 루프 엔진)
 def _run_ideal_rowwise(x_u8: np.ndarray, h: list[float]) -> np.ndarray:
     height, width = x_u8.shape
     y = np.zeros((height, width), dtype=np.float64)
@@ -49,6 +55,35 @@ def _run_ideal_rowwise(x_u8: np.ndarray, h: list[float]) -> np.ndarray:
         y[r, :] = y_arr
     return y
 
+# Fir 이미지 단위 실행: (y, FFT 편차 리포트 | None)
+# FFT로 실행된 경우에만 fft_deviation_report 결과를 함께 돌려준다 (출력은 호출 측이 모아 1줄로)
+def _run_ideal(
+    x_u8: np.ndarray, h: list[float], *, engine: str = "numpy"
+) -> tuple[np.ndarray, dict[str, Any] | None]:
+    if engine not in IDEAL_ENGINES:
+        raise ValueError(f"Invalid engine={engine}. engine must be one of {IDEAL_ENGINES}.")
+    if engine == "loop":
+        return _run_ideal_rowwise(x_u8, h), None
+
+    method = "direct" if engine == "numpy" else engine
+    y = fir_1d_ideal_2d(x_u8, h, method=method)
+    if y.shape != x_u8.shape:
+        raise ValueError(
+            f"Output shape mismatch: expected {x_u8.shape}, got {y.shape}. "
+            "Check fir_1d_ideal_2d same-mode output length."
+        )
+
+    # FFT 경로는 샘플 행을 direct로 재계산해 편차를 보고/검증한다
+    plan = get_ideal_plan(h)
+    if plan.resolve_method(x_u8.shape[1], method) != "fft":
+        return y, None
+    report = fft_deviation_report(x_u8, plan.taps, y)
+    if not report["within_tol"]:
+        raise ValueError(
+            f"FFT deviation from direct path too large: max_abs_dev={report['max_abs_dev']}."
+        )
+    return y, report
+
 # 파일 명에서 공통 prefix 추출
 def _case_stem_from_input(path: Path) -> str:
     suffix = "_x_u8.npy"
@@ -57,35 +92,82 @@ def _case_stem_from_input(path: Path) -> str:
     return path.stem
 
 
-def _generate_ideal_outputs_for_tap_map(
-    *,
-    input_dir: Path,
+# (case, coeff) job 1개: 입력(경로 또는 공유 메모리) -> ideal 실행 -> 출력 저장
+# 반환: FFT 편차 리포트 (FFT로 실행되지 않았으면 None)
+def _ideal_output_job(
+    source: Path | SharedArrayRef,
+    out_path: Path,
+    h: list[float],
+    engine: str,
+) -> dict[str, Any] | None:
+    x_u8 = resolve_input(source, load_input_latest)
+    y, fft_report = _run_ideal(x_u8, h, engine=engine)
+    np.save(out_path, y)
+    return fft_report
+
+
+# job별 FFT 편차 리포트 -> 1줄 요약 (FFT job이 없으면 출력하지 않음)
+def _log_fft_deviation(label: str, reports: list[dict[str, Any] | None]) -> None:
+    reports = [r for r in reports if r is not None]
+    if not reports:
+        return
+    worst = max(reports, key=lambda r: r["max_abs_dev"])
+    print(
+        f"[fft] {label} outputs={len(reports)} "
+        f"checked_rows={sum(r['checked_rows'] for r in reports)} "
+        f"max_abs_dev={worst['max_abs_dev']:.3e} (taps={worst['num_taps']} nfft={worst['nfft']})"
+    )
+
+
+# 생성할 (case, coeff) job 목록: (입력 경로, 출력 경로, h, engine)
+# skip 판단은 실행 전에 부모 프로세스에서 끝내므로 workers 수와 무관하게 결정적이다
+def _ideal_output_jobs(
+    input_files: list[Path],
     out_dir: Path,
     coeff_map: dict[str, list[float]],
     tap_label: str,
+    *,
     overwrite: bool = False,
-) -> int:
-    input_files = _iter_input_npy_files(input_dir)
-    if not input_files:
-        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
-
+    engine: str = "numpy",
+) -> list[tuple[Path, Path, list[float], str]]:
     out_dir.mkdir(parents=True, exist_ok=True)
-    generated = 0
-
+    jobs = []
     for in_path in input_files:
-        x_u8 = _load_input_image_u8(in_path)
         case_stem = _case_stem_from_input(in_path)
-
         for coeff_name, h in coeff_map.items():
             out_name = f"{case_stem}__{coeff_name}_ideal_{tap_label}_y_f64.npy"
             out_path = out_dir / out_name
             if out_path.exists() and not overwrite:
                 continue
-            y = _run_ideal_rowwise(x_u8, h)
-            np.save(out_path, y)
-            generated += 1
+            jobs.append((in_path, out_path, h, engine))
+    return jobs
+
+
+def _generate_ideal_outputs_for_tap_map(
+    *,
+    input_dir: Path,
+    out_dir: Path,
+    coeff_map: dict[str, list[float]],
+    tap_label: str,
+    overwrite: bool = False,
+    engine: str = "numpy",
+    workers: int = 1,
+) -> int:
+    validate_workers(workers)
+    input_files = _iter_input_npy_files(input_dir)
+    if not input_files:
+        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
 
-    return generated
+    jobs = _ideal_output_jobs(
+        input_files, out_dir, coeff_map, tap_label, overwrite=overwrite, engine=engine
+    )
+    fft_reports, worker_timing = run_image_jobs(
+        _ideal_output_job, jobs, workers=workers, load=load_input_latest
+    )
+    _log_fft_deviation(f"ideal_{tap_label}", fft_reports)
+    if workers > 1:
+        log_worker_timing(f"ideal_{tap_label}", worker_timing)
+    return len(jobs)
 
 
 def generate_ideal_3tap_output_vector(
@@ -93,6 +175,8 @@ def generate_ideal_3tap_output_vector(
     output_dir: Path = DEFAULT_OUTPUT_DIR,
     *,
     overwrite: bool = False,
+    engine: str = "numpy",
+    workers: int = 1,
 ) -> int:
     return _generate_ideal_outputs_for_tap_map(
         input_dir=input_dir.resolve(),
@@ -100,6 +184,8 @@ def generate_ideal_3tap_output_vector(
         coeff_map=h_coeff_3tap_map,
         tap_label="3tap",
         overwrite=overwrite,
+        engine=engine,
+        workers=workers,
     )
 
 
@@ -108,6 +194,8 @@ def generate_ideal_5tap_output_vector(
     output_dir: Path = DEFAULT_OUTPUT_DIR,
     *,
     overwrite: bool = False,
+    engine: str = "numpy",
+    workers: int = 1,
 ) -> int:
     return _generate_ideal_outputs_for_tap_map(
         input_dir=input_dir.resolve(),
@@ -115,6 +203,74 @@ def generate_ideal_5tap_output_vector(
         coeff_map=h_coeff_5tap_map,
         tap_label="5tap",
         overwrite=overwrite,
+        engine=engine,
+        workers=workers,
+    )
+
+
+# 선택된 모든 탭 맵의 계수 세트를 이미지당 1회 순회(filter-bank)로 생성
+def _generate_ideal_outputs_bank(
+    *,
+    input_dir: Path,
+    output_root: Path,
+    tap_maps: dict[str, dict[str, list[float]]],
+    overwrite: bool = False,
+) -> dict[str, int]:
+    input_files = _iter_input_npy_files(input_dir)
+    if not input_files:
+        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
+
+    counts = {f"ideal_{tap_label}": 0 for tap_label in tap_maps}
+    for tap_label in tap_maps:
+        (output_root / f"ideal_{tap_label}").mkdir(parents=True, exist_ok=True)
+
+    for in_path in input_files:
+        case_stem = _case_stem_from_input(in_path)
+        h_list: list[list[float]] = []
+        out_paths: list[Path] = []
+        count_keys: list[str] = []
+        for tap_label, coeff_map in tap_maps.items():
+            out_dir = output_root / f"ideal_{tap_label}"
+            for coeff_name, h in coeff_map.items():
+                out_path = out_dir / f"{case_stem}__{coeff_name}_ideal_{tap_label}_y_f64.npy"
+                if out_path.exists() and not overwrite:
+                    continue
+                h_list.append(h)
+                out_paths.append(out_path)
+                count_keys.append(f"ideal_{tap_label}")
+        if not h_list:
+            continue
+
+        x_u8 = load_input_u8(in_path)
+        write_bank_outputs(
+            x_u8,
+            out_paths,
+            compute_block=lambda x_block: fir_1d_ideal_bank(x_block, h_list),
+            dtype=np.float64,
+        )
+        for key in count_keys:
+            counts[key] += 1
+
+    return counts
+
+
+def generate_ideal_output_vectors_bank(
+    input_dir: Path = DEFAULT_INPUT_DIR,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    *,
+    tap: str = "all",
+    overwrite: bool = False,
+) -> dict[str, int]:
+    tap_maps: dict[str, dict[str, list[float]]] = {}
+    if tap in ("all", "3"):
+        tap_maps["3tap"] = h_coeff_3tap_map
+    if tap in ("all", "5"):
+        tap_maps["5tap"] = h_coeff_5tap_map
+    return _generate_ideal_outputs_bank(
+        input_dir=input_dir.resolve(),
+        output_root=output_dir.resolve(),
+        tap_maps=tap_maps,
+        overwrite=overwrite,
     )
 
 
@@ -145,6 +301,23 @@ def _build_argparser() -> argparse.ArgumentParser:
         action="store_true",
         help="Overwrite existing output vectors instead of skipping duplicates.",
     )
+    parser.add_argument(
+        "--bank",
+        action="store_true",
+        help="Evaluate all selected coefficient sets in one pass per image (filter-bank mode).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=IDEAL_ENGINES,
+        default="numpy",
+        help="Ideal model engine: vectorized numpy, reference loop, fft, dyadic, boxsum or auto (default: numpy).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes for (case, coeff) jobs (default: 1, serial).",
+    )
     return parser
 
 
@@ -165,18 +338,38 @@ if __name__ == "__main__":
         e5 = 0
         if _args.tap in ("all", "3"):
             e3 = _expected_num_outputs(_input_dir, len(h_coeff_3tap_map))
-            c3 = generate_ideal_3tap_output_vector(
-                input_dir=_input_dir,
-                output_dir=_output_dir,
-                overwrite=_args.overwrite,
-            )
         if _args.tap in ("all", "5"):
             e5 = _expected_num_outputs(_input_dir, len(h_coeff_5tap_map))
-            c5 = generate_ideal_5tap_output_vector(
+        if _args.bank:
+            if _args.engine != "numpy":
+                raise ValueError("--bank requires --engine numpy.")
+            if _args.workers != 1:
+                raise ValueError("--workers is not supported with --bank.")
+            _counts = generate_ideal_output_vectors_bank(
                 input_dir=_input_dir,
                 output_dir=_output_dir,
+                tap=_args.tap,
                 overwrite=_args.overwrite,
             )
+            c3 = _counts.get("ideal_3tap", 0)
+            c5 = _counts.get("ideal_5tap", 0)
+        else:
+            if _args.tap in ("all", "3"):
+                c3 = generate_ideal_3tap_output_vector(
+                    input_dir=_input_dir,
+                    output_dir=_output_dir,
+                    overwrite=_args.overwrite,
+                    engine=_args.engine,
+                    workers=_args.workers,
+                )
+            if _args.tap in ("all", "5"):
+                c5 = generate_ideal_5tap_output_vector(
+                    input_dir=_input_dir,
+                    output_dir=_output_dir,
+                    overwrite=_args.overwrite,
+                    engine=_args.engine,
+                    workers=_args.workers,
+                )
         total = c3 + c5
         expected_total = e3 + e5
         skipped_total = max(expected_total - total, 0)
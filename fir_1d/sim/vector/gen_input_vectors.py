@@ -93,82 +93,119 @@ def _make_preview(gray_u8: np.ndarray, *, max_rows: int = 8, max_cols: int = 16)
     }
 
 
-def generate_input_vector_jsons(
-    image_dir: Path = DEFAULT_IMAGE_DIR,
-    output_dir: Path = DEFAULT_OUTPUT_DIR,
+# case 이름과 입력 벡터 파일 이름 (이미지 목록 순번 + 파일 stem)
+def _case_name(idx: int, image_path: Path) -> str:
+    return f"case_{idx:03d}_{image_path.stem}"
+
+
+def _case_data_file(output_dir: Path, idx: int, image_path: Path) -> Path:
+    return output_dir / f"{_case_name(idx, image_path)}_x_u8.npy"
+
+
+def _case_preview_file(data_file: Path) -> Path:
+    return data_file.with_name(data_file.name.removesuffix("_x_u8.npy") + "_preview.json")
+
+
+# 이미지 1장 -> case 입력 벡터(.npy) + 프리뷰 JSON. 반환: (매니페스트 case 항목, 생성 여부)
+def _generate_input_case(
+    idx: int,
+    image_path: Path,
+    output_dir: Path,
     *,
     overwrite: bool = False,
-) -> dict:
-    """
-    Generate per-image preview JSON and per-image NumPy .npy data files.
-    """
-    image_dir = image_dir.resolve()
-    output_dir = output_dir.resolve()
+) -> tuple[dict, bool]:
+    gray_u8 = _load_image_gray_u8(image_path)
+    h, w = gray_u8.shape
+
+    case_name = _case_name(idx, image_path)
+    data_file = _case_data_file(output_dir, idx, image_path)
+    preview_file = _case_preview_file(data_file)
+
+    # overwrite=False에서 기존 벡터/프리뷰가 모두 있으면 중복 생성하지 않는다.
+    generated = False
+    if not (data_file.exists() and preview_file.exists()) or overwrite:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        np.save(data_file, gray_u8)
+
+        payload = {
+            "case_name": case_name,
+            "image_name": image_path.name,
+            "source_path": str(image_path),
+            "width": w,
+            "height": h,
+            "dtype": "uint8",
+            "layout": "row_major_2d",
+            "data_file": data_file.name,
+            **_make_preview(gray_u8),
+        }
+        _write_preview_json_compact_rows(preview_file, payload)
+        generated = True
+
+    case = {
+        "case_name": case_name,
+        "image_name": image_path.name,
+        "width": w,
+        "height": h,
+        "dtype": "uint8",
+        "data_npy": data_file.name,
+        "preview_json": preview_file.name,
+    }
+    return case, generated
+
 
+# 입력 이미지 목록 검증 (디렉터리 없음 / 이미지 없음은 예외)
+def _list_source_images(image_dir: Path) -> list[Path]:
     if not image_dir.exists():
         raise FileNotFoundError(f"Image directory not found: {image_dir}")
-
     image_files = _iter_image_files(image_dir)
     if not image_files:
         raise FileNotFoundError(f"No image files found in: {image_dir}")
+    return image_files
 
-    cases: list[dict] = []
-    generated_cases = 0
-    skipped_cases = 0
-    for idx, image_path in enumerate(image_files):
-        gray_u8 = _load_image_gray_u8(image_path)
-        h, w = gray_u8.shape
-
-        case_name = f"case_{idx:03d}_{image_path.stem}"
-        data_file = output_dir / f"{case_name}_x_u8.npy"
-        preview_file = output_dir / f"{case_name}_preview.json"
-
-        # overwrite=False에서 기존 벡터/프리뷰가 모두 있으면 중복 생성하지 않는다.
-        if (data_file.exists() and preview_file.exists()) and not overwrite:
-            skipped_cases += 1
-        else:
-            np.save(data_file, gray_u8)
-
-            payload = {
-                "case_name": case_name,
-                "image_name": image_path.name,
-                "source_path": str(image_path),
-                "width": w,
-                "height": h,
-                "dtype": "uint8",
-                "layout": "row_major_2d",
-                "data_file": data_file.name,
-                **_make_preview(gray_u8),
-            }
-            _write_preview_json_compact_rows(preview_file, payload)
-            generated_cases += 1
-
-        cases.append(
-            {
-                "case_name": case_name,
-                "image_name": image_path.name,
-                "width": w,
-                "height": h,
-                "dtype": "uint8",
-                "data_npy": data_file.name,
-                "preview_json": preview_file.name,
-            }
-        )
 
+# case 결과(이미지 순서)로 매니페스트를 만들고 input_vector_manifest.json에 기록
+def _write_input_manifest(
+    image_dir: Path,
+    output_dir: Path,
+    case_results: list[tuple[dict, bool]],
+    *,
+    overwrite: bool,
+) -> dict:
+    generated_cases = sum(1 for _, generated in case_results if generated)
     manifest = {
         "note": "FIR 1D input vectors: pixel data in .npy, small previews in .json.",
         "source_image_dir": str(image_dir),
         "output_dir": str(output_dir),
-        "num_images": len(cases),
+        "num_images": len(case_results),
         "overwrite": bool(overwrite),
         "generated_cases": generated_cases,
-        "skipped_cases": skipped_cases,
-        "cases": cases,
+        "skipped_cases": len(case_results) - generated_cases,
+        "cases": [case for case, _ in case_results],
     }
     _write_json(output_dir / "input_vector_manifest.json", manifest)
     return manifest
 
 
+def generate_input_vector_jsons(
+    image_dir: Path = DEFAULT_IMAGE_DIR,
+    output_dir: Path = DEFAULT_OUTPUT_DIR,
+    *,
+    overwrite: bool = False,
+) -> dict:
+    """
+    Generate per-image preview JSON and per-image NumPy .npy data files.
+    """
+    image_dir = image_dir.resolve()
+    output_dir = output_dir.resolve()
+
+    image_files = _list_source_images(image_dir)
+    case_results = [
+        _generate_input_case(idx, image_path, output_dir, overwrite=overwrite)
+        for idx, image_path in enumerate(image_files)
+    ]
+    return _write_input_manifest(image_dir, output_dir, case_results, overwrite=overwrite)
+
+
 def _build_argparser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate FIR 1D input vectors (.npy) and preview/manifest JSON files."
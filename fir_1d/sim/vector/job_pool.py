@@ -0,0 +1,456 @@
+# File: job_pool.py
+# Role: 출력 생성기의 독립 (case, coeff) job과 파이프라인 의존성 그래프를 프로세스 풀로 실행하고 worker별 시간을 집계한다.
+#       생성기가 공유하는 입력 로드와 filter-bank 출력 기록도 제공한다.
+from __future__ import annotations
+
+import os
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import lru_cache
+from multiprocessing import shared_memory
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+
+# 공유 메모리 배열 참조: (segment 이름, shape, dtype 문자열). job 인자로 pickle 되는 것은 이 tuple뿐이다.
+SharedArrayRef = tuple[str, tuple[int, ...], str]
+# filter-bank 모드에서 한 번에 처리하는 행 블록 크기 (메모리 상한)
+BANK_BLOCK_ROWS = 256
+
+
+def validate_workers(workers: int) -> None:
+    if isinstance(workers, bool) or not isinstance(workers, int) or workers < 1:
+        raise ValueError(f"Invalid workers={workers}. workers must be an integer >= 1.")
+
+
+# worker 프로세스에서 job 1개 실행: (결과, pid, 실행 시간)
+def _timed_call(
+    fn: Callable[..., Any],
+    args: tuple,
+    kwargs: dict[str, Any] | None = None,
+) -> tuple[Any, int, float]:
+    t0 = perf_counter()
+    result = fn(*args, **(kwargs or {}))
+    return result, os.getpid(), perf_counter() - t0
+
+
+# (결과, pid, 실행 시간) 기록 -> worker(pid)별 시간 집계 (첫 job 순서)
+def _worker_timing(records: Iterable[tuple[Any, int, float]]) -> list[dict[str, Any]]:
+    timing: dict[int, dict[str, Any]] = {}
+    for _, pid, elapsed in records:
+        entry = timing.setdefault(pid, {"worker": len(timing), "pid": pid, "jobs": 0, "busy_s": 0.0})
+        entry["jobs"] += 1
+        entry["busy_s"] += elapsed
+    return list(timing.values())
+
+
+def run_jobs(
+    fn: Callable[..., Any],
+    jobs: Sequence[tuple],
+    *,
+    workers: int = 1,
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """
+    jobs의 각 인자 tuple로 fn을 실행한다.
+
+    workers=1이면 현재 프로세스에서 순서대로 실행하고, 2 이상이면 프로세스 풀에서
+    실행한다. 결과는 항상 jobs 순서이며, 실패한 job이 있으면 jobs 순서상 첫 예외를
+    다시 발생시킨다. fn은 모듈 최상위 함수(pickle 가능)여야 한다.
+
+    Returns:
+        (results, worker_timing)
+        worker_timing: worker(pid)별 {"worker", "pid", "jobs", "busy_s"} (첫 job 순서)
+    """
+    validate_workers(workers)
+    if workers == 1 or len(jobs) <= 1:
+        records = [_timed_call(fn, args) for args in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            records = list(pool.map(_timed_call, [fn] * len(jobs), jobs))
+
+    return [result for result, _, _ in records], _worker_timing(records)
+
+
+# worker별 실행 시간 로그 (예: [workers] gen_fixed_output worker=0 pid=123 jobs=4 busy=1.23s)
+def log_worker_timing(label: str, worker_timing: list[dict[str, Any]]) -> None:
+    for entry in worker_timing:
+        print(
+            f"[workers] {label} worker={entry['worker']} pid={entry['pid']} "
+            f"jobs={entry['jobs']} busy={entry['busy_s']:.2f}s"
+        )
+
+
+class SharedArrays:
+    """
+    입력 행렬을 multiprocessing.shared_memory에 1회 게시하고, 종료 시 모든 segment를 해제하는
+    context manager (부모 프로세스 전용)
+
+    with 블록을 벗어나면 성공/예외/KeyboardInterrupt(Ctrl-C) 모두에서 close + unlink 한다.
+    SIGKILL 등으로 부모가 finally 없이 종료되면 생성한 segment는 multiprocessing
+    resource tracker가 정리한다 (생성 측만 추적, worker 측 attach는 추적하지 않음).
+    """
+
+    def __init__(self) -> None:
+        self._segments: list[shared_memory.SharedMemory] = []
+
+    def publish(self, array: np.ndarray) -> SharedArrayRef:
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._segments.append(shm)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        view[...] = array
+        del view  # close 전에 buffer export를 남기지 않는다
+        return shm.name, tuple(array.shape), array.dtype.str
+
+    # segment 1개를 즉시 해제 (이미 attach 한 worker의 매핑은 닫을 때까지 유효)
+    def release(self, ref: SharedArrayRef) -> None:
+        for i, shm in enumerate(self._segments):
+            if shm.name == ref[0]:
+                del self._segments[i]
+                shm.close()
+                try:
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+                return
+
+    def close(self) -> None:
+        while self._segments:
+            shm = self._segments.pop()
+            shm.close()
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# worker 프로세스의 attach 캐시: 직전 segment 1개만 유지 (job은 이미지 순서로 배치됨)
+_attached: dict[str, tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+
+def attach_shared(ref: SharedArrayRef) -> np.ndarray:
+    """공유 메모리 배열을 복사 없이 읽기 전용 ndarray로 attach 한다."""
+    name, shape, dtype = ref
+    cached = _attached.get(name)
+    if cached is not None:
+        return cached[1]
+    for old_name in list(_attached):
+        old_shm, _ = _attached.pop(old_name)
+        try:
+            old_shm.close()
+        except BufferError:
+            pass  # 이전 배열이 아직 참조 중이면 프로세스 종료 시 해제
+    shm = shared_memory.SharedMemory(name=name, track=False)  # 해제 책임은 게시한 부모에만 있다
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    array.setflags(write=False)
+    _attached[name] = (shm, array)
+    return array
+
+
+# 입력 벡터(.npy) 로드 + 유효성 검토: 2D 가 아니면 거부, uint8 이 아니면 변환
+def load_input_u8(path: Path) -> np.ndarray:
+    x = np.load(path)
+    if x.ndim != 2:
+        raise ValueError(f"{path.name}: expected 2D array, got shape={x.shape}")
+    if x.dtype != np.uint8:
+        x = x.astype(np.uint8)
+    return x
+
+
+# job은 이미지 순서로 배치되므로 (프로세스별) 직전 이미지 1개만 재사용한다
+# mtime_ns를 키에 포함해 같은 경로의 파일이 바뀌면 다시 읽는다
+@lru_cache(maxsize=1)
+def _load_input_cached(path: Path, mtime_ns: int) -> np.ndarray:
+    return load_input_u8(path)
+
+
+def load_input_latest(path: Path) -> np.ndarray:
+    return _load_input_cached(path, path.stat().st_mtime_ns)
+
+
+def write_bank_outputs(
+    x_u8: np.ndarray,
+    out_paths: Sequence[Path],
+    *,
+    compute_block: Callable[[np.ndarray], np.ndarray],
+    dtype: type,
+    block_rows: int = BANK_BLOCK_ROWS,
+) -> None:
+    """
+    행 블록 단위로 filter-bank를 실행해 출력별 .npy(memmap)에 직접 기록한다.
+
+    compute_block(x 행 블록)은 (rows, W, len(out_paths)) 배열을 반환해야 하며, 마지막 축
+    f번째 출력이 out_paths[f]에 기록된다. 완료 전에는 ".part" 임시 파일에 쓰고, 성공 시에만
+    최종 이름으로 교체한다.
+    """
+    height = x_u8.shape[0]
+    part_paths = [p.with_name(p.name + ".part") for p in out_paths]
+    # memmap은 outs 리스트로만 참조한다: 비우면 매핑이 모두 닫힌다
+    # (Windows는 매핑이 열린 파일을 replace/unlink 할 수 없다)
+    outs: list[np.memmap] = []
+    try:
+        outs.extend(
+            np.lib.format.open_memmap(part, mode="w+", dtype=dtype, shape=x_u8.shape)
+            for part in part_paths
+        )
+        for r0 in range(0, height, block_rows):
+            x_block = x_u8[r0 : r0 + block_rows, :]
+            y_block = compute_block(x_block)
+            if y_block.shape != x_block.shape + (len(outs),):
+                raise ValueError(
+                    f"Bank output shape mismatch at rows {r0}..: got {y_block.shape}. "
+                    "Check filter-bank same-mode output length."
+                )
+            for f in range(len(outs)):
+                outs[f][r0 : r0 + block_rows, :] = y_block[:, :, f]
+        while outs:
+            outs.pop().flush()
+        for part, out_path in zip(part_paths, out_paths):
+            os.replace(part, out_path)
+    finally:
+        outs.clear()
+        for part in part_paths:
+            part.unlink(missing_ok=True)
+
+
+# job 입력: 경로(직렬 실행, 로더로 읽기) 또는 공유 메모리 참조(프로세스 풀)
+def resolve_input(source: Path | SharedArrayRef, load: Callable[[Path], np.ndarray]) -> np.ndarray:
+    if isinstance(source, Path):
+        return load(source)
+    return attach_shared(source)
+
+
+class DagTask:
+    """
+    의존성 그래프의 task 1개 (run_dag 입력)
+
+    - fn(*args, **kwargs): 일반 task. workers >= 2면 프로세스 풀에서 실행하므로
+      fn은 모듈 최상위 함수, 인자/결과는 pickle 가능해야 한다.
+    - local=True: 부모 프로세스에서 fn(dep_results, *args, **kwargs)로 실행한다.
+      dep_results는 {의존 task 이름: 결과} dict이며, 여러 task 결과를 모으는 가벼운
+      집계(매니페스트/리포트 작성 등)에 쓴다.
+    - deps: 먼저 끝나야 하는 task 이름들 (run_dag에 함께 전달된 task여야 함)
+    - shared_input=True: args[0]이 입력 이미지 경로인 풀 task. workers >= 2면 run_dag가
+      그 경로를 (deps가 끝난 뒤) 1회 load 해 공유 메모리에 게시하고 SharedArrayRef로
+      바꿔 보낸다. fn은 resolve_input으로 입력을 받아야 한다.
+    """
+
+    __slots__ = ("fn", "args", "kwargs", "deps", "local", "shared_input")
+
+    def __init__(
+        self,
+        fn: Callable[..., Any],
+        args: tuple = (),
+        kwargs: dict[str, Any] | None = None,
+        *,
+        deps: Iterable[str] = (),
+        local: bool = False,
+        shared_input: bool = False,
+    ) -> None:
+        if local and shared_input:
+            raise ValueError("shared_input applies to pool tasks only (local=False).")
+        self.fn = fn
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.deps = tuple(deps)
+        self.local = bool(local)
+        self.shared_input = bool(shared_input)
+
+
+# 의존성 검증: 없는 이름 / 순환을 실행 전에 거부한다
+def _validate_dag(tasks: Mapping[str, DagTask]) -> None:
+    for name, task in tasks.items():
+        for dep in task.deps:
+            if dep not in tasks:
+                raise ValueError(f"Task {name!r} depends on unknown task {dep!r}.")
+
+    state: dict[str, int] = {}  # 1: 방문 중, 2: 완료
+    for root in tasks:
+        if root in state:
+            continue
+        stack = [(root, iter(tasks[root].deps))]
+        state[root] = 1
+        while stack:
+            name, deps = stack[-1]
+            dep = next(deps, None)
+            if dep is None:
+                state[name] = 2
+                stack.pop()
+            elif state.get(dep) == 1:
+                raise ValueError(f"Dependency cycle detected at task {dep!r}.")
+            elif dep not in state:
+                state[dep] = 1
+                stack.append((dep, iter(tasks[dep].deps)))
+
+
+def run_dag(
+    tasks: Mapping[str, DagTask],
+    *,
+    workers: int = 1,
+    load: Callable[[Path], np.ndarray] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """
+    의존성 그래프를 단계 barrier 없이 실행한다.
+
+    각 task는 deps가 모두 끝나는 즉시 실행 가능해지고, 실행 가능한 task 중 tasks 삽입
+    순서가 앞선 것부터 실행한다 (case 단위로 삽입하면 case별로 앞 단계부터 흘러간다).
+    workers >= 2면 일반 task는 최대 workers개까지 프로세스 풀에서 동시에 실행하고,
+    local task는 부모 프로세스에서 곧바로 실행한다. workers=1이면 현재 프로세스에서
+    삽입 순서 기준 위상 정렬 순서로 실행한다.
+
+    shared_input task의 입력은 workers >= 2일 때 run_image_jobs처럼 부모가 경로당 1회
+    load로 읽어 공유 메모리에 게시한다. 게시는 그 경로를 쓰는 첫 task 제출 시점(입력을
+    만드는 task가 끝난 뒤)에 하고, 그 경로를 쓰는 마지막 task가 끝나면 해제하므로 동시에
+    게시된 입력은 실행 중인 case 수 정도로 유지된다. workers=1이면 경로 그대로 실행한다.
+
+    task가 실패하면 새 task 제출을 멈추고 실행 중인 task가 끝나기를 기다린 뒤 그
+    예외를 다시 발생시킨다.
+
+    Returns:
+        (results, worker_timing)
+        results: {task 이름: 결과}
+        worker_timing: 풀 task의 worker(pid)별 {"worker", "pid", "jobs", "busy_s"}
+    """
+    validate_workers(workers)
+    _validate_dag(tasks)
+
+    order = {name: i for i, name in enumerate(tasks)}
+    waiting = {name: set(task.deps) for name, task in tasks.items()}
+    dependents: dict[str, list[str]] = {name: [] for name in tasks}
+    for name, task in tasks.items():
+        for dep in set(task.deps):
+            dependents[dep].append(name)
+
+    results: dict[str, Any] = {}
+    records: list[tuple[Any, int, float]] = []
+    ready = [name for name in tasks if not waiting[name]]
+
+    def _finish(name: str) -> None:
+        for child in dependents[name]:
+            waiting[child].discard(name)
+            if not waiting[child]:
+                ready.append(child)
+        ready.sort(key=order.__getitem__)
+
+    def _run_local(name: str) -> None:
+        task = tasks[name]
+        dep_results = {dep: results[dep] for dep in task.deps}
+        results[name] = task.fn(dep_results, *task.args, **task.kwargs)
+        _finish(name)
+
+    if workers == 1:
+        while ready:
+            name = ready.pop(0)
+            task = tasks[name]
+            if task.local:
+                _run_local(name)
+                continue
+            record = _timed_call(task.fn, task.args, task.kwargs)
+            records.append(record)
+            results[name] = record[0]
+            _finish(name)
+        return results, _worker_timing(records)
+
+    # 공유 입력: 경로별 남은 사용 task 수 (0이 되면 segment 해제)
+    input_users: dict[Path, int] = {}
+    for task in tasks.values():
+        if task.shared_input:
+            input_users[task.args[0]] = input_users.get(task.args[0], 0) + 1
+    if input_users and load is None:
+        raise ValueError("run_dag needs load= to publish shared_input tasks with workers >= 2.")
+    input_refs: dict[Path, SharedArrayRef] = {}
+
+    def _pool_args(task: DagTask, shared: SharedArrays) -> tuple:
+        if not task.shared_input:
+            return task.args
+        path = task.args[0]
+        if path not in input_refs:
+            input_refs[path] = shared.publish(load(path))
+        return (input_refs[path],) + task.args[1:]
+
+    def _input_done(task: DagTask, shared: SharedArrays) -> None:
+        if not task.shared_input:
+            return
+        path = task.args[0]
+        input_users[path] -= 1
+        if input_users[path] == 0 and path in input_refs:
+            shared.release(input_refs.pop(path))
+
+    running: dict[Future, str] = {}
+    error: BaseException | None = None
+    # 풀을 먼저 닫고(실행 중 task 대기) 공유 입력을 해제한다
+    with SharedArrays() as shared, ProcessPoolExecutor(max_workers=workers) as pool:
+        while True:
+            while error is None and ready:
+                # local task는 풀 자리를 차지하지 않으므로 먼저 비운다
+                local = next((n for n in ready if tasks[n].local), None)
+                if local is not None:
+                    ready.remove(local)
+                    try:
+                        _run_local(local)
+                    except BaseException as exc:
+                        error = exc
+                    continue
+                if len(running) >= workers:
+                    break
+                name = ready.pop(0)
+                task = tasks[name]
+                try:
+                    args = _pool_args(task, shared)
+                except BaseException as exc:
+                    error = exc
+                    break
+                running[pool.submit(_timed_call, task.fn, args, task.kwargs)] = name
+            if not running:
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: order[running[f]]):
+                name = running.pop(future)
+                _input_done(tasks[name], shared)
+                try:
+                    record = future.result()
+                except BaseException as exc:
+                    if error is None:
+                        error = exc
+                    continue
+                records.append(record)
+                results[name] = record[0]
+                _finish(name)
+
+    if error is not None:
+        raise error
+    return results, _worker_timing(records)
+
+
+def run_image_jobs(
+    fn: Callable[..., Any],
+    jobs: Sequence[tuple],
+    *,
+    workers: int = 1,
+    load: Callable[[Path], np.ndarray],
+) -> tuple[list[Any], list[dict[str, Any]]]:
+    """
+    첫 인자가 입력 이미지 경로인 jobs를 실행한다 (결과는 jobs 순서).
+
+    workers >= 2면 jobs를 shared_input task로 run_dag에 넘긴다. 부모는 jobs 순서대로
+    입력을 처음 쓰는 job을 제출할 때 1회 load 해 공유 메모리에 게시하고, 그 입력의
+    마지막 job이 끝나면 segment를 해제한다. 따라서 /dev/shm 사용량은 입력 디렉터리
+    전체가 아니라 실행 중인 입력 수에 비례한다. worker는 resolve_input으로 복사 없이
+    attach 하므로 계수 세트마다 이미지를 pickle/재로드하지 않는다. 실패/중단 시에도 모든
+    segment를 해제한다. workers=1이면 경로 그대로 현재 프로세스에서 실행한다.
+    """
+    validate_workers(workers)
+    if workers == 1 or len(jobs) <= 1:
+        return run_jobs(fn, jobs, workers=1)
+
+    tasks = {f"job:{i}": DagTask(fn, job, shared_input=True) for i, job in enumerate(jobs)}
+    results, worker_timing = run_dag(tasks, workers=workers, load=load)
+    return [results[f"job:{i}"] for i in range(len(jobs))], worker_timing
@@ -15,6 +15,7 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from collections.abc import Collection
 from datetime import datetime, timezone
 from pathlib import Path
 from time import perf_counter
@@ -101,6 +102,33 @@ def _subdir_name(kind: str, tap: str, *, ideal_policy: str) -> str:
     return f"{kind}_{tap}tap"
 
 
+# 출력 벡터 1개 -> PNG 저장. 반환: restore 요약의 "converted" 항목
+def save_restored_image(
+    Image,
+    arr: np.ndarray,
+    out_path: Path,
+    *,
+    kind: str,
+    tap: str,
+    ideal_policy: str,
+    input_npy: Path,
+) -> dict[str, Any]:
+    img_u8 = _convert_array_to_image_u8(arr, kind=kind, ideal_policy=ideal_policy)
+    Image.fromarray(img_u8, mode="L").save(out_path)
+    return {
+        "input_npy": str(input_npy),
+        "output_img": str(out_path),
+        "kind": kind,
+        "tap": f"{tap}tap",
+        "ideal_policy": ideal_policy if kind == "ideal" else "n/a",
+        "height": int(img_u8.shape[0]),
+        "width": int(img_u8.shape[1]),
+        "dtype": str(img_u8.dtype),
+        "pixel_min": int(img_u8.min()),
+        "pixel_max": int(img_u8.max()),
+    }
+
+
 def restore_images(
     *,
     vector_output_dir: Path = DEFAULT_VECTOR_OUTPUT_DIR,
@@ -110,7 +138,12 @@ def restore_images(
     ideal_policy: str = "clip",
     overwrite: bool = False,
     strict: bool = False,
+    overwrite_names: Collection[str] = (),
 ) -> dict[str, Any]:
+    """
+    overwrite_names: overwrite=False여도 이미지를 다시 만들 입력 .npy 파일 이름
+    (빌드 캐시가 stale로 판단한 산출물만 갱신할 때 사용).
+    """
     vector_output_dir = vector_output_dir.resolve()
     output_img_dir = output_img_dir.resolve()
 
@@ -177,12 +210,9 @@ def restore_images(
                         )
                     continue
 
-                arr = np.load(npy_path)
-                img_u8 = _convert_array_to_image_u8(arr, kind=sel_kind, ideal_policy=ideal_policy)
-
                 out_name = f"{npy_path.stem}.png"
                 out_path = output_subdir / out_name
-                if out_path.exists() and not overwrite:
+                if out_path.exists() and not overwrite and npy_path.name not in overwrite_names:
                     skipped.append(
                         {
                             "reason": "exists",
@@ -191,22 +221,16 @@ def restore_images(
                     )
                     continue
 
-                img = Image.fromarray(img_u8, mode="L")
-                img.save(out_path)
-
                 converted.append(
-                    {
-                        "input_npy": str(npy_path),
-                        "output_img": str(out_path),
-                        "kind": sel_kind,
-                        "tap": f"{sel_tap}tap",
-                        "ideal_policy": ideal_policy if sel_kind == "ideal" else "n/a",
-                        "height": int(img_u8.shape[0]),
-                        "width": int(img_u8.shape[1]),
-                        "dtype": str(img_u8.dtype),
-                        "pixel_min": int(img_u8.min()),
-                        "pixel_max": int(img_u8.max()),
-                    }
+                    save_restored_image(
+                        Image,
+                        np.load(npy_path),
+                        out_path,
+                        kind=sel_kind,
+                        tap=sel_tap,
+                        ideal_policy=ideal_policy,
+                        input_npy=npy_path,
+                    )
                 )
 
     summary = {
@@ -6,19 +6,35 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any
 
-from fir_1d.sim.vector.gen_3tap_compare_report import generate_3tap_compare_report
-from fir_1d.sim.vector.gen_5tap_compare_report import generate_5tap_compare_report
-from fir_1d.sim.vector.gen_fixed_output import (
-    generate_fixed_3tap_output_vector,
-    generate_fixed_5tap_output_vector,
+from fir_1d.sim.vector import gen_3tap_compare_report, gen_5tap_compare_report
+from fir_1d.sim.vector import gen_fixed_output, gen_fused_output, gen_ideal_output, gen_input_vectors
+from fir_1d.sim.vector import restore_images as restore_mod
+from fir_1d.sim.vector.build_cache import (
+    CACHE_MANIFEST_NAME,
+    BuildCache,
+    artifact_key,
+    code_digest,
+    file_digest,
+    model_modules,
 )
-from fir_1d.sim.vector.gen_ideal_output import (
-    generate_ideal_3tap_output_vector,
-    generate_ideal_5tap_output_vector,
-)
-from fir_1d.sim.vector.gen_input_vectors import generate_input_vector_jsons
+from fir_1d.sim.vector.h_coeff import h_coeff_3tap_map, h_coeff_5tap_map
+from fir_1d.sim.vector.job_pool import DagTask, load_input_u8, log_worker_timing, run_dag, validate_workers
 from fir_1d.sim.vector.restore_images import restore_images
 
+# Per-tap coefficient maps and compare report modules.
+TAP_COEFF_MAPS = {"3": h_coeff_3tap_map, "5": h_coeff_5tap_map}
+TAP_REPORT_MODULES = {"3": gen_3tap_compare_report, "5": gen_5tap_compare_report}
+# Fixed-point settings used by the pipeline (same as generate_fixed_*_output_vector defaults).
+FIXED_BITS = {"frac_bits": 12, "acc_bits": 32, "coeff_bits": 16}
+# Source files whose contents version each artifact kind (part of every artifact key):
+# the generator plus the model modules its compute path imports, so editing an unrelated
+# engine (hw, sweep, stream, ...) does not invalidate vectors.
+VECTOR_CODE = {
+    "ideal": (*model_modules("fir_1d_ref", "fir_1d_fft"), gen_ideal_output.THIS_FILE),
+    "fixed": (*model_modules("fir_1d_fixed_ref"), gen_fixed_output.THIS_FILE),
+}
+VECTOR_DTYPE_TAGS = {"ideal": "f64", "fixed": "u8"}
+
 
 # Resolve selected taps from CLI value.
 def _selected_taps(tap: str) -> list[str]:
@@ -30,7 +46,86 @@ def _log_stage(message: str) -> None:
     print(f"[pipeline] {message}")
 
 
-# Execute the full FIR 1D workflow in a deterministic order.
+# Output vector path for one (kind, tap, case, coeff), as written by the generators.
+def _vector_path(vector_output_dir: Path, kind: str, tap: str, case_stem: str, coeff_name: str) -> Path:
+    name = f"{case_stem}__{coeff_name}_{kind}_{tap}tap_y_{VECTOR_DTYPE_TAGS[kind]}.npy"
+    return vector_output_dir / f"{kind}_{tap}tap" / name
+
+
+# Build cache artifact id of an output vector (e.g. "ideal_3tap:<file name>").
+def _vector_id(path: Path) -> str:
+    return f"{path.parent.name}:{path.name}"
+
+
+# Local DAG task: write the input manifest from per-case results (image order).
+def _input_manifest_task(
+    dep_results: dict[str, Any],
+    image_dir: Path,
+    input_dir: Path,
+    *,
+    overwrite: bool,
+) -> dict:
+    return gen_input_vectors._write_input_manifest(
+        image_dir, input_dir, list(dep_results.values()), overwrite=overwrite
+    )
+
+
+# Local DAG task: write one tap report from fresh and cached pair metrics.
+def _report_task(
+    dep_results: dict[str, Any],
+    tap: str,
+    pair_keys: dict[str, tuple[str, str]],
+    cached_pairs: dict[tuple[str, str], tuple],
+    vector_output_dir: Path,
+    *,
+    top_k: int,
+    strict: bool,
+) -> dict[str, Any]:
+    pair_results = dict(cached_pairs)
+    pair_results.update({key: dep_results[name] for name, key in pair_keys.items()})
+    generate_report = getattr(TAP_REPORT_MODULES[tap], f"generate_{tap}tap_compare_report")
+    return generate_report(
+        ideal_dir=vector_output_dir / f"ideal_{tap}tap",
+        fixed_dir=vector_output_dir / f"fixed_{tap}tap",
+        report_dir=vector_output_dir / f"report_{tap}tap",
+        top_k=top_k,
+        strict=strict,
+        pair_results=pair_results,
+    )
+
+
+# Output job arguments after (input path, output path), as built by the generators'
+# job builders with the pipeline settings (engine "numpy", FIXED_BITS, no row stats).
+def _output_params(kind: str, h: list[float]) -> list:
+    if kind == "ideal":
+        return [h, "numpy"]
+    return [h, FIXED_BITS["frac_bits"], FIXED_BITS["acc_bits"], FIXED_BITS["coeff_bits"], False]
+
+
+# Local DAG task (fused mode): write one tap report from fused job and cached pair metrics.
+def _fused_report_task(
+    dep_results: dict[str, Any],
+    tap: str,
+    pair_keys: dict[str, tuple[str, str]],
+    cached_pairs: dict[tuple[str, str], tuple],
+    vector_output_dir: Path,
+    *,
+    top_k: int,
+    strict: bool,
+) -> dict[str, Any]:
+    pair_results = dict(cached_pairs)
+    pair_results.update({key: dep_results[name]["pair"] for name, key in pair_keys.items()})
+    return TAP_REPORT_MODULES[tap].write_compare_report_from_pairs(
+        pair_results,
+        ideal_dir=vector_output_dir / f"ideal_{tap}tap",
+        fixed_dir=vector_output_dir / f"fixed_{tap}tap",
+        report_dir=vector_output_dir / f"report_{tap}tap",
+        top_k=top_k,
+        strict=strict,
+    )
+
+
+# Build the per-case dependency graph and run it without stage barriers.
 def run_pipeline(
     *,
     tap: str,
@@ -46,55 +141,345 @@ def run_pipeline(
     strict_report: bool,
     strict_restore: bool,
     top_k: int,
+    workers: int = 1,
+    fused: bool = False,
+    keep_vectors: bool = False,
+    image_dir: Path = gen_input_vectors.DEFAULT_IMAGE_DIR,
+    input_dir: Path = gen_input_vectors.DEFAULT_OUTPUT_DIR,
+    vector_output_dir: Path = gen_ideal_output.DEFAULT_OUTPUT_DIR,
+    output_img_dir: Path = restore_mod.DEFAULT_OUTPUT_IMG_DIR,
 ) -> dict[str, Any]:
+    """
+    Task graph (one node per unit of work, each starts as soon as its inputs exist):
+    - input:<case>                 image -> input vector (.npy + preview JSON)
+    - input_manifest               (local) after all input:<case>
+    - ideal|fixed:<tap>:<output>   one (case, coeff) output, after its input:<case>
+    - compare:<tap>:<key>          ideal/fixed pair metrics, after both producers
+    - report:<tap>                 (local) CSV/JSON report, after all compare/producers of the tap
+    - restore:<kind>:<tap>         restored images, after all producers of (kind, tap)
+
+    Tasks are prioritized case by case, so with workers >= 2 case 1 can be compared while
+    case 2 is still being filtered. With workers >= 2 each case's input vector is read once
+    by the parent after input:<case> finishes and published in shared memory for its
+    ideal/fixed (or fused) tasks; it is released when the case's last such task ends. Skipped stages contribute no tasks; their files on disk
+    are used as-is. The returned summary dict keeps the stage-barrier pipeline's keys.
+
+    Every artifact (input vector, output vector, pair metrics, restored PNG) is keyed by a
+    hash of its inputs: source image bytes, upstream artifact keys, coefficients, fixed-point
+    bits/engine and the source code that produces it. Artifacts whose key and files are
+    unchanged since the last run are reused; only invalidated ones are rebuilt. The build
+    cache manifest (<vector_output_dir>/build_cache_manifest.json) lists what was reused
+    and rebuilt. --overwrite-vectors / --overwrite-images force a rebuild.
+
+    fused=True replaces the ideal/fixed/compare/restore tasks with one fused:<tap>:<key>
+    task per (case, coeff): ideal and fixed are computed in memory and passed straight to
+    the metrics and the PNG encoder. Output vectors are written only with keep_vectors=True.
+    Reports are built from the in-memory pair rows and match the staged reports.
+    ideal_counts / fixed_counts then count the (case, coeff) pairs computed.
+    """
+    validate_workers(workers)
+    if fused and (skip_ideal or skip_fixed):
+        raise ValueError("--fused computes ideal and fixed together; it cannot be combined with --skip-ideal/--skip-fixed.")
+    if keep_vectors and not fused:
+        raise ValueError("--keep-vectors is only used with --fused (the staged pipeline always keeps vectors).")
     selected_taps = _selected_taps(tap)
-    results: dict[str, Any] = {"selected_taps": selected_taps}
+    image_dir = image_dir.resolve()
+    input_dir = input_dir.resolve()
+    vector_output_dir = vector_output_dir.resolve()
+    output_img_dir = output_img_dir.resolve()
+    cache = BuildCache(vector_output_dir / CACHE_MANIFEST_NAME)
 
+    # Input vectors of this run: data file -> (image index, image path, rebuild).
+    input_plan: dict[Path, tuple[int, Path, bool]] = {}
+    input_keys: dict[Path, str] = {}
     if not skip_input:
-        _log_stage("Generate input vectors")
-        results["input_manifest"] = generate_input_vector_jsons(overwrite=overwrite_vectors)
-
-    if not skip_ideal:
-        _log_stage("Generate ideal outputs")
-        ideal_counts: dict[str, int] = {}
-        if "3" in selected_taps:
-            ideal_counts["ideal_3tap"] = generate_ideal_3tap_output_vector(overwrite=overwrite_vectors)
-        if "5" in selected_taps:
-            ideal_counts["ideal_5tap"] = generate_ideal_5tap_output_vector(overwrite=overwrite_vectors)
-        results["ideal_counts"] = ideal_counts
-
-    if not skip_fixed:
-        _log_stage("Generate fixed outputs")
-        fixed_counts: dict[str, int] = {}
-        if "3" in selected_taps:
-            fixed_counts["fixed_3tap"] = generate_fixed_3tap_output_vector(overwrite=overwrite_vectors)
-        if "5" in selected_taps:
-            fixed_counts["fixed_5tap"] = generate_fixed_5tap_output_vector(overwrite=overwrite_vectors)
-        results["fixed_counts"] = fixed_counts
+        input_code = code_digest(gen_input_vectors.THIS_FILE)
+        for idx, image_path in enumerate(gen_input_vectors._list_source_images(image_dir)):
+            data_file = gen_input_vectors._case_data_file(input_dir, idx, image_path)
+            key = artifact_key("input", source=file_digest(image_path), code=input_code)
+            rebuild = cache.plan(f"input:{data_file.name}", key, force=overwrite_vectors)
+            input_plan[data_file] = (idx, image_path, rebuild)
+            input_keys[data_file] = key
 
-    if not skip_report:
-        _log_stage("Generate compare reports")
-        report_results: dict[str, dict[str, Any]] = {}
-        if "3" in selected_taps:
-            report_results["report_3tap"] = generate_3tap_compare_report(top_k=top_k, strict=strict_report)
-        if "5" in selected_taps:
-            report_results["report_5tap"] = generate_5tap_compare_report(top_k=top_k, strict=strict_report)
-        results["report_results"] = report_results
+    # Case set = existing input vectors + vectors produced by this run.
+    input_files = sorted(
+        set(gen_ideal_output._iter_input_npy_files(input_dir)) | set(input_plan),
+        key=lambda p: p.name.lower(),
+    )
+    if (not skip_ideal or not skip_fixed) and not input_files:
+        raise FileNotFoundError(f"No input .npy files found in {input_dir}")
+    for in_path in input_files:
+        if in_path not in input_keys:
+            input_keys[in_path] = cache.existing_key(f"input:{in_path.name}", in_path)
 
-    if not skip_restore:
-        _log_stage("Restore output images")
-        restore_summary = restore_images(
-            kind=restore_kind,
-            tap=tap,
-            ideal_policy=ideal_policy,
-            overwrite=overwrite_images,
-            strict=strict_restore,
+    # Output jobs per (kind, tap): every (case, coeff) candidate is keyed, stale ones are rebuilt.
+    kinds = [k for k, skip in (("ideal", skip_ideal), ("fixed", skip_fixed)) if not skip]
+    jobs: dict[tuple[str, str], list[tuple]] = {}
+    vector_keys: dict[Path, str] = {}
+    if fused:
+        # Keys only: fused jobs compute vectors in memory, files exist only with keep_vectors.
+        for t in selected_taps:
+            for in_path in input_files:
+                case_stem = gen_ideal_output._case_stem_from_input(in_path)
+                for coeff_name, h in TAP_COEFF_MAPS[t].items():
+                    for kind in kinds:
+                        vector_keys[_vector_path(vector_output_dir, kind, t, case_stem, coeff_name)] = artifact_key(
+                            kind,
+                            input=input_keys[in_path],
+                            params=_output_params(kind, h),
+                            code=code_digest(*VECTOR_CODE[kind]),
+                        )
+    else:
+        for t in selected_taps:
+            for kind in kinds:
+                out_dir = vector_output_dir / f"{kind}_{t}tap"
+                if kind == "ideal":
+                    candidates = gen_ideal_output._ideal_output_jobs(
+                        input_files, out_dir, TAP_COEFF_MAPS[t], f"{t}tap", overwrite=True
+                    )
+                else:
+                    candidates = gen_fixed_output._fixed_output_jobs(
+                        input_files, out_dir, TAP_COEFF_MAPS[t], f"{t}tap", overwrite=True, **FIXED_BITS
+                    )
+                code = code_digest(*VECTOR_CODE[kind])
+                jobs[(kind, t)] = []
+                for job in candidates:
+                    key = artifact_key(kind, input=input_keys[job[0]], params=list(job[2:]), code=code)
+                    vector_keys[job[1]] = key
+                    if cache.plan(_vector_id(job[1]), key, force=overwrite_vectors):
+                        jobs[(kind, t)].append(job)
+    # output path -> producing task name
+    producers = {job[1]: f"{kind}:{t}:{job[1].name}" for (kind, t), kind_jobs in jobs.items() for job in kind_jobs}
+
+    # Key of a vector this run does not plan (skipped stage): recorded key or content hash.
+    def _known_vector_key(path: Path) -> str | None:
+        if path not in vector_keys and path.exists():
+            vector_keys[path] = cache.existing_key(_vector_id(path), path)
+        return vector_keys.get(path)
+
+    restore_kinds = [] if skip_restore else restore_mod._selected_values(restore_kind, restore_mod.VALID_KINDS)
+    png_code = code_digest(restore_mod.THIS_FILE)
+    png_plan: dict[Path, tuple[str, str]] = {}  # png path -> (artifact id, key), rebuilt only
+    num_png_reused = 0
+
+    # Plan the PNG of one vector; True if it has to be (re)written.
+    def _plan_png(kind: str, t: str, vec_path: Path, vec_key: str) -> tuple[bool, Path]:
+        subdir = restore_mod._subdir_name(kind, t, ideal_policy=ideal_policy)
+        png_path = output_img_dir / subdir / f"{vec_path.stem}.png"
+        policy = ideal_policy if kind == "ideal" else None
+        png_key = artifact_key("png", vector=vec_key, policy=policy, code=png_code)
+        png_id = f"png:{subdir}/{png_path.name}"
+        if cache.plan(png_id, png_key, force=overwrite_images):
+            png_plan[png_path] = (png_id, png_key)
+            return True, png_path
+        return False, png_path
+
+    # Insert tasks case by case: run_dag prefers earlier-inserted ready tasks.
+    job_fns = {"ideal": gen_ideal_output._ideal_output_job, "fixed": gen_fixed_output._fixed_output_job}
+    tasks: dict[str, DagTask] = {}
+    input_task_names: list[tuple[int, str]] = []
+    pair_keys: dict[str, dict[str, tuple[str, str]]] = {t: {} for t in selected_taps}
+    cached_pairs: dict[str, dict[tuple[str, str], tuple]] = {t: {} for t in selected_taps}
+    compare_records: dict[str, tuple[str, str]] = {}  # task name -> (artifact id, key)
+    fused_saves: dict[str, list[Path]] = {}  # fused task name -> vectors it writes
+    fused_counts = {t: 0 for t in selected_taps}
+    for in_path in input_files:
+        in_deps: tuple[str, ...] = ()
+        if in_path in input_plan:
+            idx, image_path, rebuild = input_plan[in_path]
+            name = f"input:{in_path.name}"
+            tasks[name] = DagTask(
+                gen_input_vectors._generate_input_case,
+                (idx, image_path, input_dir),
+                {"overwrite": rebuild},
+            )
+            input_task_names.append((idx, name))
+            in_deps = (name,)
+
+        for (kind, t), kind_jobs in jobs.items():
+            for job in kind_jobs:
+                if job[0] == in_path:
+                    tasks[producers[job[1]]] = DagTask(job_fns[kind], job, deps=in_deps, shared_input=True)
+
+        if skip_report and not fused:
+            continue
+        case_stem = gen_ideal_output._case_stem_from_input(in_path)
+        for t in selected_taps:
+            compare_code = code_digest(TAP_REPORT_MODULES[t].THIS_FILE)
+            for coeff_name, h in TAP_COEFF_MAPS[t].items():
+                key = (case_stem, coeff_name)
+                ideal_path = _vector_path(vector_output_dir, "ideal", t, case_stem, coeff_name)
+                fixed_path = _vector_path(vector_output_dir, "fixed", t, case_stem, coeff_name)
+                ideal_key, fixed_key = _known_vector_key(ideal_path), _known_vector_key(fixed_path)
+                pair_id = f"compare_{t}tap:{case_stem}__{coeff_name}"
+                name = f"{'fused' if fused else 'compare'}:{t}:{case_stem}__{coeff_name}"
+
+                compare = False
+                if not skip_report and ideal_key is not None and fixed_key is not None:
+                    pair_key = artifact_key("compare", ideal=ideal_key, fixed=fixed_key, code=compare_code)
+                    if cache.plan(pair_id, pair_key, force=overwrite_vectors):
+                        compare = True
+                        pair_keys[t][name] = key
+                        compare_records[name] = (pair_id, pair_key)
+                    else:
+                        cached_pairs[t][key] = tuple(cache.entries[pair_id]["result"])
+
+                if not fused:
+                    if compare:
+                        tasks[name] = DagTask(
+                            TAP_REPORT_MODULES[t].compare_output_pair,
+                            (key, ideal_path, fixed_path),
+                            deps=[producers[p] for p in (ideal_path, fixed_path) if p in producers],
+                        )
+                    continue
+
+                saves = []
+                if keep_vectors:
+                    saves = [
+                        p
+                        for p in (ideal_path, fixed_path)
+                        if cache.plan(_vector_id(p), vector_keys[p], force=overwrite_vectors)
+                    ]
+                images = []
+                for kind in restore_kinds:
+                    vec_path = ideal_path if kind == "ideal" else fixed_path
+                    rebuild_png, png_path = _plan_png(kind, t, vec_path, vector_keys[vec_path])
+                    if rebuild_png:
+                        images.append((kind, png_path))
+                    else:
+                        num_png_reused += 1
+                if not (compare or saves or images):
+                    continue
+                tasks[name] = DagTask(
+                    gen_fused_output._fused_output_job,
+                    (
+                        in_path,
+                        t,
+                        key,
+                        h,
+                        (FIXED_BITS["frac_bits"], FIXED_BITS["acc_bits"], FIXED_BITS["coeff_bits"]),
+                        ideal_path,
+                        fixed_path,
+                    ),
+                    {
+                        "save_ideal": ideal_path in saves,
+                        "save_fixed": fixed_path in saves,
+                        "compare": compare,
+                        "images": images,
+                        "ideal_policy": ideal_policy,
+                    },
+                    deps=in_deps,
+                    shared_input=True,
+                )
+                fused_saves[name] = saves
+                fused_counts[t] += 1
+
+    if input_task_names:
+        tasks["input_manifest"] = DagTask(
+            _input_manifest_task,
+            (image_dir, input_dir),
+            {"overwrite": overwrite_vectors},
+            deps=[name for _, name in sorted(input_task_names)],
+            local=True,
         )
-        results["restore_summary"] = {
-            "num_converted": restore_summary["num_converted"],
-            "num_skipped": restore_summary["num_skipped"],
-        }
 
+    if not skip_report:
+        for t in selected_taps:
+            if fused:
+                report_fn, deps = _fused_report_task, list(pair_keys[t])
+            else:
+                tap_producers = [producers[job[1]] for kind in kinds for job in jobs[(kind, t)]]
+                report_fn, deps = _report_task, list(pair_keys[t]) + tap_producers
+            tasks[f"report:{t}"] = DagTask(
+                report_fn,
+                (t, pair_keys[t], cached_pairs[t], vector_output_dir),
+                {"top_k": top_k, "strict": strict_report},
+                deps=deps,
+                local=True,
+            )
+
+    restore_keys: list[str] = []
+    if not fused:
+        for kind in restore_kinds:
+            for t in selected_taps:
+                stale_names: list[str] = []
+                for in_path in input_files:
+                    case_stem = gen_ideal_output._case_stem_from_input(in_path)
+                    for coeff_name in TAP_COEFF_MAPS[t]:
+                        vec_path = _vector_path(vector_output_dir, kind, t, case_stem, coeff_name)
+                        vec_key = _known_vector_key(vec_path)
+                        if vec_key is not None and _plan_png(kind, t, vec_path, vec_key)[0]:
+                            stale_names.append(vec_path.name)
+                name = f"restore:{kind}:{t}"
+                tasks[name] = DagTask(
+                    restore_images,
+                    kwargs={
+                        "vector_output_dir": vector_output_dir,
+                        "output_img_dir": output_img_dir,
+                        "kind": kind,
+                        "tap": t,
+                        "ideal_policy": ideal_policy,
+                        "overwrite": overwrite_images,
+                        "strict": strict_restore,
+                        "overwrite_names": stale_names,
+                    },
+                    deps=[producers[job[1]] for job in jobs.get((kind, t), [])],
+                )
+                restore_keys.append(name)
+
+    # Persist invalidations first: a failed run leaves rebuilt artifacts unrecorded (stale).
+    cache.save()
+    _log_stage(f"Run task graph: tasks={len(tasks)} workers={workers}" + (" fused" if fused else ""))
+    task_results, worker_timing = run_dag(tasks, workers=workers, load=load_input_u8)
+    if workers > 1:
+        log_worker_timing("pipeline", worker_timing)
+
+    converted: list[dict[str, Any]] = []
+    for name in restore_keys:
+        converted.extend(task_results[name]["converted"])
+    for name in fused_saves:
+        converted.extend(task_results[name]["converted"])
+
+    for data_file, (_, _, rebuild) in input_plan.items():
+        if rebuild:
+            preview_file = gen_input_vectors._case_preview_file(data_file)
+            cache.record(f"input:{data_file.name}", input_keys[data_file], [data_file, preview_file])
+    saved_vectors = [job[1] for kind_jobs in jobs.values() for job in kind_jobs]
+    saved_vectors += [path for saves in fused_saves.values() for path in saves]
+    for path in saved_vectors:
+        cache.record(_vector_id(path), vector_keys[path], [path])
+    for name, (pair_id, pair_key) in compare_records.items():
+        result = task_results[name]["pair"] if fused else task_results[name]
+        cache.record(pair_id, pair_key, result=list(result))
+    for entry in converted:
+        png_path = Path(entry["output_img"])
+        if png_path in png_plan:
+            cache.record(*png_plan[png_path], [png_path])
+    cache.save()
+    cache_summary = cache.summary()
+    _log_stage(
+        f"Build cache: reused={cache_summary['reused']} rebuilt={cache_summary['rebuilt']} "
+        f"manifest={cache.path}"
+    )
+
+    results: dict[str, Any] = {"selected_taps": selected_taps}
+    if not skip_input:
+        results["input_manifest"] = task_results["input_manifest"]
+    for kind, skip in (("ideal", skip_ideal), ("fixed", skip_fixed)):
+        if skip:
+            continue
+        if fused:
+            results[f"{kind}_counts"] = {f"{kind}_{t}tap": fused_counts[t] for t in selected_taps}
+        else:
+            results[f"{kind}_counts"] = {f"{kind}_{t}tap": len(jobs[(kind, t)]) for t in selected_taps}
+    if not skip_report:
+        results["report_results"] = {f"report_{t}tap": task_results[f"report:{t}"] for t in selected_taps}
+    if not skip_restore:
+        if fused:
+            num_skipped = num_png_reused
+        else:
+            num_skipped = sum(task_results[name]["num_skipped"] for name in restore_keys)
+        results["restore_summary"] = {"num_converted": len(converted), "num_skipped": num_skipped}
     return results
 
 
@@ -112,7 +497,7 @@ def _build_argparser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--overwrite-vectors",
         action="store_true",
-        help="Overwrite existing input/ideal/fixed vectors instead of skipping duplicates.",
+        help="Rebuild all input/ideal/fixed vectors even when the build cache marks them up to date.",
     )
     parser.add_argument(
         "--skip-input",
@@ -154,7 +539,7 @@ def _build_argparser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--overwrite-images",
         action="store_true",
-        help="Overwrite existing restored images.",
+        help="Rebuild all restored images even when the build cache marks them up to date.",
     )
     parser.add_argument(
         "--strict-report",
@@ -172,21 +557,43 @@ def _build_argparser() -> argparse.ArgumentParser:
         default=5,
         help="Top-k worst cases saved in compare reports (default: 5).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for pipeline tasks (input/output/compare/restore; default: 1, serial).",
+    )
+    parser.add_argument(
+        "--fused",
+        action="store_true",
+        help="Compute ideal/fixed/compare/restore per (case, coeff) in one pass without intermediate .npy files.",
+    )
+    parser.add_argument(
+        "--keep-vectors",
+        action="store_true",
+        help="With --fused, also write ideal/fixed output .npy files.",
+    )
     return parser
 
 
 # Run the FIR 1D pipeline from CLI with stage-level controls.
 def main() -> None:
     """
-    Execute the FIR 1D pipeline in this order:
+    Execute the FIR 1D pipeline as a per-case task graph:
     1) input vector generation
     2) ideal output generation (3tap/5tap)
     3) fixed output generation (3tap/5tap)
     4) ideal-vs-fixed compare report generation (CSV/JSON)
     5) restored image generation from output vectors
+    Each task starts once its own inputs exist (e.g. a case is compared as soon as its
+    ideal/fixed pair is written), so stages overlap when --workers > 1.
+    With --fused, steps 2-5 run as one in-memory task per (case, coeff); output
+    vectors are written only with --keep-vectors.
 
     Use --skip-* options to disable specific stages, --tap to limit to 3tap/5tap,
     and --overwrite-vectors to force regeneration of existing vector files.
+    Without --overwrite-*, only artifacts whose inputs changed since the last run
+    (build cache manifest) are rebuilt.
     """
     args = _build_argparser().parse_args()
 
@@ -219,6 +626,9 @@ def main() -> None:
             strict_report=args.strict_report,
             strict_restore=args.strict_restore,
             top_k=args.top_k,
+            workers=args.workers,
+            fused=args.fused,
+            keep_vectors=args.keep_vectors,
         )
 
         _elapsed = perf_counter() - _t0
@@ -259,9 +669,9 @@ def main() -> None:
 # --tap {all,3,5}
 #    Select tap group to run.
 # --overwrite-vectors
-#    Overwrite existing input/ideal/fixed vector outputs.
+#    Rebuild all input/ideal/fixed vector outputs (default: rebuild only stale ones).
 # --overwrite-images
-#    Overwrite existing restored image outputs.
+#    Rebuild all restored image outputs (default: rebuild only stale ones).
 # --skip-input / --skip-ideal / --skip-fixed / --skip-report / --skip-restore
 #    Skip specific pipeline stages.
 # --restore-kind {all,ideal,fixed}
@@ -272,6 +682,11 @@ def main() -> None:
 #    Enable strict validation behavior.
 # --top-k <int>
 #    Number of worst cases stored in compare report summaries.
+# --workers <int>
+#    Worker processes for the pipeline task graph (1 = serial).
+# --fused [--keep-vectors]
+#    Single pass per (case, coeff): ideal/fixed stay in memory and feed the compare
+#    report and restored images directly; .npy outputs only with --keep-vectors.
 
 if __name__ == "__main__":
     main()